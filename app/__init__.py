@@ -11,7 +11,7 @@ __email__ = "per.nehlin@ip-solutions.se"
 __description__ = "En FastAPI-baserad webbapplikation för att hantera Nexus Repository Manager"
 
 from .main import app, run_server
-from .models import RepositoryInfo, PackageInfo, HealthResponse
+from .api.v1.models import RepositoryInfo, PackageInfo, HealthResponse
 
 __all__ = [
     "app",
@@ -0,0 +1,73 @@
+"""
+Admin endpoints - profilering och diagnostik av den körande workern
+"""
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from ...core.loop_monitor import loop_monitor
+from ...core.profiler import Profiler, ProfilerBusyError, StackSampler, get_profiler
+from ...core.timing import TimedRoute
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Kräv rätt X-Admin-Token - utan konfigurerad ADMIN_TOKEN är admin-endpoints stängda"""
+    expected = os.getenv("ADMIN_TOKEN", "")
+    if not expected or not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise HTTPException(status_code=403, detail="Ogiltig admin-token")
+
+
+# Skapa router för admin endpoints
+router = APIRouter(
+    prefix="/api/admin",
+    route_class=TimedRoute,
+    tags=["överigt"],
+    dependencies=[Depends(require_admin_token)],
+    responses={403: {"description": "Ogiltig admin-token"}},
+)
+
+
+def _collapsed_response(sampler: StackSampler) -> PlainTextResponse:
+    return PlainTextResponse(sampler.collapsed(), headers={"X-Profile-Samples": str(sampler.samples)})
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_worker(seconds: float = Query(5.0, gt=0, le=60),
+                         interval: float = Query(0.005, ge=0.001, le=1.0),
+                         profiler: Profiler = Depends(get_profiler)):
+    """Sampla workern i N sekunder och returnera stackar i collapsed-format"""
+    try:
+        sampler = await profiler.profile_for(seconds, interval)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _collapsed_response(sampler)
+
+
+@router.post("/profile/requests", response_class=PlainTextResponse)
+async def profile_requests(path: str = Query(..., min_length=1),
+                           count: int = Query(10, gt=0, le=1000),
+                           timeout: float = Query(60.0, gt=0, le=600),
+                           interval: float = Query(0.002, ge=0.001, le=1.0),
+                           profiler: Profiler = Depends(get_profiler)):
+    """Profilera de K nästa requests vars sökväg börjar med path (returnerar vid timeout med det som hunnits)"""
+    try:
+        sampler = await profiler.profile_requests(path, count, timeout, interval)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _collapsed_response(sampler)
+
+
+@router.get("/profile")
+async def get_profiler_status(profiler: Profiler = Depends(get_profiler)):
+    """Hämta profilerarens status"""
+    return profiler.stats()
+
+
+@router.get("/loop")
+async def get_loop_status():
+    """Hämta event loopens fördröjning och de senaste blockeringarna vakthunden sett"""
+    return {**loop_monitor.stats(), "reports": list(loop_monitor.reports)}
@@ -0,0 +1,126 @@
+"""
+Background job endpoints
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict, List, Optional
+from .models import (
+    CreateRepositoryJobParams, JobInfo, JobRequest, RepositoryInfo, RepositoryJobParams, PackageInfo,
+    repositories, packages,
+)
+from ...core.jobs import Job, JobContext, JobManager, get_job_manager, job_manager
+from ...core.nexus_client import NEXUS_FORMATS, get_nexus_client
+from ...core.timing import TimedRoute
+
+# Skapa router för job endpoints
+router = APIRouter(
+    prefix="/api/jobs",
+    route_class=TimedRoute,
+    tags=["jobs"],
+    responses={404: {"description": "Jobb inte hittat"}},
+)
+
+
+def _job_info(job: Job) -> JobInfo:
+    return JobInfo(**job.to_dict())
+
+
+def validate_create_repository(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Kontrollera create_repository-parametrar vid submit (pydantics ValidationError är ett ValueError)"""
+    checked = CreateRepositoryJobParams(**params)
+    if checked.format not in NEXUS_FORMATS:
+        raise ValueError(f"Format {checked.format} stöds inte (tillgängliga: {', '.join(sorted(NEXUS_FORMATS))})")
+    if any(repo.name == checked.name for repo in repositories):
+        raise ValueError(f"Repository {checked.name} finns redan")
+    return checked.model_dump(exclude_none=True)
+
+
+def validate_repository_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    return RepositoryJobParams(**params).model_dump()
+
+
+@job_manager.register("create_repository", validate=validate_create_repository)
+async def create_repository_job(context: JobContext):
+    """Skapa ett hosted-repository i Nexus och registrera det i API:t"""
+    name = context.params["name"]
+    repository_format = context.params["format"]
+    if any(repo.name == name for repo in repositories):
+        raise ValueError(f"Repository {name} finns redan")
+
+    nexus = get_nexus_client()
+    context.set_progress(0.1, "Skapar repository i Nexus")
+    await nexus.create_hosted_repository(name, repository_format, context.params.get("attributes"))
+    repository = RepositoryInfo(
+        name=name,
+        type="hosted",
+        format=repository_format,
+        url=f"{nexus.base_url}/repository/{name}/",
+        status="active",
+    )
+    repositories.append(repository)
+    return repository.model_dump()
+
+
+@job_manager.register("rebuild_index", validate=validate_repository_params)
+async def rebuild_index_job(context: JobContext):
+    """Bygg om sökindexet för ett repository i Nexus"""
+    name = context.params["repository"]
+    context.set_progress(0.1, f"Bygger om index för {name}")
+    await get_nexus_client().rebuild_index(name)
+    return {"repository": name}
+
+
+@job_manager.register("sync_repository", validate=validate_repository_params)
+async def sync_repository_job(context: JobContext):
+    """Synka paketlistan för ett repository från Nexus komponenter"""
+    name = context.params["repository"]
+    synced = []
+    pages = 0
+    async for page in get_nexus_client().iter_components(name):
+        for component in page:
+            synced.append(PackageInfo(
+                name=component.get("name", ""),
+                version=component.get("version") or "",
+                repository=name,
+            ))
+        # Nexus anger inte totalt antal sidor - progress närmar sig 1 för varje sida
+        pages += 1
+        context.set_progress(pages / (pages + 1), f"{len(synced)} komponenter hämtade")
+
+    # Ersätt repositoryts paket i ett svep när allt hämtats
+    packages[:] = [pkg for pkg in packages if pkg.repository != name] + synced
+    return {"repository": name, "packages": len(synced)}
+
+
+@router.post("/", response_model=JobInfo, status_code=202)
+async def submit_job(request: JobRequest, manager: JobManager = Depends(get_job_manager)):
+    """Starta ett bakgrundsjobb - svarar direkt med jobbets id"""
+    try:
+        return _job_info(manager.submit(request.kind, request.params, request.priority))
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Okänd jobbtyp: {request.kind} (tillgängliga: {', '.join(sorted(manager.handlers))})",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Ogiltiga parametrar för {request.kind}: {e}")
+
+
+@router.get("/", response_model=List[JobInfo])
+async def get_jobs(status: Optional[str] = None, manager: JobManager = Depends(get_job_manager)):
+    """Hämta alla jobb, valfritt filtrerade på status"""
+    return [_job_info(job) for job in manager.list(status)]
+
+
+@router.get("/stats")
+async def get_job_stats(manager: JobManager = Depends(get_job_manager)):
+    """Hämta antal jobb per status och köns längd"""
+    return manager.stats()
+
+
+@router.get("/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str, manager: JobManager = Depends(get_job_manager)):
+    """Hämta status och progress för ett jobb"""
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Jobb inte hittat")
+    return _job_info(job)
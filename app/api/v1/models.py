@@ -2,7 +2,7 @@
 Pydantic models för API v1
 """
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -23,6 +23,49 @@ class PackageInfo(BaseModel):
     upload_date: Optional[datetime] = None
 
 
+class ArtifactUploadResponse(BaseModel):
+    """Response för strömmad artefakt-upload"""
+    package: PackageInfo
+    filename: str
+    size: int
+    checksums: Dict[str, str]
+
+
+class JobRequest(BaseModel):
+    """Request för att starta ett bakgrundsjobb"""
+    kind: str
+    params: Dict[str, Any] = {}
+    priority: int = 0
+
+
+class CreateRepositoryJobParams(BaseModel):
+    """Parametrar för jobbet create_repository"""
+    name: str
+    format: str
+    attributes: Optional[Dict[str, Any]] = None
+
+
+class RepositoryJobParams(BaseModel):
+    """Parametrar för jobb som arbetar på ett befintligt repository"""
+    repository: str
+
+
+class JobInfo(BaseModel):
+    """Status för ett bakgrundsjobb"""
+    id: str
+    kind: str
+    params: Dict[str, Any] = {}
+    priority: int = 0
+    status: str
+    progress: float = 0.0
+    message: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
 class HealthResponse(BaseModel):
     """Model för health check response"""
     status: str
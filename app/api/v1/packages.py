@@ -1,19 +1,51 @@
 """
 Package management endpoints
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import List, Optional, Tuple
 from datetime import datetime
-from .models import PackageInfo, packages, repositories
+from .models import ArtifactUploadResponse, PackageInfo, packages, repositories
+from ...core.blob_cache import BlobCache, BlobResponse, get_blob_cache
+from ...core.nexus_client import (
+    NexusClient, NexusError, NexusUnavailableError, UPLOAD_FORMATS, asset_path, get_nexus_client,
+    service_unavailable,
+)
+from ...core.streaming import ChecksumMismatchError, ChecksumStream
+from ...core.timing import TimedRoute, phase
 
 # Skapa router för package endpoints
 router = APIRouter(
     prefix="/api/packages",
+    route_class=TimedRoute,
     tags=["packages"],
     responses={404: {"description": "Paket inte hittat"}},
 )
 
 
+def _parse_artifact_filename(filename: str, repository_format: str) -> Optional[Tuple[str, str]]:
+    """Tolka namn och version ur ett artefakt-filnamn"""
+    if repository_format == "pypi":
+        if filename.endswith(".whl"):
+            parts = filename[:-len(".whl")].split("-")
+            if len(parts) >= 5:
+                return parts[0], parts[1]
+        for extension in (".tar.gz", ".zip"):
+            if filename.endswith(extension):
+                name, _, version = filename[:-len(extension)].rpartition("-")
+                if name and version:
+                    return name, version
+    elif repository_format == "apt" and filename.endswith(".deb"):
+        parts = filename[:-len(".deb")].split("_")
+        if len(parts) == 3:
+            return parts[0], parts[1]
+    elif repository_format == "rpm" and filename.endswith(".rpm"):
+        # namn-version-release.arkitektur.rpm
+        parts = filename[:-len(".rpm")].rpartition(".")[0].rsplit("-", 2)
+        if len(parts) == 3:
+            return parts[0], f"{parts[1]}-{parts[2]}"
+    return None
+
+
 @router.get("/", response_model=List[PackageInfo])
 async def get_packages():
     """Hämta alla paket"""
@@ -24,14 +56,137 @@ async def get_packages():
 async def upload_package(package: PackageInfo):
     """Ladda upp paket"""
     package.upload_date = datetime.now()
-    packages.append(package)
+    with phase("store"):
+        packages.append(package)
     return package
 
 
+@router.post(
+    "/upload/{repository_name}/{filename}",
+    response_model=ArtifactUploadResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+)
+async def upload_artifact(repository_name: str,
+                          filename: str,
+                          request: Request,
+                          nexus: NexusClient = Depends(get_nexus_client)):
+    """Strömma en artefakt (wheel, deb, rpm) till Nexus hosted-repository"""
+    with phase("store"):
+        repository = next((repo for repo in repositories if repo.name == repository_name), None)
+    if repository is None:
+        raise HTTPException(status_code=404, detail="Repository inte hittad")
+    if repository.type != "hosted" or repository.format not in UPLOAD_FORMATS:
+        raise HTTPException(status_code=400, detail="Repository stöder inte artefakt-upload")
+
+    parsed = _parse_artifact_filename(filename, repository.format)
+    if parsed is None:
+        raise HTTPException(status_code=400, detail="Filnamnet matchar inte repository-formatet")
+
+    content_length = request.headers.get("content-length")
+    stream = ChecksumStream(request.stream(), expected_sha256=request.headers.get("x-checksum-sha256"))
+    try:
+        await nexus.upload_component(
+            repository.name,
+            repository.format,
+            filename,
+            stream,
+            content_length=int(content_length) if content_length else None,
+        )
+    except ChecksumMismatchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except NexusUnavailableError as e:
+        raise service_unavailable(e)
+    except NexusError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+    name, version = parsed
+    package = PackageInfo(name=name, version=version, repository=repository.name, upload_date=datetime.now())
+    with phase("store"):
+        packages.append(package)
+    return ArtifactUploadResponse(
+        package=package,
+        filename=filename,
+        size=stream.size,
+        checksums=stream.checksums,
+    )
+
+
+@router.get(
+    "/download/{repository_name}/{path:path}",
+    response_class=BlobResponse,
+    # BlobResponse har ingen status_code-parameter som FastAPI kan läsa standardstatus från
+    status_code=200,
+    responses={200: {"content": {"application/octet-stream": {}}}, 206: {"description": "Delinnehåll"}},
+)
+async def download_artifact(repository_name: str,
+                            path: str,
+                            request: Request,
+                            nexus: NexusClient = Depends(get_nexus_client),
+                            cache: BlobCache = Depends(get_blob_cache)):
+    """Ladda ner en artefakt via den lokala cachen (stöder Range och If-None-Match)"""
+    try:
+        asset_path(repository_name, path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    with phase("store"):
+        known = any(repo.name == repository_name for repo in repositories)
+    if not known:
+        raise HTTPException(status_code=404, detail="Repository inte hittad")
+
+    key = f"{repository_name}/{path}"
+    with phase("store"):
+        blob = cache.lookup(key)
+        file = cache.open(blob) if blob is not None else None
+    if file is None:
+        try:
+            # Samtidiga missar för samma artefakt delar en hämtning från Nexus
+            blob = await nexus.coalesce(
+                ("asset", key),
+                lambda: cache.store(key, nexus.stream_asset(repository_name, path)),
+            )
+        except NexusUnavailableError as e:
+            # Servera en äldre cachad kopia hellre än att vänta på Nexus
+            blob = cache.lookup(key, stale_ok=True)
+            if blob is None:
+                raise service_unavailable(e)
+        except NexusError as e:
+            if e.status_code == 404:
+                raise HTTPException(status_code=404, detail="Artefakt inte hittad")
+            raise HTTPException(status_code=502, detail=str(e))
+        file = cache.open(blob)
+        if file is None:
+            raise HTTPException(status_code=503, detail="Artefakten kunde inte cachas")
+
+    return BlobResponse(
+        blob,
+        file,
+        request.headers,
+        filename=path.rsplit("/", 1)[-1],
+        send_header_only=request.method == "HEAD",
+    )
+
+
+# HEAD delar handler med GET men hålls utanför schemat (annars dubblerat operation-id)
+router.add_api_route(
+    "/download/{repository_name}/{path:path}",
+    download_artifact,
+    methods=["HEAD"],
+    response_class=BlobResponse,
+    status_code=200,
+    include_in_schema=False,
+)
+
+
 @router.get("/{package_name}", response_model=List[PackageInfo])
 async def get_package(package_name: str):
     """Hämta paket efter namn"""
-    found_packages = [pkg for pkg in packages if pkg.name == package_name]
+    with phase("store"):
+        found_packages = [pkg for pkg in packages if pkg.name == package_name]
     if not found_packages:
         raise HTTPException(status_code=404, detail="Paket inte hittat")
     return found_packages
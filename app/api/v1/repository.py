@@ -4,10 +4,12 @@ Repository management endpoints
 from fastapi import APIRouter, HTTPException
 from typing import List
 from .models import RepositoryInfo, repositories, packages
+from ...core.timing import TimedRoute, phase
 
 # Skapa router för repository endpoints
 router = APIRouter(
     prefix="/api/repositories",
+    route_class=TimedRoute,
     tags=["repository"],
     responses={404: {"description": "Repository inte hittad"}},
 )
@@ -22,9 +24,10 @@ async def get_repositories():
 @router.get("/{repository_name}", response_model=RepositoryInfo)
 async def get_repository(repository_name: str):
     """Hämta specifik repository"""
-    for repo in repositories:
-        if repo.name == repository_name:
-            return repo
+    with phase("store"):
+        for repo in repositories:
+            if repo.name == repository_name:
+                return repo
     raise HTTPException(status_code=404, detail="Repository inte hittad")
 
 
@@ -33,9 +36,10 @@ async def get_repository(repository_name: str):
 async def create_repository(repository: RepositoryInfo):
     """Skapa ny repository"""
     # Kontrollera om repository redan finns
-    for repo in repositories:
-        if repo.name == repository.name:
-            raise HTTPException(status_code=400, detail="Repository finns redan")
-    
-    repositories.append(repository)
+    with phase("store"):
+        for repo in repositories:
+            if repo.name == repository.name:
+                raise HTTPException(status_code=400, detail="Repository finns redan")
+
+        repositories.append(repository)
     return repository
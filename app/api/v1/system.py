@@ -1,17 +1,23 @@
 """
 System information and utility endpoints
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException
+from collections import Counter
 from datetime import datetime
 import os
 import sys
 import subprocess
 from importlib.metadata import distribution
 from .models import HealthResponse, PipPackageInfo, repositories, packages
+from ...core.nexus_client import (
+    NexusClient, NexusError, NexusUnavailableError, get_nexus_client, service_unavailable,
+)
+from ...core.timing import TimedRoute, phase
 
 # Skapa router för system endpoints
 router = APIRouter(
     prefix="/api",
+    route_class=TimedRoute,
     tags=["överigt"],
     responses={404: {"description": "Resurs inte hittad"}},
 )
@@ -42,21 +48,25 @@ async def health_check():
 @router.get("/stats")
 async def get_stats():
     """Hämta statistik"""
-    return {
-        "total_repositories": len(repositories),
-        "total_packages": len(packages),
-        "active_repositories": len([repo for repo in repositories if repo.status == "active"]),
-        "packages_by_repository": {
-            repo.name: len([pkg for pkg in packages if pkg.repository == repo.name])
-            for repo in repositories
+    with phase("store"):
+        # En genomgång av paketen i stället för en per repository
+        per_repository = Counter(pkg.repository for pkg in packages)
+        return {
+            "total_repositories": len(repositories),
+            "total_packages": len(packages),
+            "active_repositories": len([repo for repo in repositories if repo.status == "active"]),
+            "packages_by_repository": {
+                repo.name: per_repository.get(repo.name, 0)
+                for repo in repositories
+            }
         }
-    }
 
 
 @router.get("/formats")
 async def get_supported_formats():
     """Hämta stödda format"""
-    formats = list(set(repo.format for repo in repositories))
+    with phase("store"):
+        formats = list(set(repo.format for repo in repositories))
     return {
         "supported_formats": formats,
         "format_info": {
@@ -86,9 +96,26 @@ async def get_config():
     }
 
 
+@router.get("/upstream")
+async def get_upstream_stats(nexus: NexusClient = Depends(get_nexus_client)):
+    """Hämta statistik för anrop mot Nexus"""
+    return nexus.stats()
+
+
+@router.get("/upstream/repositories")
+async def get_upstream_repositories(nexus: NexusClient = Depends(get_nexus_client)):
+    """Hämta repositories direkt från Nexus"""
+    try:
+        return await nexus.list_repositories()
+    except NexusUnavailableError as e:
+        raise service_unavailable(e)
+    except NexusError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
 @router.get("/pip-package", response_model=PipPackageInfo)
-async def get_pip_package_info():
-    """Hämta information om det installerade pip-paketet"""
+def get_pip_package_info():
+    """Hämta information om det installerade pip-paketet (synkron - git-anropen körs i trådpoolen)"""
     try:
         # Hämta paketinformation
         package_name = "nexus-repository-api"
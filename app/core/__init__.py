@@ -0,0 +1 @@
+# Core-infrastruktur (upstream-klient, strömning m.m.)
@@ -0,0 +1,171 @@
+"""
+Strukturerad access-logg i JSON - skrivs i batchar från en bakgrundstråd via en begränsad kö
+"""
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Optional, TextIO, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import registry, route_template
+
+# (tidpunkt, metod, sökväg, route-mall, status, latens, bytes, request-id, klient)
+AccessRecord = Tuple[float, str, str, str, int, float, int, str, str]
+
+
+class AccessLogWriter:
+    """Bakgrundstråd som skriver access-poster i batchar - full kö betyder tappade poster, aldrig väntan"""
+
+    def __init__(self,
+                 stream: Optional[TextIO] = None,
+                 max_queue: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 flush_interval: float = 0.5):
+        self.stream = stream or sys.stdout
+        self.batch_size = batch_size or int(os.getenv("ACCESS_LOG_BATCH_SIZE", "256"))
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[AccessRecord]" = queue.Queue(
+            maxsize=max_queue or int(os.getenv("ACCESS_LOG_QUEUE_SIZE", "10000"))
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="access-log", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stoppa tråden efter att kön tömts"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def log(self, record: AccessRecord) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch) -> None:
+        lines = "".join(json.dumps(_to_dict(record), ensure_ascii=False) + "\n" for record in batch)
+        try:
+            self.stream.write(lines)
+            self.stream.flush()
+        except (OSError, ValueError):
+            self.dropped += len(batch)
+            return
+        self.written += len(batch)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+    def collect(self):
+        return [
+            ("access_log_records_total", "counter", "Access-poster som skrivits eller tappats", [
+                ({"result": "written"}, self.written),
+                ({"result": "dropped"}, self.dropped),
+            ]),
+            ("access_log_queue", "gauge", "Access-poster som väntar på att skrivas", [({}, self._queue.qsize())]),
+        ]
+
+
+def _to_dict(record: AccessRecord) -> Dict[str, object]:
+    timestamp, method, path, route, status, latency, size, request_id, client = record
+    return {
+        "timestamp": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+        "type": "access",
+        "request_id": request_id,
+        "method": method,
+        "path": path,
+        "route": route,
+        "status": status,
+        "latency_ms": round(latency * 1000, 3),
+        "response_bytes": size,
+        "client": client,
+    }
+
+
+class AccessLogMiddleware:
+    """ASGI-middleware som lägger en access-post per request i kön och sätter X-Request-ID"""
+
+    def __init__(self, app: ASGIApp, writer: Optional[AccessLogWriter] = None):
+        self.app = app
+        self.writer = writer or access_log_writer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+        raw_request_id = request_id.encode("latin-1")
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-request-id", raw_request_id)]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.zerocopysend":
+                size += message.get("count") or 0
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            client = scope.get("client")
+            self.writer.log((
+                time.time(),
+                scope["method"],
+                scope["path"],
+                route_template(scope),
+                status_code,
+                time.perf_counter() - start,
+                size,
+                request_id,
+                client[0] if client else "",
+            ))
+
+
+# Delad skrivare för hela appen
+access_log_writer = AccessLogWriter()
+registry.register_collector(access_log_writer.collect)
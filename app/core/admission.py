@@ -0,0 +1,147 @@
+"""
+Admission control - token buckets per klient och globalt, svarar 429 med Retry-After
+"""
+import json
+import math
+import os
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Konsument-id som Kong sätter efter autentisering - klientens egna nyckel-headers går att rotera fritt
+CONSUMER_HEADER = b"x-consumer-id"
+
+_REJECT_BODY = json.dumps({"detail": "För många förfrågningar"}).encode("utf-8")
+
+
+class TokenBucket:
+    """Token bucket med kontinuerlig påfyllning"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Ta en token - returnerar 0 vid lyckat uttag, annars sekunder tills en token finns"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def refund(self) -> None:
+        """Lämna tillbaka en token (när en senare kontroll avvisade requesten)"""
+        self.tokens = min(self.capacity, self.tokens + 1.0)
+
+
+class AdmissionControlMiddleware:
+    """ASGI-middleware som avvisar överskottstrafik tidigt med 429 och Retry-After"""
+
+    # Aktiva instanser, så att metrics kan läsa räknarna utan att hålla kvar middleware-stacken
+    instances: "weakref.WeakSet[AdmissionControlMiddleware]" = weakref.WeakSet()
+
+    def __init__(self,
+                 app: ASGIApp,
+                 client_rate: Optional[float] = None,
+                 client_burst: Optional[float] = None,
+                 global_rate: Optional[float] = None,
+                 global_burst: Optional[float] = None,
+                 exempt_paths: Optional[Iterable[str]] = None,
+                 max_clients: int = 10000):
+        self.app = app
+        self.client_rate = client_rate or float(os.getenv("RATE_LIMIT_CLIENT_RPS", "50"))
+        self.client_burst = client_burst or float(os.getenv("RATE_LIMIT_CLIENT_BURST", "100"))
+        global_rate = global_rate or float(os.getenv("RATE_LIMIT_GLOBAL_RPS", "500"))
+        global_burst = global_burst or float(os.getenv("RATE_LIMIT_GLOBAL_BURST", "1000"))
+        if exempt_paths is None:
+            exempt_paths = os.getenv("RATE_LIMIT_EXEMPT_PATHS", "/health,/api/health,/metrics").split(",")
+        self.exempt_paths = frozenset(path.strip() for path in exempt_paths if path.strip())
+        self.max_clients = max_clients
+        self._global = TokenBucket(global_rate, global_burst, time.monotonic())
+        self._clients: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.admitted = 0
+        self.rejected_client = 0
+        self.rejected_global = 0
+        AdmissionControlMiddleware.instances.add(self)
+
+    def client_key(self, scope: Scope) -> str:
+        """Konsument från Kong, annars klient-IP som Kong har sett
+
+        Kong lägger den verkliga peer-adressen sist i X-Forwarded-For och sätter
+        X-Real-IP - allt till vänster kommer från klienten och kan förfalskas.
+        """
+        headers: Dict[bytes, bytes] = dict(scope.get("headers") or [])
+        consumer = headers.get(CONSUMER_HEADER)
+        if consumer:
+            return "consumer:" + consumer.decode("latin-1")
+        real_ip = headers.get(b"x-real-ip")
+        if real_ip:
+            return "ip:" + real_ip.strip().decode("latin-1")
+        forwarded = headers.get(b"x-forwarded-for")
+        if forwarded:
+            return "ip:" + forwarded.split(b",")[-1].strip().decode("latin-1")
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+    def _client_bucket(self, key: str, now: float) -> TokenBucket:
+        bucket = self._clients.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.client_rate, self.client_burst, now)
+            self._clients[key] = bucket
+            # Begränsa minnet - glöm den klient som varit tyst längst
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(key)
+        return bucket
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        now = time.monotonic()
+        bucket = self._client_bucket(self.client_key(scope), now)
+        wait = bucket.take(now)
+        if wait:
+            self.rejected_client += 1
+        else:
+            wait = self._global.take(now)
+            if wait:
+                bucket.refund()
+                self.rejected_global += 1
+
+        if wait:
+            await self._reject(send, wait)
+            return
+        self.admitted += 1
+        await self.app(scope, receive, send)
+
+    async def _reject(self, send: Send, wait: float) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_REJECT_BODY)).encode()),
+                (b"retry-after", str(max(math.ceil(wait), 1)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _REJECT_BODY})
+
+    def stats(self) -> Dict[str, int]:
+        """Räknare för insläppta och avvisade requests"""
+        return {
+            "admitted": self.admitted,
+            "rejected_client": self.rejected_client,
+            "rejected_global": self.rejected_global,
+            "tracked_clients": len(self._clients),
+        }
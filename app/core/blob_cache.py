@@ -0,0 +1,268 @@
+"""
+Innehållsadresserad diskcache för artefakter (SHA-256) med storleksbegränsad LRU
+"""
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, BinaryIO, Dict, NamedTuple, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+CHUNK_SIZE = 256 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class CachedBlob(NamedTuple):
+    """En cachad artefakt på disk"""
+    sha256: str
+    size: int
+    path: str
+
+
+class BlobCache:
+    """Pod-lokal diskcache där blobbar lagras efter SHA-256 och nycklar pekar på blobbar"""
+
+    def __init__(self,
+                 directory: Optional[str] = None,
+                 max_bytes: Optional[int] = None,
+                 key_ttl: Optional[float] = None):
+        self.directory = directory or os.getenv(
+            "BLOB_CACHE_DIR", os.path.join(tempfile.gettempdir(), "nexus-api-cache")
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("BLOB_CACHE_MAX_BYTES", str(1024 * 1024 * 1024))
+        )
+        self.key_ttl = key_ttl if key_ttl is not None else float(os.getenv("BLOB_CACHE_KEY_TTL", "3600"))
+        # sha256 -> storlek, i LRU-ordning (äldst först)
+        self._blobs: "OrderedDict[str, int]" = OrderedDict()
+        # nyckel (repository/sökväg) -> (sha256, tidpunkt)
+        self._keys: Dict[str, Tuple[str, float]] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._loaded = False
+
+    def _blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "sha256", sha256[:2], sha256)
+
+    def _load(self) -> None:
+        """Läs in befintliga blobbar från disk (äldst använd först)"""
+        self._loaded = True
+        root = os.path.join(self.directory, "sha256")
+        os.makedirs(root, exist_ok=True)
+        os.makedirs(os.path.join(self.directory, "tmp"), exist_ok=True)
+        found = []
+        for prefix in os.listdir(root):
+            for name in os.listdir(os.path.join(root, prefix)):
+                stat_result = os.stat(os.path.join(root, prefix, name))
+                found.append((stat_result.st_atime, name, stat_result.st_size))
+        for _, sha256, size in sorted(found):
+            self._blobs[sha256] = size
+            self.total_bytes += size
+        self._evict()
+
+    def lookup(self, key: str, stale_ok: bool = False) -> Optional[CachedBlob]:
+        """Slå upp en nyckel och markera blobben som senast använd"""
+        if not self._loaded:
+            self._load()
+        entry = self._keys.get(key)
+        if entry is None or (not stale_ok and time.monotonic() - entry[1] > self.key_ttl):
+            self.misses += 1
+            return None
+        sha256 = entry[0]
+        size = self._blobs.get(sha256)
+        if size is None:
+            del self._keys[key]
+            self.misses += 1
+            return None
+        self._blobs.move_to_end(sha256)
+        self.hits += 1
+        return CachedBlob(sha256, size, self._blob_path(sha256))
+
+    def open(self, blob: CachedBlob) -> Optional[BinaryIO]:
+        """Öppna en cachad blob, None om den hunnit försvinna från disk"""
+        try:
+            return open(blob.path, "rb")
+        except FileNotFoundError:
+            self._forget(blob.sha256)
+            return None
+
+    async def store(self, key: str, chunks: AsyncIterator[bytes]) -> CachedBlob:
+        """Skriv en ström till cachen medan SHA-256 räknas, och koppla nyckeln till blobben"""
+        if not self._loaded:
+            self._load()
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.join(self.directory, "tmp"))
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await anyio.to_thread.run_sync(tmp_file.write, chunk)
+            sha256 = digest.hexdigest()
+            path = self._blob_path(sha256)
+            if sha256 in self._blobs:
+                os.unlink(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+                self._blobs[sha256] = size
+                self.total_bytes += size
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        self._blobs.move_to_end(sha256)
+        self._keys[key] = (sha256, time.monotonic())
+        self._evict(keep=sha256)
+        return CachedBlob(sha256, size, path)
+
+    def _forget(self, sha256: str) -> None:
+        size = self._blobs.pop(sha256, None)
+        if size is not None:
+            self.total_bytes -= size
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Ta bort minst nyligen använda blobbar tills cachen ryms"""
+        while self.total_bytes > self.max_bytes and self._blobs:
+            sha256 = next(iter(self._blobs))
+            if sha256 == keep:
+                break
+            self._forget(sha256)
+            self.evictions += 1
+            try:
+                os.unlink(self._blob_path(sha256))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Cachestatistik"""
+        return {
+            "blobs": len(self._blobs),
+            "keys": len(self._keys),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Tolka en enkel Range-header till (start, slut) inklusive, ValueError om otillfredsställbar"""
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        # Flera intervall eller okänd enhet - skicka hela filen
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0:
+            raise ValueError(header)
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+class BlobResponse(Response):
+    """Skicka en cachad blob med ETag, If-None-Match, Range och zero-copy när servern stöder det"""
+
+    def __init__(self, blob: CachedBlob, file: BinaryIO, request_headers: Headers, filename: str,
+                 send_header_only: bool = False):
+        self.blob = blob
+        self.file = file
+        self.send_header_only = send_header_only
+        self.background = None
+        etag = f'"{blob.sha256}"'
+        headers = {
+            "etag": etag,
+            "accept-ranges": "bytes",
+            "cache-control": "public, no-cache",
+            "content-type": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+            "content-disposition": f'attachment; filename="{filename}"',
+        }
+        self.start, self.end = 0, blob.size - 1
+        status_code = 200
+
+        if_none_match = request_headers.get("if-none-match")
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if if_none_match and (if_none_match.strip() == "*" or etag in [
+            tag.strip().lstrip("W/") for tag in if_none_match.split(",")
+        ]):
+            status_code = 304
+        elif range_header and (not if_range or if_range.strip() == etag):
+            try:
+                byte_range = _parse_range(range_header, blob.size)
+            except ValueError:
+                status_code = 416
+                headers["content-range"] = f"bytes */{blob.size}"
+            else:
+                if byte_range is not None:
+                    status_code = 206
+                    self.start, self.end = byte_range
+                    headers["content-range"] = f"bytes {self.start}-{self.end}/{blob.size}"
+
+        self.status_code = status_code
+        if status_code in (304, 416):
+            self.start, self.end = 0, -1
+            if status_code == 304:
+                for name in ("content-type", "content-disposition"):
+                    headers.pop(name)
+        headers["content-length"] = str(self.end - self.start + 1)
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            count = self.end - self.start + 1
+            if self.send_header_only or count <= 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            elif "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": self.file,
+                    "offset": self.start,
+                    "count": count,
+                    "more_body": False,
+                })
+            else:
+                self.file.seek(self.start)
+                while count > 0:
+                    chunk = await anyio.to_thread.run_sync(self.file.read, min(CHUNK_SIZE, count))
+                    if not chunk:
+                        break
+                    count -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": count > 0})
+                if count > 0:
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            self.file.close()
+
+
+# Delad cache för hela appen
+blob_cache = BlobCache()
+
+
+def get_blob_cache() -> BlobCache:
+    """FastAPI-dependency för artefaktcachen"""
+    return blob_cache
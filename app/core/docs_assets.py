@@ -0,0 +1,89 @@
+"""
+Självhostade filer för Swagger UI och ReDoc
+
+Filerna i static/docs följer med paketet, så /docs och /redoc laddar utan
+CDN (även i air-gappade kluster). De läses och gzippas en gång och
+serveras med versionerade URL:er (?v=<hash>) som är oföränderliga.
+Saknas katalogen används FastAPIs CDN-adresser som tidigare.
+"""
+import mimetypes
+import os
+from typing import Any, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .openapi_cache import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, PrecomputedBody
+
+DOCS_ASSETS_DIR = os.getenv(
+    "DOCS_ASSETS_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "static", "docs")
+)
+
+SWAGGER_JS = "swagger-ui-bundle.js"
+SWAGGER_CSS = "swagger-ui.css"
+REDOC_JS = "redoc.standalone.js"
+FAVICON = "favicon-32x32.png"
+REQUIRED_ASSETS = (SWAGGER_JS, SWAGGER_CSS, REDOC_JS, FAVICON)
+
+
+class DocsAssets:
+    """Docs-filerna som förberäknade svar under url_path"""
+
+    def __init__(self, directory: Optional[str] = None, url_path: str = "/static/docs"):
+        self.directory = directory or DOCS_ASSETS_DIR
+        self.url_path = url_path.rstrip("/")
+        self._assets: Optional[Dict[str, PrecomputedBody]] = None
+
+    def load(self) -> Dict[str, PrecomputedBody]:
+        """Läs och komprimera alla filer (anropas i lifespan, annars vid första användning)"""
+        assets = {}
+        if os.path.isdir(self.directory):
+            for name in sorted(os.listdir(self.directory)):
+                path = os.path.join(self.directory, name)
+                if not os.path.isfile(path):
+                    continue
+                with open(path, "rb") as f:
+                    body = f.read()
+                # Starlette lägger själv till charset för text/*
+                media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                assets[name] = PrecomputedBody(body, media_type)
+        self._assets = assets
+        return assets
+
+    @property
+    def assets(self) -> Dict[str, PrecomputedBody]:
+        return self._assets if self._assets is not None else self.load()
+
+    @property
+    def available(self) -> bool:
+        return all(name in self.assets for name in REQUIRED_ASSETS)
+
+    def url(self, name: str) -> str:
+        """Relativ, versionerad URL - relativ så att den fungerar både direkt och bakom Kong (/api)"""
+        return f"{self.url_path.lstrip('/')}/{name}?v={self.assets[name].version}"
+
+    def swagger_ui_kwargs(self) -> Dict[str, Any]:
+        if not self.available:
+            return {}
+        return {
+            "swagger_js_url": self.url(SWAGGER_JS),
+            "swagger_css_url": self.url(SWAGGER_CSS),
+            "swagger_favicon_url": self.url(FAVICON),
+        }
+
+    def redoc_kwargs(self) -> Dict[str, Any]:
+        if not self.available:
+            return {}
+        # Inga Google Fonts - sidan ska inte behöva något utanför klustret
+        return {"redoc_js_url": self.url(REDOC_JS), "redoc_favicon_url": self.url(FAVICON), "with_google_fonts": False}
+
+    async def endpoint(self, request: Request) -> Response:
+        asset = self.assets.get(request.path_params["name"])
+        if asset is None:
+            return Response(status_code=404)
+        versioned = request.query_params.get("v") == asset.version
+        return asset.response(request, IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL)
+
+
+# Delad instans för appen
+docs_assets = DocsAssets()
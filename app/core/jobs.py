@@ -0,0 +1,254 @@
+"""
+Bakgrundsjobb - asynkron jobbkö med prioriteter, begränsat antal workers och valfri persistens
+"""
+import asyncio
+import itertools
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class Job:
+    """Ett jobbs tillstånd - API:t mappar det till JobInfo"""
+
+    FIELDS = ("id", "kind", "params", "priority", "status", "progress", "message", "result", "error",
+              "created_at", "started_at", "finished_at")
+    TIMESTAMPS = ("created_at", "started_at", "finished_at")
+
+    def __init__(self, id: str, kind: str, created_at: datetime, params: Optional[Dict[str, Any]] = None,
+                 priority: int = 0, status: str = QUEUED, progress: float = 0.0, message: Optional[str] = None,
+                 result: Any = None, error: Optional[str] = None, started_at: Optional[datetime] = None,
+                 finished_at: Optional[datetime] = None):
+        self.id = id
+        self.kind = kind
+        self.params = params or {}
+        self.priority = priority
+        self.status = status
+        self.progress = progress
+        self.message = message
+        self.result = result
+        self.error = error
+        self.created_at = created_at
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def to_json(self) -> Dict[str, Any]:
+        data = self.to_dict()
+        for field in self.TIMESTAMPS:
+            if data[field] is not None:
+                data[field] = data[field].isoformat()
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Job":
+        data = {field: data[field] for field in cls.FIELDS if field in data}
+        for field in cls.TIMESTAMPS:
+            if data.get(field) is not None:
+                data[field] = datetime.fromisoformat(data[field])
+        return cls(**data)
+
+
+class JobContext:
+    """Det en jobbhanterare får - parametrar och rapportering av progress"""
+
+    def __init__(self, job: Job):
+        self.job = job
+        self.params = job.params
+
+    def set_progress(self, progress: float, message: Optional[str] = None) -> None:
+        """Uppdatera progress (0.0-1.0) och valfritt statusmeddelande"""
+        self.job.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            self.job.message = message
+
+
+JobHandler = Callable[[JobContext], Awaitable[Any]]
+# Kontrollerar parametrar vid submit - returnerar normaliserade parametrar eller kastar ValueError
+ParamsValidator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class JobManager:
+    """In-process jobbkö där högre prioritet körs först"""
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 store_path: Optional[str] = None,
+                 max_history: Optional[int] = None):
+        self.workers = workers or int(os.getenv("JOBS_WORKERS", "2"))
+        self.store_path = store_path if store_path is not None else os.getenv("JOBS_STORE_PATH")
+        self.max_history = max_history or int(os.getenv("JOBS_MAX_HISTORY", "1000"))
+        self.handlers: Dict[str, JobHandler] = {}
+        self.validators: Dict[str, ParamsValidator] = {}
+        self.jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+        self._save_lock = asyncio.Lock()
+
+    def register(self, kind: str, validate: Optional[ParamsValidator] = None) -> Callable[[JobHandler], JobHandler]:
+        """Registrera en hanterare för en jobbtyp, med valfri kontroll av parametrarna vid submit"""
+        def decorator(handler: JobHandler) -> JobHandler:
+            self.handlers[kind] = handler
+            if validate is not None:
+                self.validators[kind] = validate
+            return handler
+        return decorator
+
+    async def start(self) -> None:
+        """Läs in sparade jobb och starta workers"""
+        self._queue = asyncio.PriorityQueue()
+        for job in self._load():
+            if job.status in (QUEUED, RUNNING):
+                job.status = QUEUED
+                job.started_at = None
+                job.progress = 0.0
+            self.jobs.setdefault(job.id, job)
+        for job in sorted(self.jobs.values(), key=lambda job: job.created_at):
+            if job.status == QUEUED:
+                self._enqueue(job)
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Stoppa workers - pågående jobb sparas som köade och körs om vid nästa start"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self._persist()
+
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None, priority: int = 0) -> Job:
+        """Lägg ett jobb i kön och returnera direkt
+
+        KeyError för okänd jobbtyp och ValueError för ogiltiga parametrar, så att
+        felet syns vid submit i stället för som ett FAILED-jobb senare.
+        """
+        if kind not in self.handlers:
+            raise KeyError(kind)
+        params = params or {}
+        if kind in self.validators:
+            params = self.validators[kind](params)
+        job = Job(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            params=params,
+            priority=priority,
+            status=QUEUED,
+            created_at=datetime.now(),
+        )
+        self.jobs[job.id] = job
+        self._trim_history()
+        if self._queue is not None:
+            self._enqueue(job)
+        self._schedule_save()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def list(self, status: Optional[str] = None) -> List[Job]:
+        """Alla jobb, nyaste först"""
+        jobs = [job for job in self.jobs.values() if status is None or job.status == status]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Antal jobb per status och köns längd"""
+        counts = {QUEUED: 0, RUNNING: 0, SUCCEEDED: 0, FAILED: 0}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        counts["workers"] = self.workers
+        counts["queue_size"] = self._queue.qsize() if self._queue is not None else 0
+        return counts
+
+    def _enqueue(self, job: Job) -> None:
+        # Högre prioritet först, därefter i inlämningsordning
+        self._queue.put_nowait((-job.priority, next(self._sequence), job.id))
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self.jobs.get(job_id)
+            if job is None or job.status != QUEUED:
+                continue
+            job.status = RUNNING
+            job.started_at = datetime.now()
+            await self._persist()
+            try:
+                job.result = await self.handlers[job.kind](JobContext(job))
+                job.status = SUCCEEDED
+                job.progress = 1.0
+            except asyncio.CancelledError:
+                job.status = QUEUED
+                raise
+            except Exception as e:
+                logger.exception("Jobb %s (%s) misslyckades", job.id, job.kind)
+                job.status = FAILED
+                job.error = str(e)
+            job.finished_at = datetime.now()
+            await self._persist()
+
+    def _trim_history(self) -> None:
+        """Släng de äldsta avslutade jobben när historiken blir för lång"""
+        finished = [job for job in self.jobs.values() if job.status in (SUCCEEDED, FAILED)]
+        overflow = len(self.jobs) - self.max_history
+        for job in sorted(finished, key=lambda job: job.created_at)[:max(overflow, 0)]:
+            del self.jobs[job.id]
+
+    def _schedule_save(self) -> None:
+        if self.store_path and self._tasks:
+            asyncio.ensure_future(self._persist())
+
+    async def _persist(self) -> None:
+        """Spara utan att kasta - ett fel i lagret får inte döda en worker eller fastna jobb i RUNNING"""
+        try:
+            await self._save()
+        except Exception:
+            logger.exception("Kunde inte spara jobblagret %s", self.store_path)
+
+    def _load(self) -> List[Job]:
+        if not self.store_path or not os.path.exists(self.store_path):
+            return []
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                return [Job.from_json(data) for data in json.load(f)]
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning("Kunde inte läsa jobblagret %s: %s", self.store_path, e)
+            return []
+
+    async def _save(self) -> None:
+        """Skriv jobbens tillstånd atomiskt till lagret (om konfigurerat)"""
+        if not self.store_path:
+            return
+
+        def write(payload: str) -> None:
+            tmp_path = f"{self.store_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.store_path)
+
+        async with self._save_lock:
+            payload = json.dumps([job.to_json() for job in self.jobs.values()], default=str)
+            await anyio.to_thread.run_sync(write, payload)
+
+
+# Delad jobbkö för hela appen
+job_manager = JobManager()
+
+
+def get_job_manager() -> JobManager:
+    """FastAPI-dependency för jobbkön"""
+    return job_manager
@@ -0,0 +1,119 @@
+"""
+Övervakning av event loopen - schemaläggningsfördröjning som histogram och vakthund för blockerande anrop
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Fördröjning mäts i allt från 0.1 ms upp till sekunder
+LAG_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+loop_lag = registry.histogram(
+    "event_loop_lag_seconds",
+    "Hur mycket senare än planerat event loopen hann köra en timer",
+    (),
+    buckets=LAG_BUCKETS,
+)
+
+
+class LoopLagMonitor:
+    """Mäter loopens fördröjning kontinuerligt och rapporterar (i debug-läge) stackar som blockerar den"""
+
+    def __init__(self,
+                 interval: Optional[float] = None,
+                 block_threshold: Optional[float] = None,
+                 watchdog: Optional[bool] = None,
+                 max_reports: int = 20):
+        self.interval = interval or float(os.getenv("LOOP_MONITOR_INTERVAL", "0.1"))
+        self.block_threshold = block_threshold or float(os.getenv("LOOP_BLOCK_THRESHOLD", "0.1"))
+        if watchdog is None:
+            watchdog = os.getenv("LOOP_WATCHDOG_ENABLED", os.getenv("DEBUG", "false")).lower() == "true"
+        self.watchdog = watchdog
+        self.histogram = loop_lag.labels()
+        self.max_lag = 0.0
+        self.blocked = 0
+        self.reports: Deque[Dict[str, object]] = deque(maxlen=max_reports)
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.ensure_future(self._run())
+        if self.watchdog:
+            self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - scheduled, 0.0)
+            self.histogram.observe(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+            self._heartbeat = time.monotonic()
+
+    def _watch(self) -> None:
+        """Vakthundstråd - fångar loop-trådens stack när hjärtslagen uteblir"""
+        check_every = min(self.block_threshold / 2, self.interval)
+        reported_heartbeat = None
+        while not self._stop.wait(check_every):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.block_threshold or heartbeat == reported_heartbeat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            # En rapport per blockering, inte en per kontroll
+            reported_heartbeat = heartbeat
+            stack = "".join(traceback.format_stack(frame))
+            self.blocked += 1
+            self.reports.append({"blocked_for": round(stalled, 3), "timestamp": time.time(), "stack": stack})
+            logger.warning("Event loopen har varit blockerad i %.3f s:\n%s", stalled, stack)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "interval": self.interval,
+            "block_threshold": self.block_threshold,
+            "watchdog": self.watchdog,
+            "max_lag": round(self.max_lag, 6),
+            "blocked": self.blocked,
+        }
+
+    def collect(self) -> List:
+        return [
+            ("event_loop_blocked_total", "counter",
+             "Gånger vakthunden sett loopen blockerad längre än tröskeln", [({}, self.blocked)]),
+        ]
+
+
+# Delad monitor för hela appen
+loop_monitor = LoopLagMonitor()
+registry.register_collector(loop_monitor.collect)
@@ -0,0 +1,224 @@
+"""
+Prometheus-kompatibla metrics - histogram per route och gauges som läses vid scrape
+"""
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Standardgränser i sekunder - från 0.5 ms upp till 10 s
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (namn, typ, hjälptext, [(etiketter, värde)])
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+
+class Histogram:
+    """Ett histogram med fasta gränser - observe allokerar inga nya objekt utöver flyttal"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, kumulativt antal) inklusive +Inf"""
+        result = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            result.append((_format_value(bound), total))
+        result.append(("+Inf", total + self.counts[-1]))
+        return result
+
+
+class HistogramFamily:
+    """Histogram per kombination av etikettvärden"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.children: Dict[Tuple[str, ...], Histogram] = {}
+
+    def labels(self, *values: str) -> Histogram:
+        child = self.children.get(values)
+        if child is None:
+            child = self.children[values] = Histogram(self.buckets)
+        return child
+
+    def render(self, lines: List[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for values, child in self.children.items():
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values))
+            prefix = labels + "," if labels else ""
+            for le, count in child.cumulative():
+                lines.append(f'{self.name}_bucket{{{prefix}le="{le}"}} {count}')
+            selector = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_sum{selector} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{selector} {child.count}")
+
+
+class MetricsRegistry:
+    """Samlar histogram och collectors som körs vid scrape"""
+
+    def __init__(self, prefix: str = "nexus_api"):
+        self.prefix = prefix
+        self.histograms: List[HistogramFamily] = []
+        self.collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str],
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> HistogramFamily:
+        family = HistogramFamily(f"{self.prefix}_{name}", documentation, labelnames, buckets)
+        self.histograms.append(family)
+        return family
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Registrera en funktion som returnerar (namn, typ, hjälp, samples) vid scrape"""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text-format 0.0.4"""
+        lines: List[str] = []
+        for family in self.histograms:
+            family.render(lines)
+        for collector in self.collectors:
+            for name, kind, documentation, samples in collector():
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {documentation}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                for labels, value in samples:
+                    rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+                    lines.append(f"{full_name}{{{rendered}}} {_format_value(value)}" if rendered
+                                 else f"{full_name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class RequestMetrics:
+    """Räknare och latens per route, metod och status"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.duration = registry.histogram(
+            "http_request_duration_seconds",
+            "Latens per route, metod och status",
+            ("route", "method", "status"),
+        )
+        self.in_flight = 0
+        # route -> metod -> status -> histogram, så att en request inte behöver bygga tupler
+        self._series: Dict[str, Dict[str, Dict[int, Histogram]]] = {}
+        registry.register_collector(self._collect)
+
+    def observe(self, route: str, method: str, status: int, seconds: float) -> None:
+        by_method = self._series.get(route)
+        if by_method is None:
+            by_method = self._series[route] = {}
+        by_status = by_method.get(method)
+        if by_status is None:
+            by_status = by_method[method] = {}
+        histogram = by_status.get(status)
+        if histogram is None:
+            histogram = by_status[status] = self.duration.labels(route, method, str(status))
+        histogram.observe(seconds)
+
+    def _collect(self) -> Iterable[Family]:
+        totals = [
+            ({"route": route, "method": method, "status": str(status)}, histogram.count)
+            for route, by_method in self._series.items()
+            for method, by_status in by_method.items()
+            for status, histogram in by_status.items()
+        ]
+        return [
+            ("http_requests_total", "counter", "Antal requests per route, metod och status", totals),
+            ("http_requests_in_flight", "gauge", "Requests som hanteras just nu", [({}, self.in_flight)]),
+        ]
+
+
+class MetricsMiddleware:
+    """ASGI-middleware som mäter latens per route-mall"""
+
+    def __init__(self, app: ASGIApp, request_metrics: Optional["RequestMetrics"] = None):
+        self.app = app
+        self.metrics = request_metrics or request_metrics_default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.in_flight -= 1
+            metrics.observe(route_template(scope), scope["method"], status_code, elapsed)
+
+
+def route_template(scope: Scope) -> str:
+    """Route-mallen (t.ex. /api/packages/{package_id}) i stället för den faktiska sökvägen"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    router = getattr(scope.get("app"), "router", None)
+    if "endpoint" in scope and router is not None:
+        # Starlette-routes (t.ex. /docs och /static/docs/{name}) sätter ingen scope["route"] -
+        # matcha om på samma sätt som routern: första fulla träffen, annars första partiella (405)
+        partial = None
+        for candidate in router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                return candidate.path
+            if match == Match.PARTIAL and partial is None:
+                partial = candidate.path
+        if partial is not None:
+            return partial
+    # Omatchade sökvägar slås ihop för att hålla nere kardinaliteten
+    return "<unmatched>"
+
+
+# Delat register för hela appen
+registry = MetricsRegistry()
+request_metrics_default = RequestMetrics(registry)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Exponera alla metrics i Prometheus text-format"""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
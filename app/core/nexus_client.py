@@ -0,0 +1,338 @@
+"""
+Asynkron klient mot Nexus Repository Manager (upstream)
+"""
+import math
+import os
+import posixpath
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+import httpx
+from fastapi import HTTPException
+
+from .resilience import CircuitBreaker, ConcurrencyLimiter, LimiterTimeoutError
+from .singleflight import SingleFlight
+from .streaming import MultipartStream
+from .timing import phase
+from .tracing import inject_traceparent
+
+T = TypeVar("T")
+
+# Nexus formatnamn per repository-format i API:t
+NEXUS_FORMATS = {"pypi": "pypi", "apt": "apt", "rpm": "yum", "docker": "docker"}
+
+# Formatspecifika standardinställningar när ett hosted-repository skapas
+HOSTED_DEFAULTS = {
+    "yum": {"yum": {"repodataDepth": 0, "deployPolicy": "STRICT"}},
+    "docker": {"docker": {"v1Enabled": False, "forceBasicAuth": True}},
+    "apt": {"apt": {"distribution": "stable"}},
+}
+
+# Nexus formatnamn och multipart-fält per repository-format i API:t
+UPLOAD_FORMATS = {
+    "pypi": ("pypi", "pypi.asset"),
+    "apt": ("apt", "apt.asset"),
+    "rpm": ("yum", "yum.asset"),
+}
+
+
+class NexusError(Exception):
+    """Fel vid anrop mot Nexus"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class NexusUnavailableError(NexusError):
+    """Nexus skyddas av öppen krets eller full limiter - anropet gjordes aldrig"""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message, status_code=503)
+        self.retry_after = retry_after
+
+
+def service_unavailable(error: NexusUnavailableError) -> HTTPException:
+    """503 med Retry-After (hela sekunder, minst 1) när Nexus skyddas av circuit breaker eller limiter"""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(max(math.ceil(error.retry_after), 1))},
+    )
+
+
+def asset_path(repository: str, path: str) -> str:
+    """Upstream-sökväg för en asset - ValueError om den kan lämna repositoryt
+
+    Både repository och path kommer från klienten och anropet görs med API:ts
+    Nexus-inloggning, så ../ eller kodade snedstreck får aldrig nå upstream.
+    """
+    for part in (repository, path):
+        lowered = part.lower()
+        if "\\" in part or "%2f" in lowered or "%5c" in lowered or "%2e" in lowered:
+            raise ValueError(f"Ogiltig sökväg: {repository}/{path}")
+    segments = path.lstrip("/").split("/")
+    if not repository or "/" in repository or repository in (".", "..") or any(s in (".", "..") for s in segments):
+        raise ValueError(f"Ogiltig sökväg: {repository}/{path}")
+    prefix = f"/repository/{repository}/"
+    url_path = prefix + "/".join(segments)
+    if not posixpath.normpath(url_path).startswith(prefix):
+        raise ValueError(f"Ogiltig sökväg: {repository}/{path}")
+    return url_path
+
+
+class NexusClient:
+    """Klient för Nexus REST API med delad connection pool"""
+
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 username: Optional[str] = None,
+                 password: Optional[str] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None,
+                 timeout: Optional[float] = None,
+                 cache_ttl: Optional[float] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 limiter: Optional[ConcurrencyLimiter] = None):
+        self.base_url = (base_url or os.getenv("NEXUS_URL", "http://localhost:8081")).rstrip("/")
+        self.username = username or os.getenv("NEXUS_USERNAME")
+        self.password = password or os.getenv("NEXUS_PASSWORD")
+        self.timeout = timeout or float(os.getenv("NEXUS_TIMEOUT", "30"))
+        self.cache_ttl = cache_ttl if cache_ttl is not None else float(os.getenv("NEXUS_CACHE_TTL", "30"))
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self.singleflight = SingleFlight()
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=int(os.getenv("NEXUS_BREAKER_FAILURES", "5")),
+            reset_timeout=float(os.getenv("NEXUS_BREAKER_RESET", "30")),
+            half_open_max_calls=int(os.getenv("NEXUS_BREAKER_HALF_OPEN_CALLS", "1")),
+        )
+        self.limiter = limiter or ConcurrencyLimiter(
+            max_concurrency=int(os.getenv("NEXUS_MAX_CONCURRENCY", "20")),
+            queue_timeout=float(os.getenv("NEXUS_QUEUE_TIMEOUT", "1.0")),
+        )
+        # (sökväg, parametrar) -> (utgångstid, JSON-svar)
+        self._json_cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Skapa httpx-klienten vid första användning"""
+        if self._client is None:
+            auth = (self.username, self.password) if self.username and self.password else None
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                auth=auth,
+                transport=self._transport,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=self.limiter.max_concurrency),
+                event_hooks={"request": [inject_traceparent]},
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Stäng connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @asynccontextmanager
+    async def _upstream(self) -> AsyncIterator[None]:
+        """Släpp igenom ett anrop via limiter och circuit breaker"""
+        if self.breaker.is_rejecting():
+            self.breaker.rejected += 1
+            raise NexusUnavailableError("Nexus är otillgänglig (kretsen är öppen)", self.breaker.retry_after())
+        # Väntan på plats i limitern räknas också som upstream-tid
+        with phase("upstream"):
+            try:
+                async with self.limiter.slot():
+                    if not self.breaker.allow():
+                        raise NexusUnavailableError(
+                            "Nexus är otillgänglig (kretsen är öppen)", max(self.breaker.retry_after(), 1.0)
+                        )
+                    try:
+                        yield
+                    except NexusError as e:
+                        # Transportfel och 5xx räknas som fel, 4xx är klientens fel
+                        if e.status_code is None or e.status_code >= 500 or e.status_code == 429:
+                            self.breaker.record_failure()
+                        else:
+                            self.breaker.record_success()
+                        raise
+                    except BaseException:
+                        self.breaker.record_ignored()
+                        raise
+                    else:
+                        self.breaker.record_success()
+            except LimiterTimeoutError as e:
+                raise NexusUnavailableError(str(e)) from e
+
+    async def coalesce(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Låt samtidiga anropare med samma nyckel dela ett upstream-anrop"""
+        with phase("upstream"):
+            return await self.singleflight.do(key, fn)
+
+    async def get_json(self, path: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """GET mot Nexus REST API med kortlivad cache och sammanslagning av samtidiga anrop"""
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._json_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        async def fetch() -> Any:
+            async with self._upstream():
+                try:
+                    response = await self.client.get(path, params=params)
+                except httpx.HTTPError as e:
+                    raise NexusError(f"Kunde inte nå Nexus: {e}") from e
+                if response.status_code >= 400:
+                    raise NexusError(
+                        f"Nexus svarade {response.status_code} för {path}",
+                        status_code=response.status_code,
+                    )
+            data = response.json()
+            self._json_cache[key] = (time.monotonic() + self.cache_ttl, data)
+            return data
+
+        try:
+            return await self.coalesce(("json",) + key, fetch)
+        except NexusError as e:
+            # Servera senast kända svar när Nexus inte svarar
+            if cached is not None and (e.status_code is None or e.status_code >= 500):
+                return cached[1]
+            raise
+
+    async def list_repositories(self) -> Any:
+        """Hämta repositories från Nexus"""
+        return await self.get_json("/service/rest/v1/repositories")
+
+    async def send_json(self, method: str, path: str, body: Optional[Any] = None) -> Any:
+        """Skicka en skrivande request till Nexus REST API (ingen cache eller sammanslagning)"""
+        async with self._upstream():
+            try:
+                response = await self.client.request(method, path, json=body)
+            except httpx.HTTPError as e:
+                raise NexusError(f"Kunde inte nå Nexus: {e}") from e
+            if response.status_code >= 400:
+                raise NexusError(
+                    f"Nexus svarade {response.status_code} för {path}: {response.text[:200]}",
+                    status_code=response.status_code,
+                )
+        return response.json() if response.content else None
+
+    async def create_hosted_repository(self, name: str, repository_format: str,
+                                       attributes: Optional[Dict[str, Any]] = None) -> None:
+        """Skapa ett hosted-repository i Nexus"""
+        if repository_format not in NEXUS_FORMATS:
+            raise NexusError(f"Formatet {repository_format} stöds inte")
+        nexus_format = NEXUS_FORMATS[repository_format]
+        body: Dict[str, Any] = {
+            "name": name,
+            "online": True,
+            "storage": {
+                "blobStoreName": "default",
+                "strictContentTypeValidation": True,
+                "writePolicy": "allow_once",
+            },
+        }
+        body.update(HOSTED_DEFAULTS.get(nexus_format, {}))
+        body.update(attributes or {})
+        await self.send_json("POST", f"/service/rest/v1/repositories/{nexus_format}/hosted", body)
+
+    async def rebuild_index(self, repository: str) -> None:
+        """Bygg om sökindexet för ett repository"""
+        await self.send_json("POST", f"/service/rest/v1/repositories/{repository}/rebuild-index")
+
+    async def iter_components(self, repository: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Hämta komponenter sida för sida via continuation tokens"""
+        token: Optional[str] = None
+        while True:
+            params = {"repository": repository}
+            if token:
+                params["continuationToken"] = token
+            async with self._upstream():
+                try:
+                    response = await self.client.get("/service/rest/v1/components", params=params)
+                except httpx.HTTPError as e:
+                    raise NexusError(f"Kunde inte nå Nexus: {e}") from e
+                if response.status_code >= 400:
+                    raise NexusError(
+                        f"Nexus svarade {response.status_code} för komponenter i {repository}",
+                        status_code=response.status_code,
+                    )
+            page = response.json()
+            yield page.get("items", [])
+            token = page.get("continuationToken")
+            if not token:
+                break
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik för upstream-klienten"""
+        return {
+            "nexus_url": self.base_url,
+            "json_cache_entries": len(self._json_cache),
+            "singleflight": self.singleflight.stats(),
+            "circuit_breaker": self.breaker.stats(),
+            "limiter": self.limiter.stats(),
+        }
+
+    async def upload_component(self,
+                               repository: str,
+                               repository_format: str,
+                               filename: str,
+                               chunks: AsyncIterator[bytes],
+                               content_length: Optional[int] = None) -> None:
+        """Strömma en artefakt till Nexus components API chunk för chunk"""
+        if repository_format not in UPLOAD_FORMATS:
+            raise NexusError(f"Formatet {repository_format} stöds inte för upload")
+
+        nexus_format, file_field = UPLOAD_FORMATS[repository_format]
+        fields = []
+        if nexus_format == "yum":
+            fields.append(("yum.asset.filename", filename))
+        body = MultipartStream(file_field, filename, chunks, fields=fields)
+
+        headers = {"Content-Type": body.content_type}
+        if content_length is not None:
+            headers["Content-Length"] = str(body.content_length(content_length))
+
+        async with self._upstream():
+            try:
+                response = await self.client.post(
+                    "/service/rest/v1/components",
+                    params={"repository": repository},
+                    content=body,
+                    headers=headers,
+                )
+            except httpx.HTTPError as e:
+                raise NexusError(f"Kunde inte nå Nexus: {e}") from e
+
+            if response.status_code >= 400:
+                raise NexusError(
+                    f"Nexus svarade {response.status_code}: {response.text[:200]}",
+                    status_code=response.status_code,
+                )
+
+    async def stream_asset(self, repository: str, path: str) -> AsyncIterator[bytes]:
+        """Strömma en asset från ett Nexus-repository"""
+        url_path = asset_path(repository, path)
+        async with self._upstream():
+            try:
+                async with self.client.stream("GET", url_path) as response:
+                    if response.status_code >= 400:
+                        raise NexusError(
+                            f"Nexus svarade {response.status_code} för {repository}/{path}",
+                            status_code=response.status_code,
+                        )
+                    async for chunk in response.aiter_bytes():
+                        yield chunk
+            except httpx.HTTPError as e:
+                raise NexusError(f"Kunde inte nå Nexus: {e}") from e
+
+
+# Delad klient för hela appen
+nexus_client = NexusClient()
+
+
+def get_nexus_client() -> NexusClient:
+    """FastAPI-dependency för upstream-klienten"""
+    return nexus_client
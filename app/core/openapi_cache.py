@@ -0,0 +1,141 @@
+"""
+Förberäknat OpenAPI-schema och dokumentationssidor med stark ETag och gzip
+
+Schemat genereras en gång vid uppstart i stället för vid första requesten
+och hålls som färdigkodade bytes, både okomprimerat och gzippat. Swagger UI
+och ReDoc hämtar schemat via en versionerad URL (?v=<hash>) som kan cachas
+för evigt; den oversionerade URL:en revalideras med ETag och ger 304.
+"""
+import gzip
+import hashlib
+import json
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import Response
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], *etags: str) -> bool:
+    """If-None-Match med svag jämförelse, som för blob-cachen"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().lstrip("W/") for tag in if_none_match.split(",")]
+    return any(etag in candidates for etag in etags)
+
+
+def accepts_gzip(headers: Headers) -> bool:
+    encodings = [part.split(";")[0].strip().lower() for part in headers.get("accept-encoding", "").split(",")]
+    return "gzip" in encodings or "*" in encodings
+
+
+class PrecomputedBody:
+    """Ett färdigkodat svar: bytes, gzip-bytes och en stark ETag per representation"""
+
+    def __init__(self, body: bytes, media_type: str, gzipped: Optional[bytes] = None):
+        self.body = body
+        self.media_type = media_type
+        # mtime=0 ger samma bytes vid varje uppstart och i varje pod
+        self.gzipped = gzipped if gzipped is not None else gzip.compress(body, compresslevel=9, mtime=0)
+        self.version = hashlib.sha256(body).hexdigest()[:20]
+        self.etag = f'"{self.version}"'
+        self.gzip_etag = f'"{self.version}-gzip"'
+
+    def response(self, request: Request, cache_control: str = REVALIDATE_CACHE_CONTROL) -> Response:
+        """200 med gzip när klienten klarar det, annars 304 om ETag matchar"""
+        use_gzip = accepts_gzip(request.headers) and len(self.gzipped) < len(self.body)
+        etag = self.gzip_etag if use_gzip else self.etag
+        headers = {"etag": etag, "cache-control": cache_control, "vary": "Accept-Encoding"}
+        if etag_matches(request.headers.get("if-none-match"), self.etag, self.gzip_etag):
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["content-encoding"] = "gzip"
+        return Response(self.gzipped if use_gzip else self.body, media_type=self.media_type, headers=headers)
+
+
+class OpenAPICache:
+    """OpenAPI-schemat och docs-sidorna som förberäknade svar"""
+
+    def __init__(self, app: FastAPI, openapi_url: str,
+                 swagger_ui_kwargs: Optional[Callable[[], Dict[str, Any]]] = None,
+                 redoc_kwargs: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.app = app
+        self.openapi_url = openapi_url
+        # Anropas när sidan renderas, t.ex. för URL:er till självhostade JS/CSS-filer
+        self.swagger_ui_kwargs = swagger_ui_kwargs or dict
+        self.redoc_kwargs = redoc_kwargs or dict
+        self._schema: Optional[PrecomputedBody] = None
+        # root_path -> förberäknad sida (Kong skickar ingen root_path, men andra proxies kan)
+        self._pages: Dict[Any, PrecomputedBody] = {}
+
+    def build(self) -> PrecomputedBody:
+        """Generera och koda schemat (anropas i lifespan, annars vid första requesten)"""
+        schema = self.app.openapi()
+        # Samma kodning som FastAPIs JSONResponse
+        body = json.dumps(schema, ensure_ascii=False, allow_nan=False, indent=None,
+                          separators=(",", ":")).encode("utf-8")
+        self._schema = PrecomputedBody(body, "application/json")
+        self._pages.clear()
+        return self._schema
+
+    @property
+    def schema(self) -> PrecomputedBody:
+        return self._schema or self.build()
+
+    def versioned_url(self, root_path: str = "") -> str:
+        return f"{root_path}{self.openapi_url}?v={self.schema.version}"
+
+    def _page(self, kind: str, root_path: str, render: Callable[[str], Any]) -> PrecomputedBody:
+        key = (kind, root_path)
+        if key not in self._pages:
+            self._pages[key] = PrecomputedBody(render(self.versioned_url(root_path)).body, "text/html")
+        return self._pages[key]
+
+    async def openapi_endpoint(self, request: Request) -> Response:
+        """Schemat - versionerade URL:er är oföränderliga och cachas i ett år"""
+        schema = self.schema
+        versioned = request.query_params.get("v") == schema.version
+        return schema.response(request, IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL)
+
+    async def swagger_ui_endpoint(self, request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        page = self._page("swagger", root_path, lambda openapi_url: get_swagger_ui_html(
+            openapi_url=openapi_url,
+            title=f"{self.app.title} - Swagger UI",
+            oauth2_redirect_url=f"{root_path}{self.app.swagger_ui_oauth2_redirect_url}",
+            init_oauth=self.app.swagger_ui_init_oauth,
+            swagger_ui_parameters=self.app.swagger_ui_parameters,
+            **self.swagger_ui_kwargs(),
+        ))
+        return page.response(request)
+
+    async def swagger_ui_redirect_endpoint(self, request: Request) -> Response:
+        return get_swagger_ui_oauth2_redirect_html()
+
+    async def redoc_endpoint(self, request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        page = self._page("redoc", root_path, lambda openapi_url: get_redoc_html(
+            openapi_url=openapi_url,
+            title=f"{self.app.title} - ReDoc",
+            **self.redoc_kwargs(),
+        ))
+        return page.response(request)
+
+    def install(self, docs_url: Optional[str] = "/docs", redoc_url: Optional[str] = "/redoc") -> "OpenAPICache":
+        """Registrera schemat och docs-sidorna - skapa appen med openapi_url/docs_url/redoc_url=None"""
+        self.app.add_route(self.openapi_url, self.openapi_endpoint, include_in_schema=False)
+        if docs_url:
+            self.app.add_route(docs_url, self.swagger_ui_endpoint, include_in_schema=False)
+            if self.app.swagger_ui_oauth2_redirect_url:
+                self.app.add_route(self.app.swagger_ui_oauth2_redirect_url, self.swagger_ui_redirect_endpoint,
+                                   include_in_schema=False)
+        if redoc_url:
+            self.app.add_route(redoc_url, self.redoc_endpoint, include_in_schema=False)
+        return self
@@ -0,0 +1,176 @@
+"""
+Samplande profilerare - stackar i collapsed-format (flamegraph.pl, speedscope)
+"""
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Callable, Dict, Optional, Set
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ProfilerBusyError(Exception):
+    """En profilering pågår redan"""
+
+
+class StackSampler:
+    """Tråd som läser alla trådars stackar med jämna mellanrum"""
+
+    def __init__(self,
+                 interval: float = 0.005,
+                 thread_ids: Optional[Set[int]] = None,
+                 should_sample: Optional[Callable[[], bool]] = None):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.should_sample = should_sample
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._labels: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = (
+                f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+        return label
+
+    def _collapse(self, frame: Optional[FrameType]) -> str:
+        names = []
+        while frame is not None:
+            names.append(self._label(frame.f_code))
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            if self.should_sample is not None and not self.should_sample():
+                continue
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                stack = self._collapse(frame)
+                self.stacks[f"{names.get(thread_id, thread_id)};{stack}"] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """En rad per unik stack: 'rot;...;löv antal'"""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+class Profiler:
+    """Kör en profilering i taget - antingen i N sekunder eller för de K nästa matchande requests"""
+
+    def __init__(self):
+        self.busy = False
+        # Sätts bara medan request-läget är aktivt, så middlewaren gör en enda kontroll annars
+        self.path_prefix: Optional[str] = None
+        self._remaining = 0
+        self._active = 0
+        self._done: Optional[asyncio.Event] = None
+
+    def _acquire(self) -> None:
+        if self.busy:
+            raise ProfilerBusyError("En profilering pågår redan")
+        self.busy = True
+
+    async def profile_for(self, seconds: float, interval: float = 0.005) -> StackSampler:
+        """Sampla alla trådar i processen under en given tid"""
+        self._acquire()
+        sampler = StackSampler(interval)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+            self.busy = False
+        return sampler
+
+    async def profile_requests(self, path_prefix: str, count: int, timeout: float,
+                               interval: float = 0.002) -> StackSampler:
+        """Sampla event loop-tråden medan någon av de K nästa matchande requests pågår"""
+        self._acquire()
+        self._remaining = count
+        self._active = 0
+        self._done = asyncio.Event()
+        sampler = StackSampler(
+            interval,
+            thread_ids={threading.get_ident()},
+            should_sample=lambda: self._active > 0,
+        )
+        sampler.start()
+        self.path_prefix = path_prefix
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.path_prefix = None
+            sampler.stop()
+            self.busy = False
+        return sampler
+
+    def claim(self) -> bool:
+        """Ta en plats bland de K requests som ska profileras"""
+        if self._remaining <= 0:
+            return False
+        self._remaining -= 1
+        self._active += 1
+        return True
+
+    def release(self) -> None:
+        self._active -= 1
+        if self._remaining <= 0 and self._active == 0 and self._done is not None:
+            self._done.set()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "busy": self.busy,
+            "path_prefix": self.path_prefix,
+            "remaining": self._remaining if self.path_prefix else 0,
+        }
+
+
+class ProfilerMiddleware:
+    """Markerar requests som ska profileras i request-läget"""
+
+    def __init__(self, app: ASGIApp, request_profiler: Optional[Profiler] = None):
+        self.app = app
+        self.profiler = request_profiler or profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        prefix = self.profiler.path_prefix
+        if (prefix is None or scope["type"] != "http" or not scope["path"].startswith(prefix)
+                or not self.profiler.claim()):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.release()
+
+
+# Delad profilerare för hela appen
+profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """FastAPI-dependency för profileraren"""
+    return profiler
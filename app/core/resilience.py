@@ -0,0 +1,140 @@
+"""
+Skydd för upstream-anrop - circuit breaker och begränsad samtidighet
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Union
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Numeriskt värde per tillstånd (för metrics)
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class LimiterTimeoutError(Exception):
+    """Ingen ledig plats i limitern inom väntetiden"""
+
+
+class CircuitBreaker:
+    """Circuit breaker med half-open-prober"""
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 half_open_max_calls: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probes = 0
+
+    def retry_after(self) -> float:
+        """Sekunder tills kretsen släpper igenom en prob"""
+        if self.state != OPEN:
+            return 0.0
+        return max(self.reset_timeout - (self._clock() - self.opened_at), 0.0)
+
+    def is_rejecting(self) -> bool:
+        """Sant om kretsen är öppen och ännu inte redo för en prob"""
+        return self.state == OPEN and self.retry_after() > 0
+
+    def allow(self) -> bool:
+        """Avgör om ett anrop får gå till upstream"""
+        if self.state == OPEN:
+            if self.retry_after() > 0:
+                self.rejected += 1
+                return False
+            self.state = HALF_OPEN
+            self._probes = 0
+        if self.state == HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                self.rejected += 1
+                return False
+            self._probes += 1
+        return True
+
+    def record_success(self) -> None:
+        """Registrera lyckat anrop"""
+        self.failures = 0
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+
+    def record_failure(self) -> None:
+        """Registrera misslyckat anrop"""
+        if self.state == HALF_OPEN:
+            self._open()
+            return
+        self.failures += 1
+        if self.state == CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def record_ignored(self) -> None:
+        """Anropet avbröts av annat skäl än upstream - släpp proben utan att påverka tillståndet"""
+        if self.state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = self._clock()
+        self.times_opened += 1
+
+    def stats(self) -> Dict[str, Union[str, int, float]]:
+        """Tillstånd och räknare"""
+        return {
+            "state": self.state,
+            "state_value": STATE_VALUES[self.state],
+            "failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after": round(self.retry_after(), 3),
+        }
+
+
+class ConcurrencyLimiter:
+    """Begränsar antalet samtidiga anrop mot en upstream, med begränsad väntetid"""
+
+    def __init__(self, max_concurrency: int = 20, queue_timeout: float = 1.0):
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_use = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Reservera en plats, LimiterTimeoutError om kön inte rör sig i tid"""
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise LimiterTimeoutError(
+                f"Ingen ledig upstream-plats inom {self.queue_timeout} s"
+            ) from None
+        finally:
+            self.waiting -= 1
+        self.in_use += 1
+        try:
+            yield
+        finally:
+            self.in_use -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Beläggning och räknare"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,48 @@
+"""
+Single-flight - samtidiga anrop med samma nyckel delar ett upstream-anrop
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Slår ihop samtidiga anrop med samma nyckel till ett enda anrop och delar resultatet"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Kör fn för nyckeln, eller vänta på ett redan pågående anrop med samma nyckel"""
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            # Eget task så att en avbruten anropare inte avbryter de andra
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Markera felet som hämtat även om ingen väntar kvar
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """Räknare för sammanslagna anrop"""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
@@ -0,0 +1,89 @@
+"""
+Strömningshjälpare för artefakt-upload - checksummor och multipart utan buffring
+"""
+import hashlib
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+
+class ChecksumMismatchError(Exception):
+    """Uppladdat innehåll matchar inte angiven checksumma"""
+
+
+class ChecksumStream:
+    """Räknar checksummor och storlek medan en byte-ström passerar igenom"""
+
+    def __init__(self, chunks: AsyncIterator[bytes], expected_sha256: Optional[str] = None):
+        self._chunks = chunks
+        self._expected_sha256 = expected_sha256.lower() if expected_sha256 else None
+        self._sha256 = hashlib.sha256()
+        self._sha1 = hashlib.sha1()
+        self._md5 = hashlib.md5()
+        self.size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._chunks:
+            if not chunk:
+                continue
+            self._sha256.update(chunk)
+            self._sha1.update(chunk)
+            self._md5.update(chunk)
+            self.size += len(chunk)
+            yield chunk
+
+        # Kontrollera innan strömmen avslutas så att mottagaren aldrig får en komplett fil
+        if self._expected_sha256 and self._sha256.hexdigest() != self._expected_sha256:
+            raise ChecksumMismatchError(
+                f"SHA-256 matchar inte: förväntade {self._expected_sha256}, fick {self._sha256.hexdigest()}"
+            )
+
+    @property
+    def checksums(self) -> Dict[str, str]:
+        """Checksummor för det som hittills passerat"""
+        return {
+            "sha256": self._sha256.hexdigest(),
+            "sha1": self._sha1.hexdigest(),
+            "md5": self._md5.hexdigest(),
+        }
+
+
+class MultipartStream:
+    """Bygger en multipart/form-data-body runt en byte-ström utan att buffra filen"""
+
+    def __init__(self,
+                 file_field: str,
+                 filename: str,
+                 chunks: AsyncIterator[bytes],
+                 fields: Optional[List[Tuple[str, str]]] = None,
+                 file_content_type: str = "application/octet-stream"):
+        self.boundary = uuid.uuid4().hex
+        self._chunks = chunks
+
+        head = b""
+        for name, value in fields or []:
+            head += (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode("utf-8")
+        head += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {file_content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._head = head
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def content_length(self, payload_length: int) -> int:
+        """Total body-längd givet filens längd"""
+        return len(self._head) + payload_length + len(self._tail)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        async for chunk in self._chunks:
+            yield chunk
+        yield self._tail
@@ -0,0 +1,157 @@
+"""
+Tidsmätning per fas i en request - Server-Timing-header och histogram per route och fas
+"""
+import asyncio
+import functools
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from .metrics import Histogram, registry
+from .tracing import KIND_CLIENT, KIND_INTERNAL, current_span, end_span, start_span
+
+# Server-Timing-header - läses en gång vid start som appens övriga flaggor
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+
+# Faser i den ordning de redovisas. store och upstream ligger inuti handler.
+PHASES = ("validation", "handler", "store", "upstream", "serialize")
+
+phase_duration = registry.histogram(
+    "request_phase_seconds",
+    "Tid per fas (validation, handler, store, upstream, serialize) per route",
+    ("route", "phase"),
+)
+
+
+class PhaseTimer:
+    """Ackumulerad tid per fas för en request"""
+
+    __slots__ = ("phases", "active", "handler_start", "handler_end")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.active: Dict[str, int] = {}
+        self.handler_start: Optional[float] = None
+        self.handler_end: Optional[float] = None
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def header(self, total: float) -> str:
+        """Server-Timing-värde i millisekunder"""
+        parts = [f"{name};dur={self.phases[name] * 1000:.3f}" for name in PHASES if name in self.phases]
+        parts.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[PhaseTimer]] = ContextVar("phase_timer", default=None)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Mät tiden för ett block och tracea det som span - nästlade block i samma fas räknas en gång"""
+    parent = current_span()
+    span = None
+    if parent is None or parent.name != name:
+        span = start_span(name, KIND_CLIENT if name == "upstream" else KIND_INTERNAL)
+    timer = _current.get()
+    depth = 0
+    if timer is not None:
+        depth = timer.active.get(name, 0)
+        timer.active[name] = depth + 1
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        end_span(span, e)
+        span = None
+        raise
+    finally:
+        end_span(span)
+        if timer is not None:
+            timer.active[name] = depth
+            if depth == 0:
+                timer.add(name, time.perf_counter() - start)
+
+
+def _timed_call(call: Callable[..., Any]) -> Callable[..., Any]:
+    """Markera när endpoint-funktionen startar och slutar, och tracea den som span"""
+    if asyncio.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            timer = _current.get()
+            span = start_span("handler")
+            if timer is not None:
+                timer.handler_start = time.perf_counter()
+            try:
+                return await call(*args, **kwargs)
+            except BaseException as e:
+                end_span(span, e)
+                span = None
+                raise
+            finally:
+                end_span(span)
+                if timer is not None:
+                    timer.handler_end = time.perf_counter()
+        return async_wrapper
+
+    @functools.wraps(call)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        timer = _current.get()
+        span = start_span("handler")
+        if timer is not None:
+            timer.handler_start = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        except BaseException as e:
+            end_span(span, e)
+            span = None
+            raise
+        finally:
+            end_span(span)
+            if timer is not None:
+                timer.handler_end = time.perf_counter()
+    return sync_wrapper
+
+
+class TimedRoute(APIRoute):
+    """APIRoute som delar upp tiden i validering, handler och serialisering"""
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        if self.dependant.call is not None and not getattr(self.dependant.call, "_phase_timed", False):
+            self.dependant.call = _timed_call(self.dependant.call)
+            self.dependant.call._phase_timed = True
+        handler = super().get_route_handler()
+        histograms: Dict[str, Histogram] = {}
+
+        async def timed_handler(request: Request) -> Response:
+            timer = PhaseTimer()
+            token = _current.set(timer)
+            start = time.perf_counter()
+            try:
+                response = await handler(request)
+            finally:
+                _current.reset(token)
+            end = time.perf_counter()
+
+            if timer.handler_start is not None:
+                # Allt före endpoint-funktionen är body-läsning, dependencies och validering,
+                # allt efter är response_model-validering och JSON-kodning
+                timer.add("validation", timer.handler_start - start)
+                timer.add("handler", timer.handler_end - timer.handler_start)
+                timer.add("serialize", end - timer.handler_end)
+            for name, seconds in timer.phases.items():
+                histogram = histograms.get(name)
+                if histogram is None:
+                    histogram = histograms[name] = phase_duration.labels(self.path, name)
+                histogram.observe(seconds)
+            if SERVER_TIMING_ENABLED:
+                response.headers["Server-Timing"] = timer.header(end - start)
+            return response
+
+        return timed_handler
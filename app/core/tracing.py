@@ -0,0 +1,302 @@
+"""
+Lättviktig tracing med W3C traceparent - spans exporteras i batchar som OTLP/JSON till fil eller collector
+"""
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import registry, route_template
+
+logger = logging.getLogger(__name__)
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_ZERO_TRACE_ID = "0" * 32
+_ZERO_SPAN_ID = "0" * 16
+
+# OTLP span kinds
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+
+class Span:
+    """En span - sparas bara (recording) när tracen är samplad"""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "sampled",
+                 "start_ns", "end_ns", "attributes", "error", "tracer")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], sampled: bool,
+                 kind: int = KIND_INTERNAL, span_tracer: Optional["Tracer"] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        # Tracern som skapade rot-spanen - barn-spans exporteras via samma
+        self.tracer = span_tracer
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """(trace-id, parent-id, samplad) ur en traceparent-header, None om den är ogiltig"""
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, parent_id, flags = match.groups()
+    if version == "ff" or trace_id == _ZERO_TRACE_ID or parent_id == _ZERO_SPAN_ID:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def start_span(name: str, kind: int = KIND_INTERNAL) -> Optional[Tuple[Span, Token]]:
+    """Starta en barn-span till den aktuella - None (och ingen kostnad) utan samplad trace"""
+    parent = _current_span.get()
+    if parent is None or not parent.sampled:
+        return None
+    span = Span(name, parent.trace_id, parent.span_id, True, kind, parent.tracer)
+    return span, _current_span.set(span)
+
+
+def end_span(handle: Optional[Tuple[Span, Token]], error: Optional[BaseException] = None) -> None:
+    if handle is None:
+        return
+    span, token = handle
+    _current_span.reset(token)
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+    (span.tracer or tracer).finish(span)
+
+
+class SpanExporter:
+    """Bakgrundstråd som skickar färdiga spans i batchar som OTLP/JSON"""
+
+    def __init__(self,
+                 file_path: Optional[str] = None,
+                 endpoint: Optional[str] = None,
+                 service_name: Optional[str] = None,
+                 max_queue: int = 10000,
+                 batch_size: int = 512,
+                 flush_interval: float = 2.0):
+        self.file_path = file_path if file_path is not None else os.getenv("TRACING_FILE")
+        self.endpoint = endpoint if endpoint is not None else os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+        self.service_name = service_name or os.getenv("OTEL_SERVICE_NAME", "nexus-api")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.exported = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._send(self.payload(batch))
+                self.exported += len(batch)
+            except Exception as e:
+                self.dropped += len(batch)
+                logger.warning("Kunde inte exportera %d spans: %s", len(batch), e)
+
+    def payload(self, spans: List[Span]) -> Dict[str, Any]:
+        """ExportTraceServiceRequest i OTLP/JSON"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "nexus_repository_api"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+
+    def _send(self, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, separators=(",", ":"))
+        if self.endpoint:
+            import httpx
+            response = httpx.post(
+                self.endpoint.rstrip("/") + "/v1/traces",
+                content=body,
+                headers={"Content-Type": "application/json"},
+                timeout=10.0,
+            )
+            response.raise_for_status()
+        if self.file_path:
+            # En batch per rad - samma format som collectorns otlpjsonfile-receiver läser
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(body + "\n")
+
+    def collect(self):
+        return [
+            ("trace_spans_total", "counter", "Spans som exporterats eller tappats", [
+                ({"result": "exported"}, self.exported),
+                ({"result": "dropped"}, self.dropped),
+            ]),
+        ]
+
+
+class Tracer:
+    """Skapar rot-spans för inkommande requests med konfigurerbar sampling"""
+
+    def __init__(self, sample_rate: Optional[float] = None, exporter: Optional[SpanExporter] = None):
+        self.sample_rate = sample_rate if sample_rate is not None else float(
+            os.getenv("TRACING_SAMPLE_RATE", "0.01")
+        )
+        self.exporter = exporter or SpanExporter()
+
+    def start_request(self, name: str, traceparent: Optional[str]) -> Span:
+        """Fortsätt en inkommande trace (förälderns sampling gäller) eller starta en ny"""
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = "%032x" % random.getrandbits(128), None
+            sampled = random.random() < self.sample_rate
+        return Span(name, trace_id, parent_id, sampled, KIND_SERVER, self)
+
+    def finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        if span.sampled:
+            self.exporter.export(span)
+
+
+class TracingMiddleware:
+    """ASGI-middleware som skapar en server-span per request"""
+
+    def __init__(self, app: ASGIApp, request_tracer: Optional[Tracer] = None):
+        self.app = app
+        self.tracer = request_tracer or tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+        span = self.tracer.start_request(scope["method"], traceparent)
+        token = _current_span.set(span)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            if span.sampled:
+                route = route_template(scope)
+                span.name = f"{scope['method']} {route}"
+                span.attributes.update({
+                    "http.method": scope["method"],
+                    "http.route": route,
+                    "http.target": scope["path"],
+                    "http.status_code": status_code,
+                })
+                if status_code >= 500 and span.error is None:
+                    span.error = f"HTTP {status_code}"
+            self.tracer.finish(span)
+
+
+async def inject_traceparent(request) -> None:
+    """httpx event hook - skicka vidare trace-kontexten till Nexus"""
+    span = _current_span.get()
+    if span is None:
+        return
+    request.headers["traceparent"] = span.traceparent
+    if span.sampled:
+        span.attributes["http.method"] = request.method
+        span.attributes["http.url"] = str(request.url.copy_with(query=None))
+
+
+# Delad tracer för hela appen
+tracer = Tracer()
+registry.register_collector(tracer.exporter.collect)
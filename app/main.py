@@ -1,18 +1,63 @@
 """
 Nexus Repository Manager API - Huvudapplikation
 """
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import repository, packages, system
+from .api.v1 import admin, models, repository, packages, system, jobs
+from .core.access_log import AccessLogMiddleware, access_log_writer
+from .core.admission import AdmissionControlMiddleware
+from .core.blob_cache import blob_cache
+from .core.docs_assets import docs_assets
+from .core.jobs import job_manager
+from .core.loop_monitor import loop_monitor
+from .core.metrics import MetricsMiddleware, metrics_endpoint, registry
+from .core.nexus_client import nexus_client
+from .core.openapi_cache import OpenAPICache
+from .core.profiler import ProfilerMiddleware
+from .core.resilience import STATE_VALUES
+from .core.tracing import TracingMiddleware, tracer
+
+# Strukturerad access-logg i JSON (ersätter uvicorns synkrona access-logg)
+ACCESS_LOG_ENABLED = os.getenv("ACCESS_LOG_ENABLED", "true").lower() == "true"
+
+# Tracing med W3C traceparent - spans exporteras till TRACING_FILE och/eller OTEL_EXPORTER_OTLP_ENDPOINT
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Starta och stäng appens bakgrundsresurser"""
+    if ACCESS_LOG_ENABLED:
+        access_log_writer.start()
+    if TRACING_ENABLED:
+        tracer.exporter.start()
+    await loop_monitor.start()
+    await job_manager.start()
+    # Schemat, docs-sidorna och deras JS/CSS förberäknas så att första /docs efter en utrullning inte är långsammare
+    docs_assets.load()
+    openapi_cache.build()
+    yield
+    await job_manager.stop()
+    await loop_monitor.stop()
+    # Töm access-loggens och tracingens köer innan processen avslutas
+    access_log_writer.stop()
+    tracer.exporter.stop()
+    # Stäng connection pool mot Nexus
+    await nexus_client.aclose()
+
 
 # Skapa FastAPI-instans med taggrupper
 app = FastAPI(
     title="Nexus Repository Manager API",
     description="En FastAPI-applikation för att hantera Nexus Repository Manager",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/api/openapi.json",
+    # Schema och docs serveras förberäknade via OpenAPICache nedan
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    lifespan=lifespan,
     tags_metadata=[
         {
             "name": "repository",
@@ -22,6 +67,10 @@ app = FastAPI(
             "name": "packages",
             "description": "Operations för att hantera paket - ladda upp, hämta, söka och hantera paket i repositories",
         },
+        {
+            "name": "jobs",
+            "description": "Bakgrundsjobb för långa repository-operationer - skapa, indexera om och synka",
+        },
         {
             "name": "överigt",
             "description": "Systeminformation, statistik, konfiguration och utvecklingsverktyg",
@@ -29,6 +78,15 @@ app = FastAPI(
     ]
 )
 
+# Admission control - token buckets per klient och globalt (health-endpoints undantas)
+if os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true":
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Profilering via /api/admin - av som standard, och då finns varken endpoints eller middleware
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+if PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -38,17 +96,97 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
+if ACCESS_LOG_ENABLED:
+    app.add_middleware(AccessLogMiddleware)
+
+# Metrics ytterst så att även avvisade requests (429) räknas
+app.add_middleware(MetricsMiddleware)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+
+def collect_app_metrics():
+    """Gauges som läses av vid varje scrape"""
+    cache = blob_cache.stats()
+    upstream = nexus_client.stats()
+    breaker = upstream["circuit_breaker"]
+    limiter = upstream["limiter"]
+    singleflight = upstream["singleflight"]
+    job_stats = job_manager.stats()
+    families = [
+        ("repositories", "gauge", "Antal repositories i lagret", [({}, len(models.repositories))]),
+        ("packages", "gauge", "Antal paket i lagret", [({}, len(models.packages))]),
+        ("cache_entries", "gauge", "Antal poster per cache", [
+            ({"cache": "blob_keys"}, cache["keys"]),
+            ({"cache": "blobs"}, cache["blobs"]),
+            ({"cache": "upstream_json"}, upstream["json_cache_entries"]),
+        ]),
+        ("blob_cache_bytes", "gauge", "Bytes i artefaktcachen", [({}, cache["bytes"])]),
+        ("blob_cache_events_total", "counter", "Träffar, missar och evictions i artefaktcachen", [
+            ({"event": event}, cache[event]) for event in ("hits", "misses", "evictions")
+        ]),
+        ("upstream_pool", "gauge", "Beläggning i poolen mot Nexus", [
+            ({"kind": kind}, limiter[kind]) for kind in ("max_concurrency", "in_use", "waiting")
+        ]),
+        ("upstream_pool_rejected_total", "counter", "Anrop som inte fick plats i poolen", [({}, limiter["rejected"])]),
+        ("circuit_breaker_state", "gauge",
+         "Circuit breaker mot Nexus (" + ", ".join(f"{value}={state}" for state, value in STATE_VALUES.items()) + ")",
+         [({}, breaker["state_value"])]),
+        ("circuit_breaker_rejected_total", "counter", "Anrop som stoppats av circuit breakern", [({}, breaker["rejected"])]),
+        ("singleflight_total", "counter", "Upstream-anrop som ledare eller sammanslagna", [
+            ({"role": "leader"}, singleflight["leaders"]),
+            ({"role": "coalesced"}, singleflight["coalesced"]),
+        ]),
+        ("singleflight_in_flight", "gauge", "Pågående sammanslagna anrop", [({}, singleflight["in_flight"])]),
+        ("jobs", "gauge", "Antal jobb per status", [
+            ({"status": status}, job_stats[status]) for status in ("queued", "running", "succeeded", "failed")
+        ]),
+        ("job_queue_size", "gauge", "Jobb som väntar i kön", [({}, job_stats["queue_size"])]),
+    ]
+    admission = [instance.stats() for instance in AdmissionControlMiddleware.instances]
+    if admission:
+        families.append(("admission_total", "counter", "Requests insläppta eller avvisade av admission control", [
+            ({"decision": decision}, sum(stats[decision] for stats in admission))
+            for decision in ("admitted", "rejected_client", "rejected_global")
+        ]))
+    return families
+
+
+registry.register_collector(collect_app_metrics)
+
 # Inkludera API routers
 app.include_router(system.router)
 app.include_router(repository.router)
 app.include_router(packages.router)
+app.include_router(jobs.router)
+if PROFILER_ENABLED:
+    app.include_router(admin.router)
 
-if __name__ == "__main__":
+# OpenAPI-schema med stark ETag och gzip, Swagger UI på /docs och ReDoc på /redoc
+# med JS/CSS från paketet i stället för CDN
+openapi_cache = OpenAPICache(
+    app,
+    "/api/openapi.json",
+    swagger_ui_kwargs=docs_assets.swagger_ui_kwargs,
+    redoc_kwargs=docs_assets.redoc_kwargs,
+).install(docs_url="/docs", redoc_url="/redoc")
+app.add_route(f"{docs_assets.url_path}/{{name}}", docs_assets.endpoint, include_in_schema=False)
+
+
+def run_server(host: str = "0.0.0.0", port: int = 3000, reload: bool = False, log_level: str = "info"):
+    """Starta API-servern med uvicorn"""
     import uvicorn
     uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=3000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+        f"{__package__}.main:app",
+        host=host,
+        port=port,
+        reload=reload,
+        log_level=log_level,
+        access_log=not ACCESS_LOG_ENABLED,
+    )
+
+
+if __name__ == "__main__":
+    run_server(reload=True)
\ No newline at end of file
@@ -38,23 +38,24 @@ def copy_app_files():
         else:
             print(f"Warning: Source file {src_file} does not exist")
     
-    # Copy api/ directory
-    api_src_dir = os.path.join(app_dir, 'api')
-    api_dst_dir = os.path.join(package_dir, 'api')
-    
-    if os.path.exists(api_src_dir):
-        try:
-            # Remove existing api directory if it exists
-            if os.path.exists(api_dst_dir):
-                shutil.rmtree(api_dst_dir)
-            
-            # Copy the entire api directory
-            shutil.copytree(api_src_dir, api_dst_dir)
-            print(f"Copied api/ directory")
-        except Exception as e:
-            print(f"Warning: Could not copy api/ directory: {e}")
-    else:
-        print(f"Warning: Source directory {api_src_dir} does not exist")
+    # Copy package directories (api/, core/, static/ with the self-hosted docs assets)
+    for dirname in ['api', 'core', 'static']:
+        dir_src = os.path.join(app_dir, dirname)
+        dir_dst = os.path.join(package_dir, dirname)
+
+        if os.path.exists(dir_src):
+            try:
+                # Remove existing directory if it exists
+                if os.path.exists(dir_dst):
+                    shutil.rmtree(dir_dst)
+
+                # Copy the entire directory
+                shutil.copytree(dir_src, dir_dst)
+                print(f"Copied {dirname}/ directory")
+            except Exception as e:
+                print(f"Warning: Could not copy {dirname}/ directory: {e}")
+        else:
+            print(f"Warning: Source directory {dir_src} does not exist")
 
 # Copy app files before setup
 copy_app_files()
@@ -80,7 +81,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     package_data={
-        "nexus_repository_api": ["*.txt", "*.md", "*.yaml", "*.yml"],
+        "nexus_repository_api": ["*.txt", "*.md", "*.yaml", "*.yml", "static/docs/*"],
     },
     python_requires=">=3.8",
     install_requires=requirements,
@@ -0,0 +1,75 @@
+"""
+Tester för den strukturerade access-loggen
+"""
+
+import io
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nexus_repository_api.core.access_log import AccessLogMiddleware, AccessLogWriter
+
+
+def make_client(writer: AccessLogWriter) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/packages/{package_name}")
+    async def get_package(package_name: str):
+        return {"name": package_name}
+
+    app.add_middleware(AccessLogMiddleware, writer=writer)
+    return TestClient(app)
+
+
+def read_records(stream: io.StringIO) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_access_log_writes_json_records():
+    """Testa att en post skrivs med route-mall, latens, storlek och request-id"""
+    stream = io.StringIO()
+    writer = AccessLogWriter(stream=stream, flush_interval=0.01)
+    writer.start()
+    response = make_client(writer).get("/api/packages/requests", headers={"X-Request-ID": "abc-123"})
+    writer.stop()
+
+    assert response.headers["x-request-id"] == "abc-123"
+    [record] = read_records(stream)
+    assert record["type"] == "access"
+    assert record["request_id"] == "abc-123"
+    assert record["method"] == "GET"
+    assert record["path"] == "/api/packages/requests"
+    assert record["route"] == "/api/packages/{package_name}"
+    assert record["status"] == 200
+    assert record["response_bytes"] == len(response.content)
+    assert record["latency_ms"] >= 0
+    assert writer.stats() == {"queued": 0, "written": 1, "dropped": 0}
+
+
+def test_access_log_generates_request_id():
+    """Testa att ett request-id skapas när klienten inte skickar något"""
+    stream = io.StringIO()
+    writer = AccessLogWriter(stream=stream, flush_interval=0.01)
+    writer.start()
+    client = make_client(writer)
+    first = client.get("/api/packages/a").headers["x-request-id"]
+    second = client.get("/api/packages/b").headers["x-request-id"]
+    writer.stop()
+
+    assert first and second and first != second
+    assert [record["request_id"] for record in read_records(stream)] == [first, second]
+
+
+def test_access_log_drops_records_when_queue_is_full():
+    """Testa att en full kö tappar och räknar poster i stället för att blockera"""
+    stream = io.StringIO()
+    writer = AccessLogWriter(stream=stream, max_queue=2, flush_interval=0.01)
+    client = make_client(writer)
+    for _ in range(5):
+        assert client.get("/api/packages/x").status_code == 200
+    assert writer.stats()["dropped"] == 3
+
+    writer.start()
+    writer.stop()
+    assert len(read_records(stream)) == 2
+    assert writer.stats() == {"queued": 0, "written": 2, "dropped": 3}
@@ -0,0 +1,90 @@
+"""
+Tester för admission control (token buckets)
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nexus_repository_api.core.admission import AdmissionControlMiddleware, TokenBucket
+
+
+def make_client(**kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.post("/api/packages/")
+    async def upload():
+        return {"ok": True}
+
+    app.add_middleware(AdmissionControlMiddleware, **kwargs)
+    return TestClient(app)
+
+
+def test_token_bucket_refills_over_time():
+    """Testa påfyllning och väntetid"""
+    bucket = TokenBucket(rate=10, capacity=2, now=0.0)
+    assert bucket.take(0.0) == 0.0
+    assert bucket.take(0.0) == 0.0
+    assert bucket.take(0.0) == 0.1
+    assert bucket.take(0.1) == 0.0
+
+
+def test_client_over_budget_gets_429_with_retry_after():
+    """Testa att en klient som överskrider sin budget får 429"""
+    client = make_client(client_rate=0.5, client_burst=3, global_rate=1000, global_burst=1000)
+    headers = {"X-Forwarded-For": "10.0.0.1, 10.0.0.2"}
+    statuses = [client.post("/api/packages/", headers=headers).status_code for _ in range(5)]
+    assert statuses == [200, 200, 200, 429, 429]
+
+    response = client.post("/api/packages/", headers=headers)
+    assert response.headers["retry-after"] == "2"
+    assert response.json()["detail"] == "För många förfrågningar"
+
+    # En annan klient påverkas inte
+    assert client.post("/api/packages/", headers={"X-Forwarded-For": "10.0.0.9"}).status_code == 200
+
+
+def test_consumer_id_identifies_client():
+    """Testa att konsument-id från Kong används före IP"""
+    client = make_client(client_rate=0.1, client_burst=1, global_rate=1000, global_burst=1000)
+    same_ip = {"X-Real-IP": "10.0.0.1"}
+    assert client.post("/api/packages/", headers={**same_ip, "X-Consumer-ID": "ci-a"}).status_code == 200
+    assert client.post("/api/packages/", headers={**same_ip, "X-Consumer-ID": "ci-b"}).status_code == 200
+    assert client.post("/api/packages/", headers={**same_ip, "X-Consumer-ID": "ci-a"}).status_code == 429
+
+
+def test_spoofed_headers_do_not_escape_the_limit():
+    """Testa att roterade nycklar och förfalskade X-Forwarded-For-poster ger samma bucket"""
+    client = make_client(client_rate=0.1, client_burst=2, global_rate=1000, global_burst=1000)
+    # Kong lägger peer-adressen (10.0.0.1) sist - allt före den kommer från klienten
+    statuses = [
+        client.post("/api/packages/", headers={
+            "X-Forwarded-For": f"192.0.2.{i}, 10.0.0.1",
+            "apikey": f"rotated-{i}",
+            "X-API-Key": f"rotated-{i}",
+        }).status_code
+        for i in range(4)
+    ]
+    assert statuses == [200, 200, 429, 429]
+
+    # X-Real-IP från Kong väger tyngre än X-Forwarded-For
+    headers = {"X-Real-IP": "10.0.0.5", "X-Forwarded-For": "192.0.2.99, 10.0.0.5"}
+    assert [client.post("/api/packages/", headers=headers).status_code for _ in range(3)] == [200, 200, 429]
+
+
+def test_global_bucket_limits_all_clients():
+    """Testa den globala budgeten"""
+    client = make_client(client_rate=100, client_burst=100, global_rate=0.1, global_burst=2)
+    statuses = [
+        client.post("/api/packages/", headers={"X-Forwarded-For": f"10.0.0.{i}"}).status_code
+        for i in range(4)
+    ]
+    assert statuses == [200, 200, 429, 429]
+
+
+def test_health_is_exempt():
+    """Testa att health-endpoints aldrig stryps"""
+    client = make_client(client_rate=0.1, client_burst=1, global_rate=0.1, global_burst=1)
+    assert all(client.get("/api/health").status_code == 200 for _ in range(10))
@@ -0,0 +1,135 @@
+"""
+Tester för artefakt-download via den lokala diskcachen
+"""
+
+import hashlib
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from nexus_repository_api.main import app
+from nexus_repository_api.core.blob_cache import BlobCache, get_blob_cache
+from nexus_repository_api.core.nexus_client import NexusClient, asset_path, get_nexus_client
+
+client = TestClient(app)
+CONTENT = bytes(range(256)) * 64
+URL = "/api/packages/download/pypi-hosted/packages/demo/demo-1.0-py3-none-any.whl"
+
+
+class FakeNexus:
+    """Stub som serverar assets och räknar anrop"""
+
+    def __init__(self):
+        self.calls = 0
+        self.assets = {"/repository/pypi-hosted/packages/demo/demo-1.0-py3-none-any.whl": CONTENT}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if request.url.path in self.assets:
+            return httpx.Response(200, content=self.assets[request.url.path])
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def fake_nexus(tmp_path):
+    """Koppla API:t mot stub-Nexus och en tom cache"""
+    fake = FakeNexus()
+    nexus = NexusClient(base_url="http://nexus.test", transport=httpx.MockTransport(fake.handler))
+    cache = BlobCache(directory=str(tmp_path), max_bytes=10 * len(CONTENT))
+    app.dependency_overrides[get_nexus_client] = lambda: nexus
+    app.dependency_overrides[get_blob_cache] = lambda: cache
+    yield fake
+    app.dependency_overrides.clear()
+
+
+def test_download_is_cached(fake_nexus):
+    """Testa att andra nedladdningen serveras från cachen"""
+    first = client.get(URL)
+    second = client.get(URL)
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content == CONTENT
+    assert first.headers["etag"] == f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+    assert fake_nexus.calls == 1
+
+
+def test_download_if_none_match(fake_nexus):
+    """Testa att matchande ETag ger 304 utan body"""
+    etag = client.get(URL).headers["etag"]
+    response = client.get(URL, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_download_range(fake_nexus):
+    """Testa Range-förfrågningar"""
+    response = client.get(URL, headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+    response = client.get(URL, headers={"Range": "bytes=-5"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[-5:]
+
+    response = client.get(URL, headers={"Range": f"bytes={len(CONTENT)}-"})
+    assert response.status_code == 416
+
+
+def test_download_missing_artifact(fake_nexus):
+    """Testa att saknad asset i Nexus ger 404"""
+    response = client.get("/api/packages/download/pypi-hosted/missing.whl")
+    assert response.status_code == 404
+    assert client.get("/api/packages/download/nonexistent/a.whl").status_code == 404
+
+
+@pytest.mark.parametrize("path", [
+    "%2E%2E/%2E%2E/service/rest/v1/security/users",
+    "packages/%2e%2e/%2e%2e/%2e%2e/service/rest/v1/security/users",
+    "packages/%2E/demo.whl",
+    "packages%252F..%252F..%252Fservice",
+    "packages/..%5C..%5Cservice",
+])
+def test_download_rejects_path_traversal(fake_nexus, path):
+    """Testa att sökvägar som kan lämna repositoryt stoppas innan Nexus anropas"""
+    response = client.get(f"/api/packages/download/pypi-hosted/{path}")
+    assert response.status_code == 400
+    assert fake_nexus.calls == 0
+
+
+def test_asset_path_stays_inside_repository():
+    """Testa att upstream-sökvägen alltid ligger under /repository/{repo}/"""
+    assert asset_path("pypi-hosted", "/packages/demo.whl") == "/repository/pypi-hosted/packages/demo.whl"
+    for repository, path in [("..", "service/rest/v1/status"), ("a/b", "x.whl"), ("pypi-hosted", ""),
+                             ("pypi-hosted", "a/../../x"), ("pypi-hosted", "a\\..\\x")]:
+        with pytest.raises(ValueError):
+            asset_path(repository, path)
+
+
+def test_download_route_is_in_openapi_schema(fake_nexus):
+    """Testa att schemat kan byggas med BlobResponse-routen och att HEAD inte dubbleras"""
+    app.openapi_schema = None
+    operations = app.openapi()["paths"]["/api/packages/download/{repository_name}/{path}"]
+    assert set(operations) == {"get"}
+    assert set(operations["get"]["responses"]) >= {"200", "206"}
+    response = client.head(URL)
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+async def test_cache_evicts_least_recently_used(tmp_path):
+    """Testa storleksbegränsad LRU-eviction"""
+    cache = BlobCache(directory=str(tmp_path), max_bytes=20)
+
+    async def chunks(data):
+        yield data
+
+    await cache.store("a", chunks(b"a" * 10))
+    await cache.store("b", chunks(b"b" * 10))
+    assert cache.lookup("a") is not None
+    await cache.store("c", chunks(b"c" * 10))
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") is not None
+    assert cache.lookup("c") is not None
+    assert cache.stats()["bytes"] == 20
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,110 @@
+"""
+Tester för strömmad artefakt-upload
+"""
+
+import hashlib
+import tracemalloc
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from nexus_repository_api.main import app
+from nexus_repository_api.api.v1.models import packages
+from nexus_repository_api.core.nexus_client import NexusClient, get_nexus_client
+from nexus_repository_api.core.streaming import ChecksumStream, MultipartStream
+
+client = TestClient(app)
+
+
+class FakeNexus:
+    """Stub för Nexus components API som sparar senaste uppladdningen"""
+
+    def __init__(self, status_code: int = 204):
+        self.status_code = status_code
+        self.requests = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        self.requests.append((request, body))
+        return httpx.Response(self.status_code)
+
+
+@pytest.fixture
+def fake_nexus():
+    """Koppla API:t mot en stub-Nexus"""
+    fake = FakeNexus()
+    nexus = NexusClient(base_url="http://nexus.test", transport=httpx.MockTransport(fake.handler))
+    app.dependency_overrides[get_nexus_client] = lambda: nexus
+    yield fake
+    app.dependency_overrides.clear()
+
+
+def test_upload_wheel_streams_to_nexus(fake_nexus):
+    """Testa att en wheel strömmas till Nexus med checksummor"""
+    content = b"wheel-bytes" * 1000
+    response = client.post(
+        "/api/packages/upload/pypi-hosted/demo_pkg-1.2.3-py3-none-any.whl",
+        content=content,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["package"]["name"] == "demo_pkg"
+    assert data["package"]["version"] == "1.2.3"
+    assert data["size"] == len(content)
+    assert data["checksums"]["sha256"] == hashlib.sha256(content).hexdigest()
+    assert any(pkg.name == "demo_pkg" for pkg in packages)
+
+    request, body = fake_nexus.requests[0]
+    assert request.url.params["repository"] == "pypi-hosted"
+    assert b'name="pypi.asset"; filename="demo_pkg-1.2.3-py3-none-any.whl"' in body
+    assert content in body
+    assert int(request.headers["content-length"]) == len(body)
+
+
+def test_upload_rpm_sends_filename_field(fake_nexus):
+    """Testa att yum-upload skickar filnamnsfältet"""
+    response = client.post("/api/packages/upload/rpm-hosted/tool-2.0-1.x86_64.rpm", content=b"rpm")
+    assert response.status_code == 200
+    assert response.json()["package"]["version"] == "2.0-1"
+    _, body = fake_nexus.requests[0]
+    assert b'name="yum.asset.filename"' in body
+
+
+def test_upload_rejects_checksum_mismatch(fake_nexus):
+    """Testa att felaktig checksumma avbryter uppladdningen"""
+    response = client.post(
+        "/api/packages/upload/apt-hosted/tool_1.0_amd64.deb",
+        content=b"deb",
+        headers={"X-Checksum-SHA256": "0" * 64},
+    )
+    assert response.status_code == 400
+    assert not fake_nexus.requests
+
+
+def test_upload_validation(fake_nexus):
+    """Testa validering av repository och filnamn"""
+    assert client.post("/api/packages/upload/nonexistent/a-1.0-py3-none-any.whl", content=b"x").status_code == 404
+    assert client.post("/api/packages/upload/docker-hosted/image.tar", content=b"x").status_code == 400
+    assert client.post("/api/packages/upload/pypi-hosted/tool_1.0_amd64.deb", content=b"x").status_code == 400
+
+
+async def test_streaming_upload_keeps_memory_flat():
+    """Testa att 64 MB passerar checksumma och multipart utan att buffras"""
+    chunk = b"\0" * 65536
+
+    async def chunks():
+        for _ in range(1024):
+            yield chunk
+
+    tracemalloc.start()
+    stream = ChecksumStream(chunks())
+    total = 0
+    async for part in MultipartStream("pypi.asset", "big-1.0-py3-none-any.whl", stream.__aiter__()):
+        total += len(part)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert stream.size == 1024 * len(chunk)
+    assert total > stream.size
+    assert peak < 4 * 1024 * 1024
@@ -0,0 +1,64 @@
+"""
+Tester för självhostade Swagger UI- och ReDoc-filer
+"""
+import gzip
+import time
+
+from fastapi.testclient import TestClient
+from nexus_repository_api.core.docs_assets import DocsAssets, docs_assets
+from nexus_repository_api.main import app
+
+
+def test_docs_pages_load_without_cdn():
+    """Testa att /docs och /redoc bara refererar till filer som appen själv serverar"""
+    client = TestClient(app)
+    assert docs_assets.available
+
+    swagger = client.get("/docs").text
+    redoc = client.get("/redoc").text
+    for page in (swagger, redoc):
+        assert "cdn.jsdelivr.net" not in page
+        assert "fonts.googleapis.com" not in page
+        assert "fastapi.tiangolo.com" not in page
+    assert 'src="static/docs/swagger-ui-bundle.js?v=' in swagger
+    assert 'href="static/docs/swagger-ui.css?v=' in swagger
+    assert 'src="static/docs/redoc.standalone.js?v=' in redoc
+
+
+def test_assets_are_precompressed_and_immutable():
+    """Testa att versionerade filer är oföränderliga och skickas gzippade"""
+    client = TestClient(app)
+    url = "/" + docs_assets.url("swagger-ui-bundle.js")
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    # text/ eller application/javascript beroende på plattformens mimetypes
+    assert "javascript" in response.headers["content-type"]
+    assert response.headers["content-type"].count("charset") <= 1
+    assert response.headers["content-encoding"] == "gzip"
+    asset = docs_assets.assets["swagger-ui-bundle.js"]
+    assert int(response.headers["content-length"]) == len(asset.gzipped) < len(asset.body) // 2
+    assert gzip.decompress(asset.gzipped) == asset.body
+
+    assert client.get(url, headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+    assert client.get("/static/docs/swagger-ui-bundle.js").headers["cache-control"] == "public, no-cache"
+    assert client.get("/static/docs/missing.js").status_code == 404
+
+
+def test_first_docs_load_is_fast():
+    """Testa att sidan och alla dess filer serveras på långt under en sekund efter uppstart"""
+    with TestClient(app) as client:
+        start = time.perf_counter()
+        assert client.get("/docs").status_code == 200
+        for name in ("swagger-ui-bundle.js", "swagger-ui.css", "favicon-32x32.png"):
+            assert client.get("/" + docs_assets.url(name)).status_code == 200
+        assert client.get(app.openapi_url or "/api/openapi.json").status_code == 200
+        assert time.perf_counter() - start < 0.5
+
+
+def test_missing_assets_fall_back_to_cdn_defaults(tmp_path):
+    """Testa att sidorna använder FastAPIs standardadresser om filerna saknas"""
+    assets = DocsAssets(directory=str(tmp_path / "missing"))
+    assert not assets.available
+    assert assets.swagger_ui_kwargs() == {}
+    assert assets.redoc_kwargs() == {}
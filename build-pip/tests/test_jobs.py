@@ -0,0 +1,196 @@
+"""
+Tester för bakgrundsjobb
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from nexus_repository_api.main import app
+from nexus_repository_api.api.v1.models import packages, repositories
+from nexus_repository_api.core import nexus_client as nexus_module
+from nexus_repository_api.core.jobs import FAILED, QUEUED, SUCCEEDED, JobManager
+from nexus_repository_api.core.nexus_client import NexusClient
+
+
+async def wait_for(manager: JobManager, job_id: str, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while manager.get(job_id).status in (QUEUED, "running"):
+        assert time.monotonic() < deadline, "jobbet blev aldrig klart"
+        await asyncio.sleep(0.01)
+    return manager.get(job_id)
+
+
+async def test_higher_priority_runs_first():
+    """Testa att högre prioritet körs först med en worker"""
+    manager = JobManager(workers=1, store_path="")
+    order = []
+
+    @manager.register("record")
+    async def record(context):
+        order.append(context.params["name"])
+
+    low = manager.submit("record", {"name": "låg"}, priority=0)
+    high = manager.submit("record", {"name": "hög"}, priority=10)
+    await manager.start()
+    await wait_for(manager, low.id)
+    await wait_for(manager, high.id)
+    await manager.stop()
+
+    assert order == ["hög", "låg"]
+
+
+async def test_worker_concurrency_is_bounded():
+    """Testa att högst workers jobb körs samtidigt"""
+    manager = JobManager(workers=2, store_path="")
+    active = {"now": 0, "max": 0}
+
+    @manager.register("sleep")
+    async def sleep(context):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+
+    await manager.start()
+    jobs = [manager.submit("sleep") for _ in range(6)]
+    for job in jobs:
+        await wait_for(manager, job.id)
+    await manager.stop()
+
+    assert active["max"] == 2
+
+
+async def test_failed_job_records_error():
+    """Testa att fel i en jobbhanterare sparas på jobbet"""
+    manager = JobManager(workers=1, store_path="")
+
+    @manager.register("boom")
+    async def boom(context):
+        context.set_progress(0.3, "halvvägs")
+        raise RuntimeError("gick sönder")
+
+    await manager.start()
+    job = await wait_for(manager, manager.submit("boom").id)
+    await manager.stop()
+
+    assert job.status == FAILED
+    assert job.error == "gick sönder"
+    assert job.message == "halvvägs"
+
+
+async def test_job_state_survives_restart(tmp_path):
+    """Testa att köade och avbrutna jobb körs efter omstart"""
+    store = str(tmp_path / "jobs.json")
+    first = JobManager(workers=1, store_path=store)
+    started = asyncio.Event()
+
+    @first.register("slow")
+    async def slow(context):
+        started.set()
+        await asyncio.sleep(10)
+
+    await first.start()
+    interrupted = first.submit("slow")
+    waiting = first.submit("slow")
+    await started.wait()
+    await first.stop()
+
+    second = JobManager(workers=1, store_path=store)
+
+    @second.register("slow")
+    async def fast(context):
+        return "klar"
+
+    await second.start()
+    assert (await wait_for(second, interrupted.id)).status == SUCCEEDED
+    assert (await wait_for(second, waiting.id)).result == "klar"
+    await second.stop()
+
+
+async def test_persistence_errors_do_not_stop_workers(tmp_path):
+    """Testa att ett lager som inte går att skriva inte dödar workern eller lämnar jobb i RUNNING"""
+    manager = JobManager(workers=1, store_path=str(tmp_path / "saknas" / "jobs.json"))
+
+    @manager.register("echo")
+    async def echo(context):
+        return context.params["value"]
+
+    await manager.start()
+    first = await wait_for(manager, manager.submit("echo", {"value": 1}).id)
+    second = await wait_for(manager, manager.submit("echo", {"value": 2}).id)
+    await manager.stop()
+
+    assert (first.status, first.result) == (SUCCEEDED, 1)
+    assert (second.status, second.result) == (SUCCEEDED, 2)
+
+
+def test_invalid_params_are_rejected_at_submit():
+    """Testa att parametrar kontrolleras vid submit i stället för att ge ett FAILED-jobb"""
+    manager = JobManager(workers=1, store_path="")
+
+    def validate(params):
+        if not isinstance(params.get("value"), int):
+            raise ValueError("value måste vara ett heltal")
+        return {"value": params["value"]}
+
+    @manager.register("echo", validate=validate)
+    async def echo(context):
+        return context.params["value"]
+
+    with pytest.raises(ValueError):
+        manager.submit("echo", {"value": "x"})
+    assert manager.jobs == {}
+    assert manager.submit("echo", {"value": 3, "extra": True}).params == {"value": 3}
+
+
+def test_jobs_api_creates_and_syncs_repository(monkeypatch):
+    """Testa jobb-API:t mot en stub-Nexus"""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.url.params.get("continuationToken")))
+        if request.url.path == "/service/rest/v1/components":
+            if request.url.params.get("continuationToken") is None:
+                return httpx.Response(200, json={"items": [{"name": "a", "version": "1.0"}], "continuationToken": "t1"})
+            return httpx.Response(200, json={"items": [{"name": "b", "version": "2.0"}], "continuationToken": None})
+        return httpx.Response(204)
+
+    nexus = NexusClient(base_url="http://nexus.test", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(nexus_module, "nexus_client", nexus)
+
+    with TestClient(app) as client:
+        response = client.post("/api/jobs/", json={"kind": "create_repository",
+                                                   "params": {"name": "job-repo", "format": "rpm"}})
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        for _ in range(200):
+            job = client.get(f"/api/jobs/{job_id}").json()
+            if job["status"] not in ("queued", "running"):
+                break
+            time.sleep(0.01)
+        assert job["status"] == "succeeded"
+        assert any(repo.name == "job-repo" for repo in repositories)
+        assert ("POST", "/service/rest/v1/repositories/yum/hosted", None) in seen
+
+        job_id = client.post("/api/jobs/", json={"kind": "sync_repository",
+                                                 "params": {"repository": "job-repo"}}).json()["id"]
+        for _ in range(200):
+            job = client.get(f"/api/jobs/{job_id}").json()
+            if job["status"] not in ("queued", "running"):
+                break
+            time.sleep(0.01)
+        assert job["result"] == {"repository": "job-repo", "packages": 2}
+        assert {pkg.name for pkg in packages if pkg.repository == "job-repo"} == {"a", "b"}
+
+        assert client.post("/api/jobs/", json={"kind": "okänd"}).status_code == 400
+        total = client.get("/api/jobs/stats").json()
+        for params in ({"name": "utan-format"}, {"name": "fel-format", "format": "maven"},
+                       {"name": "job-repo", "format": "rpm"}):
+            response = client.post("/api/jobs/", json={"kind": "create_repository", "params": params})
+            assert response.status_code == 400
+        assert client.post("/api/jobs/", json={"kind": "sync_repository", "params": {}}).status_code == 400
+        assert client.get("/api/jobs/stats").json() == total
+        assert client.get("/api/jobs/saknas").status_code == 404
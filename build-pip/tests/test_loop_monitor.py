@@ -0,0 +1,57 @@
+"""
+Tester för event loop-monitorn och vakthunden för blockerande anrop
+"""
+
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+from nexus_repository_api.core.loop_monitor import LoopLagMonitor
+from nexus_repository_api.main import app
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_monitor_records_lag_and_reports_blocking_stack():
+    """Testa att en blockerande funktion syns som fördröjning och i vakthundens stack"""
+    monitor = LoopLagMonitor(interval=0.01, block_threshold=0.05, watchdog=True)
+    count_before = monitor.histogram.count
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        block_the_loop(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert monitor.histogram.count > count_before
+    assert monitor.max_lag >= 0.2
+    assert monitor.blocked == 1
+    report = monitor.reports[0]
+    assert report["blocked_for"] >= 0.05
+    assert "block_the_loop" in report["stack"]
+
+
+async def test_watchdog_disabled_does_not_report():
+    """Testa att inga stackar samlas när vakthunden är avstängd"""
+    monitor = LoopLagMonitor(interval=0.01, block_threshold=0.05, watchdog=False)
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.02)
+        block_the_loop(0.1)
+        await asyncio.sleep(0.03)
+    finally:
+        await monitor.stop()
+    assert monitor.blocked == 0
+    assert monitor.max_lag >= 0.05
+
+
+def test_loop_lag_is_exported_as_metrics():
+    """Testa att histogrammet och räknaren finns på /metrics"""
+    with TestClient(app) as client:
+        text = client.get("/metrics").text
+    assert "# TYPE nexus_api_event_loop_lag_seconds histogram" in text
+    assert "nexus_api_event_loop_lag_seconds_count " in text
+    assert "nexus_api_event_loop_blocked_total " in text
@@ -0,0 +1,91 @@
+"""
+Tester för Prometheus-metrics
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nexus_repository_api.core.metrics import Histogram, MetricsMiddleware, MetricsRegistry, RequestMetrics
+from nexus_repository_api.main import app
+from starlette.responses import PlainTextResponse
+
+client = TestClient(app)
+
+
+def test_histogram_buckets_are_cumulative():
+    """Testa att histogrammets buckets blir kumulativa med +Inf sist"""
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 2.65
+
+
+def test_registry_renders_text_format():
+    """Testa text-formatet för histogram och collectors"""
+    registry = MetricsRegistry(prefix="test")
+    registry.histogram("latency_seconds", "Latens", ("route",), buckets=(1.0,)).labels('/a"b').observe(0.5)
+    registry.register_collector(lambda: [("items", "gauge", "Antal", [({}, 3), ({"kind": "x"}, 1.5)])])
+    text = registry.render()
+    assert '# TYPE test_latency_seconds histogram' in text
+    assert 'test_latency_seconds_bucket{route="/a\\"b",le="1"} 1' in text
+    assert 'test_latency_seconds_bucket{route="/a\\"b",le="+Inf"} 1' in text
+    assert 'test_latency_seconds_count{route="/a\\"b"} 1' in text
+    assert "test_items 3\n" in text
+    assert 'test_items{kind="x"} 1.5' in text
+
+
+def test_metrics_endpoint_reports_route_templates():
+    """Testa att requests räknas per route-mall och inte per faktisk sökväg"""
+    client.get("/api/packages/does-not-exist")
+    client.get("/api/packages/also-missing")
+    client.get("/no/such/path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert ('nexus_api_http_requests_total{route="/api/packages/{package_name}",method="GET",status="404"}'
+            in text)
+    assert "does-not-exist" not in text
+    assert 'route="<unmatched>"' in text
+    assert 'nexus_api_http_request_duration_seconds_bucket{route="/api/packages/{package_name}"' in text
+
+
+def test_starlette_routes_are_reported_by_template():
+    """Testa att parametriska Starlette-routes (utan scope["route"]) räknas per mall"""
+    registry = MetricsRegistry(prefix="test")
+    test_app = FastAPI()
+    test_app.add_middleware(MetricsMiddleware, request_metrics=RequestMetrics(registry))
+
+    async def asset(request):
+        return PlainTextResponse(request.path_params["name"])
+
+    test_app.add_route("/static/docs/{name}", asset, include_in_schema=False)
+    test_client = TestClient(test_app)
+    for name in ("a.js", "b.js", "c.css"):
+        assert test_client.get(f"/static/docs/{name}").status_code == 200
+    assert test_client.post("/static/docs/a.js").status_code == 405
+
+    text = registry.render()
+    assert 'test_http_requests_total{route="/static/docs/{name}",method="GET",status="200"} 3' in text
+    assert 'test_http_requests_total{route="/static/docs/{name}",method="POST",status="405"} 1' in text
+    assert "a.js" not in text
+
+
+def test_metrics_endpoint_reports_app_gauges():
+    """Testa att gauges för lager, cache, upstream och jobb finns med"""
+    text = client.get("/metrics").text
+    for name in (
+        "nexus_api_repositories ",
+        "nexus_api_packages ",
+        "nexus_api_http_requests_in_flight 1",
+        'nexus_api_cache_entries{cache="blobs"}',
+        "nexus_api_blob_cache_bytes ",
+        'nexus_api_upstream_pool{kind="max_concurrency"}',
+        "nexus_api_circuit_breaker_state 0",
+        'nexus_api_singleflight_total{role="leader"}',
+        'nexus_api_jobs{status="queued"}',
+        "nexus_api_job_queue_size ",
+    ):
+        assert name in text
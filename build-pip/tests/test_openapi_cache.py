@@ -0,0 +1,61 @@
+"""
+Tester för förberäknat OpenAPI-schema och docs-sidor
+"""
+import gzip
+import json
+
+from fastapi.testclient import TestClient
+from nexus_repository_api.main import app, openapi_cache
+
+
+def test_schema_is_built_at_startup_and_served_with_strong_etag():
+    """Testa att schemat byggs i lifespan och serveras med ETag, gzip och 304"""
+    openapi_cache._schema = None
+    with TestClient(app) as client:
+        assert openapi_cache._schema is not None
+
+        response = client.get("/api/openapi.json")
+        assert response.status_code == 200
+        assert response.json() == app.openapi()
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["cache-control"] == "public, no-cache"
+        assert response.headers["vary"] == "Accept-Encoding"
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith('W/')
+
+        response = client.get("/api/openapi.json", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = client.get("/api/openapi.json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] != etag
+        assert response.content == openapi_cache.schema.body
+        assert gzip.decompress(openapi_cache.schema.gzipped) == response.content
+        assert json.loads(response.content) == app.openapi()
+
+
+def test_docs_pages_use_the_immutable_versioned_schema_url():
+    """Testa att Swagger UI och ReDoc pekar på en versionerad, oföränderlig schema-URL"""
+    client = TestClient(app)
+    versioned_url = openapi_cache.versioned_url()
+    assert versioned_url.startswith("/api/openapi.json?v=")
+
+    for path in ("/docs", "/redoc"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert versioned_url in response.text
+        assert client.get(path, headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+
+    response = client.get(versioned_url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert client.get("/api/openapi.json?v=stale").headers["cache-control"] == "public, no-cache"
+    assert client.get("/docs/oauth2-redirect").status_code == 200
+
+
+def test_docs_routes_are_not_in_the_schema():
+    """Testa att docs-routes inte syns i schemat"""
+    paths = app.openapi()["paths"]
+    assert not {"/docs", "/redoc", "/api/openapi.json", "/docs/oauth2-redirect"} & set(paths)
@@ -0,0 +1,113 @@
+"""
+Tester för den samplande profileraren och admin-endpoints
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nexus_repository_api.api.v1 import admin
+from nexus_repository_api.core.profiler import Profiler, ProfilerBusyError, ProfilerMiddleware, get_profiler
+from nexus_repository_api.main import app as main_app
+
+TOKEN = "hemlig-token"
+
+
+def busy_wait(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def make_app(profiler: Profiler) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/packages/slow")
+    async def slow():
+        busy_wait(0.05)
+        return {"ok": True}
+
+    app.include_router(admin.router)
+    app.add_middleware(ProfilerMiddleware, request_profiler=profiler)
+    app.dependency_overrides[get_profiler] = lambda: profiler
+    return app
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", TOKEN)
+
+
+def test_profiler_disabled_by_default():
+    """Testa att admin-endpoints inte finns i appen utan PROFILER_ENABLED"""
+    response = TestClient(main_app).post("/api/admin/profile", params={"seconds": 0.1})
+    assert response.status_code == 404
+
+
+def test_profile_requires_admin_token(admin_token):
+    """Testa att fel eller saknad token ger 403"""
+    client = TestClient(make_app(Profiler()))
+    assert client.post("/api/admin/profile", params={"seconds": 0.1}).status_code == 403
+    response = client.post("/api/admin/profile", params={"seconds": 0.1}, headers={"X-Admin-Token": "fel"})
+    assert response.status_code == 403
+
+
+def test_profile_without_configured_token_is_closed(monkeypatch):
+    """Testa att admin-endpoints är stängda när ADMIN_TOKEN saknas"""
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    client = TestClient(make_app(Profiler()))
+    response = client.post("/api/admin/profile", params={"seconds": 0.1}, headers={"X-Admin-Token": ""})
+    assert response.status_code == 403
+
+
+def test_profile_for_duration_returns_collapsed_stacks(admin_token):
+    """Testa att profileringen returnerar 'stack antal'-rader"""
+    client = TestClient(make_app(Profiler()))
+    response = client.post(
+        "/api/admin/profile",
+        params={"seconds": 0.2, "interval": 0.005},
+        headers={"X-Admin-Token": TOKEN},
+    )
+    assert response.status_code == 200
+    assert int(response.headers["x-profile-samples"]) > 0
+    lines = response.text.splitlines()
+    assert lines
+    for line in lines:
+        stack, _, count = line.rpartition(" ")
+        assert ";" in stack
+        assert int(count) > 0
+
+
+async def test_profile_next_requests_matching_path(admin_token):
+    """Testa att request-läget profilerar de K nästa matchande requests"""
+    profiler = Profiler()
+    app = make_app(profiler)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        profile = asyncio.ensure_future(client.post(
+            "/api/admin/profile/requests",
+            params={"path": "/api/packages", "count": 2, "timeout": 10},
+            headers={"X-Admin-Token": TOKEN},
+        ))
+        while profiler.path_prefix is None:
+            await asyncio.sleep(0.01)
+        for _ in range(2):
+            assert (await client.get("/api/packages/slow")).status_code == 200
+        response = await profile
+
+    assert response.status_code == 200
+    assert "busy_wait" in response.text
+    assert profiler.path_prefix is None
+    assert not profiler.busy
+
+
+async def test_concurrent_profiles_are_rejected():
+    """Testa att bara en profilering kan köras åt gången"""
+    profiler = Profiler()
+    first = asyncio.ensure_future(profiler.profile_for(0.1))
+    await asyncio.sleep(0.01)
+    with pytest.raises(ProfilerBusyError):
+        await profiler.profile_for(0.1)
+    await first
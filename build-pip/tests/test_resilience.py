@@ -0,0 +1,172 @@
+"""
+Tester för circuit breaker och begränsad samtidighet mot en långsam Nexus
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from nexus_repository_api.main import app
+from nexus_repository_api.core.nexus_client import (
+    NexusClient, NexusUnavailableError, get_nexus_client, service_unavailable,
+)
+from nexus_repository_api.core.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, ConcurrencyLimiter
+
+
+class FakeNexus:
+    """Lokal fejk-Nexus med injicerad latens och felläge"""
+
+    def __init__(self, latency: float = 0.0, status_code: int = 200):
+        self.latency = latency
+        self.status_code = status_code
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        return httpx.Response(self.status_code, json={"path": request.url.path})
+
+
+def make_client(fake: FakeNexus, **kwargs) -> NexusClient:
+    breaker = kwargs.pop("breaker", CircuitBreaker(failure_threshold=3, reset_timeout=0.2))
+    limiter = kwargs.pop("limiter", ConcurrencyLimiter(max_concurrency=2, queue_timeout=5.0))
+    return NexusClient(
+        base_url="http://nexus.test",
+        transport=httpx.MockTransport(fake.handler),
+        breaker=breaker,
+        limiter=limiter,
+        **kwargs,
+    )
+
+
+async def test_limiter_bounds_concurrent_upstream_calls():
+    """Testa att högst max_concurrency anrop når Nexus samtidigt"""
+    fake = FakeNexus(latency=0.05)
+    nexus = make_client(fake)
+
+    await asyncio.gather(*(nexus.get_json(f"/service/rest/v1/item/{i}") for i in range(10)))
+
+    assert fake.calls == 10
+    assert fake.max_active == 2
+
+
+async def test_limiter_fails_fast_when_queue_is_stuck():
+    """Testa att väntande anrop avvisas när Nexus är för långsam"""
+    fake = FakeNexus(latency=0.5)
+    nexus = make_client(fake, limiter=ConcurrencyLimiter(max_concurrency=1, queue_timeout=0.05))
+
+    results = await asyncio.gather(
+        *(nexus.get_json(f"/service/rest/v1/item/{i}") for i in range(5)), return_exceptions=True
+    )
+
+    rejected = [result for result in results if isinstance(result, NexusUnavailableError)]
+    assert len(rejected) == 4
+    assert fake.calls == 1
+    assert nexus.limiter.stats()["rejected"] == 4
+
+
+async def test_breaker_opens_and_recovers_via_half_open_probe():
+    """Testa öppning efter fel, snabbt avvisande och återhämtning via prob"""
+    fake = FakeNexus(status_code=500)
+    nexus = make_client(fake, cache_ttl=0)
+
+    for i in range(3):
+        with pytest.raises(Exception):
+            await nexus.get_json(f"/service/rest/v1/item/{i}")
+    assert nexus.breaker.state == OPEN
+
+    with pytest.raises(NexusUnavailableError):
+        await nexus.get_json("/service/rest/v1/item/x")
+    assert fake.calls == 3
+
+    await asyncio.sleep(0.25)
+    fake.status_code = 200
+    assert await nexus.get_json("/service/rest/v1/item/y") == {"path": "/service/rest/v1/item/y"}
+    assert nexus.breaker.state == CLOSED
+
+
+async def test_failed_probe_reopens_circuit():
+    """Testa att en misslyckad prob öppnar kretsen igen"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    await asyncio.sleep(0.06)
+
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+async def test_timeouts_open_the_circuit():
+    """Testa att timeouts mot en seg Nexus räknas som fel"""
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        raise httpx.ReadTimeout("timeout", request=request)
+
+    nexus = NexusClient(
+        base_url="http://nexus.test",
+        transport=httpx.MockTransport(slow_handler),
+        breaker=CircuitBreaker(failure_threshold=3, reset_timeout=30),
+        cache_ttl=0,
+    )
+    for i in range(3):
+        with pytest.raises(Exception):
+            await nexus.get_json(f"/service/rest/v1/item/{i}")
+
+    assert nexus.breaker.state == OPEN
+    assert nexus.breaker.stats()["times_opened"] == 1
+
+
+async def test_open_circuit_serves_stale_cache():
+    """Testa att senast kända svar serveras när kretsen är öppen"""
+    fake = FakeNexus()
+    nexus = make_client(fake, cache_ttl=0)
+    data = await nexus.list_repositories()
+
+    fake.status_code = 500
+    for i in range(3):
+        with pytest.raises(Exception):
+            await nexus.get_json(f"/service/rest/v1/item/{i}")
+    assert nexus.breaker.state == OPEN
+
+    assert await nexus.list_repositories() == data
+
+
+def test_open_circuit_returns_503_with_retry_after():
+    """Testa att API:t svarar 503 med Retry-After när kretsen är öppen"""
+    fake = FakeNexus(status_code=500)
+    nexus = make_client(fake, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30))
+    app.dependency_overrides[get_nexus_client] = lambda: nexus
+    client = TestClient(app)
+    try:
+        assert client.get("/api/upstream/repositories").status_code == 502
+        response = client.get("/api/upstream/repositories")
+        assert response.status_code == 503
+        assert int(response.headers["retry-after"]) >= 1
+        assert client.get("/api/upstream").json()["circuit_breaker"]["state"] == OPEN
+
+        # Download-routen bygger samma svar via samma hjälpfunktion
+        download = client.get("/api/packages/download/pypi-hosted/packages/demo.whl")
+        assert download.status_code == 503
+        assert download.headers["retry-after"] == response.headers["retry-after"]
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_service_unavailable_rounds_retry_after_up():
+    """Testa att Retry-After avrundas uppåt till hela sekunder, minst 1"""
+    for retry_after, header in [(0.0, "1"), (0.2, "1"), (1.0, "1"), (1.01, "2"), (29.5, "30")]:
+        error = service_unavailable(NexusUnavailableError("Nexus otillgänglig", retry_after=retry_after))
+        assert error.status_code == 503
+        assert error.detail == "Nexus otillgänglig"
+        assert error.headers == {"Retry-After": header}
@@ -0,0 +1,85 @@
+"""
+Tester för Server-Timing och tid per fas
+"""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from nexus_repository_api.main import app
+from nexus_repository_api.core.nexus_client import NexusClient, get_nexus_client
+from nexus_repository_api.core import timing
+from nexus_repository_api.core.timing import PhaseTimer, phase
+
+client = TestClient(app)
+
+
+def parse_server_timing(header: str) -> dict:
+    result = {}
+    for part in header.split(","):
+        name, _, duration = part.strip().partition(";dur=")
+        result[name] = float(duration)
+    return result
+
+
+@pytest.fixture
+def server_timing(monkeypatch):
+    monkeypatch.setattr(timing, "SERVER_TIMING_ENABLED", True)
+
+
+def test_server_timing_header_disabled_by_default(monkeypatch):
+    """Testa att headern inte skickas när den är avstängd"""
+    monkeypatch.setattr(timing, "SERVER_TIMING_ENABLED", False)
+    response = client.get("/api/stats")
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+def test_server_timing_reports_phases(server_timing):
+    """Testa att validering, lager, handler och serialisering redovisas"""
+    response = client.get("/api/stats")
+    assert response.status_code == 200
+    timings = parse_server_timing(response.headers["server-timing"])
+    assert set(timings) == {"validation", "handler", "store", "serialize", "total"}
+    assert timings["store"] <= timings["handler"] <= timings["total"]
+
+
+def test_server_timing_reports_upstream(server_timing):
+    """Testa att tid mot Nexus redovisas som upstream"""
+    nexus = NexusClient(
+        base_url="http://nexus.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[{"name": "pypi-hosted"}])),
+        cache_ttl=0,
+    )
+    app.dependency_overrides[get_nexus_client] = lambda: nexus
+    try:
+        response = client.get("/api/upstream/repositories")
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert "upstream" in parse_server_timing(response.headers["server-timing"])
+
+
+def test_phases_are_exported_as_metrics():
+    """Testa att faserna hamnar i histogrammet per route"""
+    client.get("/api/stats")
+    text = client.get("/metrics").text
+    assert 'nexus_api_request_phase_seconds_count{route="/api/stats",phase="store"}' in text
+    assert 'nexus_api_request_phase_seconds_count{route="/api/stats",phase="serialize"}' in text
+
+
+def test_nested_phases_are_counted_once():
+    """Testa att en nästlad fas med samma namn inte dubbelräknas"""
+    from nexus_repository_api.core.timing import _current
+
+    timer = PhaseTimer()
+    token = _current.set(timer)
+    try:
+        with phase("upstream"):
+            with phase("upstream"):
+                pass
+        with phase("store"):
+            pass
+    finally:
+        _current.reset(token)
+    assert set(timer.phases) == {"upstream", "store"}
+    assert timer.active == {"upstream": 0, "store": 0}
@@ -0,0 +1,89 @@
+"""
+Tester för sammanslagning av samtidiga upstream-anrop
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from nexus_repository_api.main import app
+from nexus_repository_api.core.nexus_client import NexusClient, NexusError, get_nexus_client
+from nexus_repository_api.core.singleflight import SingleFlight
+
+
+class SlowNexus:
+    """Stub-Nexus som svarar långsamt och räknar anrop"""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.calls = 0
+        # Sätts av testet: svara inte förrän villkoret gäller (eller efter 5s)
+        self.hold_until = None
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0.2)
+        if self.hold_until is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 5
+            while not self.hold_until() and loop.time() < deadline:
+                await asyncio.sleep(0.01)
+        return httpx.Response(self.status_code, json=[{"name": "pypi-hosted"}])
+
+
+@pytest.fixture
+def slow_nexus():
+    """Koppla API:t mot en långsam stub-Nexus"""
+    fake = SlowNexus()
+    nexus = NexusClient(base_url="http://nexus.test", transport=httpx.MockTransport(fake.handler))
+    app.dependency_overrides[get_nexus_client] = lambda: nexus
+    yield fake, nexus
+    app.dependency_overrides.clear()
+
+
+async def test_thousand_concurrent_requests_hit_nexus_once(slow_nexus):
+    """Testa att 1000 samtidiga requests ger exakt ett anrop mot Nexus"""
+    fake, nexus = slow_nexus
+    # Under last hinner inte alla 1000 requests fram på 0.2s - håll svaret tills alla väntar
+    fake.hold_until = lambda: nexus.singleflight.stats()["coalesced"] >= 999
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://api.test") as api:
+        responses = await asyncio.gather(
+            *(api.get("/api/upstream/repositories") for _ in range(1000))
+        )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert all(response.json() == [{"name": "pypi-hosted"}] for response in responses)
+    assert fake.calls == 1
+    assert nexus.singleflight.stats() == {"leaders": 1, "coalesced": 999, "in_flight": 0}
+
+
+async def test_errors_are_shared():
+    """Testa att ett fel från Nexus delas av alla väntande anropare"""
+    fake = SlowNexus(status_code=500)
+    nexus = NexusClient(base_url="http://nexus.test", transport=httpx.MockTransport(fake.handler))
+
+    results = await asyncio.gather(
+        *(nexus.list_repositories() for _ in range(100)), return_exceptions=True
+    )
+
+    assert fake.calls == 1
+    assert all(isinstance(result, NexusError) for result in results)
+    assert all(result.status_code == 500 for result in results)
+
+
+async def test_cancelled_caller_does_not_cancel_others():
+    """Testa att en avbruten anropare inte avbryter det delade anropet"""
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "klar"
+
+    first = asyncio.ensure_future(flight.do("nyckel", work))
+    second = asyncio.ensure_future(flight.do("nyckel", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "klar"
+    assert flight.in_flight == 0
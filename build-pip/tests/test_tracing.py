@@ -0,0 +1,125 @@
+"""
+Tester för tracing med W3C traceparent
+"""
+
+import json
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from nexus_repository_api.core.nexus_client import NexusClient
+from nexus_repository_api.core.timing import TimedRoute, phase
+from nexus_repository_api.core.tracing import SpanExporter, Tracer, TracingMiddleware, parse_traceparent
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class Harness:
+    """Liten app med en route som går mot lagret och mot en fejkad Nexus"""
+
+    def __init__(self, tmp_path, sample_rate: float):
+        self.path = tmp_path / "spans.jsonl"
+        self.exporter = SpanExporter(file_path=str(self.path), endpoint="", flush_interval=0.01)
+        self.tracer = Tracer(sample_rate=sample_rate, exporter=self.exporter)
+        self.nexus_headers = []
+        self.nexus = NexusClient(
+            base_url="http://nexus.test",
+            transport=httpx.MockTransport(self.handle_nexus),
+            cache_ttl=0,
+        )
+
+        router = APIRouter(route_class=TimedRoute)
+
+        @router.get("/items/{item_id}")
+        async def get_item(item_id: str, nexus: NexusClient = Depends(lambda: self.nexus)):
+            with phase("store"):
+                pass
+            return await nexus.get_json(f"/service/rest/v1/items/{item_id}")
+
+        app = FastAPI()
+        app.include_router(router)
+        app.add_middleware(TracingMiddleware, request_tracer=self.tracer)
+        self.client = TestClient(app)
+
+    def handle_nexus(self, request: httpx.Request) -> httpx.Response:
+        self.nexus_headers.append(request.headers.get("traceparent"))
+        return httpx.Response(200, json={"ok": True})
+
+    def spans(self) -> list:
+        self.exporter.start()
+        self.exporter.stop()
+        if not self.path.exists():
+            return []
+        spans = []
+        for line in self.path.read_text().splitlines():
+            payload = json.loads(line)
+            for resource in payload["resourceSpans"]:
+                for scope in resource["scopeSpans"]:
+                    spans.extend(scope["spans"])
+        return spans
+
+
+@pytest.mark.parametrize("header,expected", [
+    (f"00-{TRACE_ID}-{PARENT_ID}-01", (TRACE_ID, PARENT_ID, True)),
+    (f"00-{TRACE_ID.upper()}-{PARENT_ID}-00", (TRACE_ID, PARENT_ID, False)),
+    (f"00-{'0' * 32}-{PARENT_ID}-01", None),
+    (f"00-{TRACE_ID}-{'0' * 16}-01", None),
+    (f"ff-{TRACE_ID}-{PARENT_ID}-01", None),
+    ("inte-en-traceparent", None),
+    (None, None),
+])
+def test_parse_traceparent(header, expected):
+    """Testa tolkning av traceparent enligt W3C"""
+    assert parse_traceparent(header) == expected
+
+
+def test_incoming_sampled_trace_is_continued_and_propagated(tmp_path):
+    """Testa att en samplad inkommande trace fortsätter och skickas vidare till Nexus"""
+    harness = Harness(tmp_path, sample_rate=0.0)
+    response = harness.client.get("/items/42", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+    assert response.status_code == 200
+
+    spans = harness.spans()
+    by_name = {span["name"]: span for span in spans}
+    assert set(by_name) == {"GET /items/{item_id}", "handler", "store", "upstream"}
+    assert {span["traceId"] for span in spans} == {TRACE_ID}
+
+    server = by_name["GET /items/{item_id}"]
+    assert server["parentSpanId"] == PARENT_ID
+    assert server["kind"] == 2
+    assert by_name["handler"]["parentSpanId"] == server["spanId"]
+    assert by_name["store"]["parentSpanId"] == by_name["handler"]["spanId"]
+    upstream = by_name["upstream"]
+    assert upstream["kind"] == 3
+    assert {"key": "http.url", "value": {"stringValue": "http://nexus.test/service/rest/v1/items/42"}} in \
+        upstream["attributes"]
+
+    [outgoing] = harness.nexus_headers
+    assert outgoing == f"00-{TRACE_ID}-{upstream['spanId']}-01"
+
+
+def test_unsampled_trace_is_propagated_but_not_exported(tmp_path):
+    """Testa att en icke samplad trace inte exporteras men ändå propageras"""
+    harness = Harness(tmp_path, sample_rate=1.0)
+    harness.client.get("/items/42", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+    assert harness.spans() == []
+    [outgoing] = harness.nexus_headers
+    assert outgoing.startswith(f"00-{TRACE_ID}-")
+    assert outgoing.endswith("-00")
+
+
+def test_sample_rate_controls_new_traces(tmp_path):
+    """Testa att nya traces samplas enligt TRACING_SAMPLE_RATE"""
+    harness = Harness(tmp_path, sample_rate=0.0)
+    harness.client.get("/items/1")
+    assert harness.spans() == []
+
+    (tmp_path / "sampled").mkdir()
+    harness = Harness(tmp_path / "sampled", sample_rate=1.0)
+    harness.client.get("/items/1")
+    spans = harness.spans()
+    assert len(spans) == 4
+    assert len({span["traceId"] for span in spans}) == 1
+    assert "parentSpanId" not in next(span for span in spans if span["kind"] == 2)
@@ -47,6 +47,9 @@ show_help() {
     echo "  run-validation      Kör data-valideringstester (stannar vid första fel)"
     echo "  run-workflows       Kör end-to-end workflow-tester (stannar vid första fel)"
     echo "  run-k8s             Kör K8s-tester (stannar vid första fel)"
+    echo "  run-load            Kör lastgeneratorn mot Kong (resultat i testning/results/load.json)"
+    echo "  run-bench           Kör mikrobenchmarks för datalagret lokalt (--all tar med 1M paket)"
+    echo "  run-bench-gate      Kör benchmarks BENCH_RUNS gånger (5) och jämför mot baseline från samma maskinklass (--update-baseline skriver om den)"
     echo "  build               Bygg test-container (utan cache)"
     echo "  build --with-cache  Bygg test-container med cache"
     echo "  rebuild             Stoppa och bygg om test-container (utan cache)"
@@ -68,8 +71,12 @@ show_help() {
     echo "  $0 run-gui                     # Kör bara GUI-tester"
     echo "  $0 run-api --to-the-end        # Kör API-tester (fortsätt vid fel)"
     echo "  $0 run-gui --to-the-end        # Kör GUI-tester (fortsätt vid fel)"
+    echo "  $0 run-gui --parallel          # Kör GUI-tester parallellt (pytest-xdist)"
     echo "  $0 run-endpoints               # Kör smarta endpoint-URL tester"
     echo "  $0 run -k test_health          # Kör custom pytest-kommando"
+    echo "  $0 run-load --rate 200 --duration 30  # Kör 200 req/s i 30 s"
+    echo "  $0 run-bench -k stats          # Kör bara stats-benchmarks"
+    echo "  $0 run-bench-gate --max-latency-regression 0.2  # Tillåt 20 % långsammare"
     echo "  TEST_HOST=192.168.1.100 $0 run-api  # Kör API-tester mot annan host"
     echo "  $0 build --with-cache          # Bygg test-container med cache"
     echo "  $0 rebuild                     # Stoppa och bygg om test-container"
@@ -231,16 +238,19 @@ run_api_tests() {
 # Run GUI tests only
 run_gui_tests() {
     local stop_on_fail="-x"
+    local parallel=""
     
-    # Check for --to-the-end argument
+    # Check for --to-the-end and --parallel arguments
     for arg in "$@"; do
         if [[ "$arg" == "--to-the-end" ]]; then
             stop_on_fail=""
-            break
+        elif [[ "$arg" == "--parallel" ]]; then
+            # En delad browser per xdist-worker, en ny context per test
+            parallel="-n auto"
         fi
     done
     
-    exec_pytest -v $stop_on_fail -m gui --html=report.html --self-contained-html
+    exec_pytest -v $stop_on_fail $parallel -m gui --html=report.html --self-contained-html
 }
 
 # Run smart endpoint URL tests
@@ -318,6 +328,59 @@ run_workflows_tests() {
     exec_pytest -v $stop_on_fail -m workflows --html=report.html --self-contained-html
 }
 
+# Run load generator against Kong
+run_load_tests() {
+    local container_name="nexus-test-runner"
+    local test_url="http://${TEST_HOST:-localhost}:${TEST_PORT:-8000}/api"
+
+    start_test_container
+
+    print_info "Kör lastgenerator mot $test_url"
+    docker exec $container_name \
+        python3 -m support.load_generator --url "$test_url" --output results/load.json "$@"
+}
+
+# Run store microbenchmarks locally (ingen container eller Kubernetes behövs)
+run_bench_tests() {
+    local script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+    local bench_dir="$script_dir/../testning/benchmarks"
+    local marker=(-m "not slow")
+    local args=()
+
+    for arg in "$@"; do
+        if [[ "$arg" == "--all" ]]; then
+            marker=()
+        else
+            args+=("$arg")
+        fi
+    done
+
+    mkdir -p "$bench_dir/../results"
+    print_info "Kör store-benchmarks i $bench_dir"
+    (cd "$bench_dir" && python3 -m pytest "${marker[@]}" \
+        --benchmark-json="../${BENCH_OUTPUT:-results/benchmarks.json}" --benchmark-save-data "${args[@]}")
+}
+
+# Run benchmarks BENCH_RUNS times and compare against the committed baseline
+# Baselinen gäller bara den maskinklass den spelades in på (CPU, antal kärnor, Python-version).
+# Generera den på CI-runnerns maskinklass med --update-baseline - på annan maskin avbryter grinden med exit 3.
+run_bench_gate() {
+    local script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+    local testning_dir="$script_dir/../testning"
+    local runs="${BENCH_RUNS:-5}"
+    local results=()
+
+    # Rundorna inom en körning är beroende av varandra - grinden jämför medianer över upprepade körningar
+    for i in $(seq 1 "$runs"); do
+        print_info "Benchmark-körning $i av $runs"
+        BENCH_OUTPUT="results/benchmarks-$i.json" run_bench_tests
+        results+=("results/benchmarks-$i.json")
+    done
+    print_info "Jämför mot benchmarks/baseline.json"
+    (cd "$testning_dir" && python3 -m support.bench_compare "${results[@]}" \
+        --baseline benchmarks/baseline.json "$@")
+}
+
 # Run K8s tests
 run_k8s_tests() {
     local stop_on_fail="-x"
@@ -449,6 +512,20 @@ main() {
             shift
             run_workflows_tests "$@"
             ;;
+        "run-load")
+            check_docker
+            check_kind_cluster
+            shift
+            run_load_tests "$@"
+            ;;
+        "run-bench")
+            shift
+            run_bench_tests "$@"
+            ;;
+        "run-bench-gate")
+            shift
+            run_bench_gate "$@"
+            ;;
         "run-k8s")
             check_docker
             check_kind_cluster
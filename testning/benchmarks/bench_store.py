@@ -0,0 +1,89 @@
+"""
+Store Benchmarks - Mikrobenchmarks för datalagret bakom models.py och routrarna
+
+Varje operation körs mot katalogstorlekarna 1k, 100k och 1M (seedad syntetisk
+data) och grupperas per operation, så att skalningen syns direkt i tabellen.
+"""
+from itertools import cycle
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from conftest import run_sync
+from support.app_loader import import_app_module
+
+packages_router = import_app_module("api.v1.packages")
+repository_router = import_app_module("api.v1.repository")
+system_router = import_app_module("api.v1.system")
+models = import_app_module("api.v1.models")
+
+
+def _route(router, path: str, method: str):
+    return next(route for route in router.routes if route.path == path and method in route.methods)
+
+
+def bench_insert(bench, catalog):
+    """POST /packages/ - append till lagret (tas bort igen så att storleken är konstant)"""
+    upload = packages_router.upload_package
+    store = catalog["packages"]
+    package = models.PackageInfo(name="bench-insert", version="1.0.0", repository="pypi-hosted")
+
+    def insert():
+        run_sync(upload(package))
+        store.pop()
+
+    bench("insert")(insert)
+    assert len(store) == catalog["size"]
+
+
+def bench_lookup_by_name(bench, catalog):
+    """GET /packages/{package_name}"""
+    get_package = packages_router.get_package
+    names = cycle(catalog["names"])
+
+    found = bench("lookup_by_name")(lambda: run_sync(get_package(next(names))))
+    assert found
+
+
+def bench_lookup_by_repository(bench, catalog):
+    """GET /repositories/{repository_name} - antalet repositories växer med katalogen"""
+    get_repository = repository_router.get_repository
+    repository_names = cycle(catalog["repository_names"])
+
+    found = bench("lookup_by_repository")(lambda: run_sync(get_repository(next(repository_names))))
+    assert found
+
+
+def bench_stats(bench, catalog):
+    """GET /stats"""
+    stats = bench("stats")(lambda: run_sync(system_router.get_stats()))
+    assert stats["total_packages"] == catalog["size"]
+
+
+def bench_list_serialization(bench, catalog):
+    """GET /packages/ - response_model-validering och JSON-rendering som FastAPI gör"""
+    route = _route(packages_router.router, "/api/packages/", "GET")
+
+    def serialize() -> bytes:
+        content = run_sync(route.endpoint())
+        value = run_sync(serialize_response(field=route.response_field, response_content=content,
+                                            is_coroutine=True))
+        return JSONResponse(value).body
+
+    body = bench("list_serialization")(serialize)
+    assert body.startswith(b'[{"name":')
+
+
+def bench_lookup_missing(bench, catalog):
+    """GET /packages/{package_name} för ett namn som saknas - hela lagret gås igenom och ger 404"""
+    get_package = packages_router.get_package
+
+    def lookup() -> int:
+        try:
+            run_sync(get_package("no-such-package"))
+        except HTTPException as e:
+            return e.status_code
+        return 200
+
+    assert bench("lookup_missing")(lookup) == 404
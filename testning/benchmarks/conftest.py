@@ -0,0 +1,77 @@
+"""
+Pytest configuration and fixtures for the store microbenchmarks
+"""
+import os
+import sys
+import tracemalloc
+from typing import Any, Dict, Generator
+
+import pytest
+
+# support/ ligger i testning/, en nivå upp
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from support.app_loader import import_app_module  # noqa: E402
+from support.synthetic_data import (  # noqa: E402
+    build_models, generate_packages, generate_repositories, loaded_store, sample_names,
+)
+
+CATALOG_SIZES = [
+    pytest.param(1_000, id="1k"),
+    pytest.param(100_000, id="100k"),
+    pytest.param(1_000_000, id="1M", marks=pytest.mark.slow),
+]
+
+SEED = int(os.getenv("BENCH_SEED", "42"))
+
+# Ett repository per 100 paket (10 / 1k / 10k), så att uppslag per repository skalar med katalogen
+PACKAGES_PER_REPOSITORY = 100
+
+
+def run_sync(coro: Any) -> Any:
+    """Run an endpoint coroutine that never awaits, without event loop overhead"""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("Endpointen väntade på I/O - kan inte köras synkront")
+
+
+@pytest.fixture(scope="session")
+def models():
+    return import_app_module("api.v1.models")
+
+
+@pytest.fixture(scope="module", params=CATALOG_SIZES)
+def catalog(request, models) -> Generator[Dict[str, Any], None, None]:
+    """Seeded catalog of the given size, loaded into the in-memory store"""
+    size = request.param
+    repository_rows = generate_repositories(size // PACKAGES_PER_REPOSITORY, seed=SEED)
+    repositories = build_models(models.RepositoryInfo, repository_rows)
+    rows = generate_packages(size, repository_rows, seed=SEED)
+    tracemalloc.start()
+    packages = build_models(models.PackageInfo, rows)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+
+    with loaded_store(models, packages=packages, repositories=repositories):
+        yield {
+            "size": size,
+            "packages": models.packages,
+            "names": sample_names(packages, 1000, seed=SEED),
+            "repository_names": sample_names(repositories, 1000, seed=SEED),
+            "bytes_per_package": round(allocated / size, 1),
+        }
+
+
+@pytest.fixture
+def bench(benchmark, catalog):
+    """The benchmark fixture grouped by operation, annotated with catalog size and memory"""
+    def configure(group: str):
+        benchmark.group = group
+        benchmark.extra_info["catalog_size"] = catalog["size"]
+        benchmark.extra_info["bytes_per_package"] = catalog["bytes_per_package"]
+        return benchmark
+    return configure
@@ -1,12 +1,22 @@
 """
 Pytest configuration and fixtures for FastAPI testing
 """
-import pytest
-import requests
+import os
 import time
+import pytest
 from typing import Generator
-from support.api_client import APIClient
+from contextlib import ExitStack
+from support.api_client import APIClient, AsyncAPIClient, InProcessAPIClient
+from support.app_loader import import_app_module
+from support.fake_nexus import FakeNexus, FakeNexusConfig, serve
 from support.k8s_helper import K8sHelper
+from support.port_forward_pool import PortForwardPool
+from support.load_generator import write_results
+from support.readiness import ServiceCheck, check_services
+from support.synthetic_data import generate_catalog, loaded_store
+
+# latency_budget-markören och latensfördelningar i report.html
+pytest_plugins = ["support.latency_slo"]
 
 
 def pytest_configure(config):
@@ -66,6 +76,79 @@ def api_client(api_base_url: str) -> Generator[APIClient, None, None]:
     client.close()
 
 
+@pytest.fixture
+async def async_api_client(api_base_url: str):
+    """Async API client (pooled, retrying) for concurrent requests and latency capture"""
+    async with AsyncAPIClient(api_base_url) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def in_process_app():
+    """The FastAPI app module imported in-process (skips when the app is not installed)"""
+    try:
+        return import_app_module("main")
+    except ImportError as e:
+        pytest.skip(f"Appen kan inte importeras in-process: {e}")
+
+
+@pytest.fixture(scope="session")
+def in_process_api_client(in_process_app) -> Generator[APIClient, None, None]:
+    """APIClient against the in-process app, for tests that load data directly into the store"""
+    client = InProcessAPIClient(in_process_app.app)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def _synthetic_catalogs() -> dict:
+    """Built catalogs, cached per (repositories, packages, seed) for the session"""
+    return {}
+
+
+@pytest.fixture
+def synthetic_catalog(in_process_app, _synthetic_catalogs):
+    """Factory that bulk-loads a deterministic catalog into the in-process store
+
+    The store is restored when the test ends. Default size comes from
+    SYNTHETIC_REPOSITORIES (10k) and SYNTHETIC_PACKAGES (1M).
+    """
+    models = import_app_module("api.v1.models")
+    with ExitStack() as stack:
+        def load(repositories: int = int(os.getenv("SYNTHETIC_REPOSITORIES", "10000")),
+                 packages: int = int(os.getenv("SYNTHETIC_PACKAGES", "1000000")),
+                 seed: int = 42) -> dict:
+            key = (repositories, packages, seed)
+            if key not in _synthetic_catalogs:
+                start = time.perf_counter()
+                repository_models, package_models = generate_catalog(
+                    models.RepositoryInfo, models.PackageInfo, repositories, packages, seed
+                )
+                _synthetic_catalogs[key] = {
+                    "repositories": repository_models,
+                    "packages": package_models,
+                    "build_seconds": time.perf_counter() - start,
+                }
+            catalog = _synthetic_catalogs[key]
+            stack.enter_context(loaded_store(models, catalog["packages"], catalog["repositories"]))
+            return catalog
+        yield load
+
+
+@pytest.fixture
+def fake_nexus() -> FakeNexus:
+    """In-process fake Nexus (ASGI) with a small catalog, configured from FAKE_NEXUS_* variables"""
+    return FakeNexus.with_catalog(config=FakeNexusConfig.from_env())
+
+
+@pytest.fixture(scope="session")
+def fake_nexus_url() -> Generator[str, None, None]:
+    """Base URL of a fake Nexus served over HTTP for the whole session (skips without uvicorn)"""
+    pytest.importorskip("uvicorn")
+    with serve(FakeNexus.with_catalog(config=FakeNexusConfig.from_env())) as url:
+        yield url
+
+
 @pytest.fixture(scope="session")
 def kong_client(kong_base_url: str) -> Generator[APIClient, None, None]:
     """API client for testing Kong Gateway"""
@@ -86,33 +169,19 @@ def nexus_client(nexus_base_url: str) -> Generator[APIClient, None, None]:
 
 @pytest.fixture(scope="session", autouse=True)
 def wait_for_services(api_base_url: str, kong_base_url: str, nexus_base_url: str):
-    """Wait for all services to be available before running tests"""
+    """Wait for all services to be available before running tests (probed concurrently)"""
     print("\n🔍 Checking services availability...")
-    
-    services = [
-        ("FastAPI", api_base_url),
-        ("Kong Gateway", kong_base_url),
-        ("Nexus", nexus_base_url)
-    ]
-    
-    for service_name, url in services:
-        max_retries = 10  # Reduced from 30
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                response = requests.get(url, timeout=3)
-                if response.status_code in [200, 404, 502, 503]:  # Accept more status codes
-                    print(f"✅ {service_name} is accessible at {url}")
-                    break
-            except requests.exceptions.RequestException:
-                pass
-            
-            retry_count += 1
-            time.sleep(1)  # Reduced from 2
-        
-        if retry_count >= max_retries:
-            print(f"⚠️  {service_name} not immediately available at {url} - tests will continue")
+
+    report = check_services([
+        ServiceCheck("FastAPI", api_base_url),
+        ServiceCheck("Kong Gateway", kong_base_url),
+        ServiceCheck("Nexus", nexus_base_url),
+    ])
+    # Spara time-to-ready så att uppstartstiden för miljön kan följas mellan körningar
+    report_path = os.getenv("READINESS_REPORT", "results/readiness.json")
+    if report_path:
+        write_results(report, report_path)
+    return report
 
 
 @pytest.fixture
@@ -121,6 +190,20 @@ def k8s_helper() -> K8sHelper:
     return K8sHelper()
 
 
+@pytest.fixture
+def k8s_snapshot() -> K8sHelper:
+    """Opt-in K8sHelper in snapshot mode - one kubectl call for all pods and services, fresh per test"""
+    return K8sHelper(snapshot=True)
+
+
+@pytest.fixture(scope="session")
+def port_forward_pool() -> Generator[PortForwardPool, None, None]:
+    """Reused kubectl port-forwards, all terminated at session end"""
+    pool = PortForwardPool(K8sHelper())
+    yield pool
+    pool.close()
+
+
 # Playwright fixtures
 @pytest.fixture(scope="session")
 def playwright_browser_type() -> str:
@@ -134,3 +217,77 @@ def playwright_headless() -> bool:
     import os
     # Tillåt override via environment variable för debugging
     return os.getenv("PLAYWRIGHT_HEADLESS", "true").lower() == "true"
+
+
+@pytest.fixture(scope="session")
+def shared_browsers(playwright_headless: bool):
+    """Session-wide Playwright browsers (one per type), launched on first use"""
+    from support.playwright_client import SharedBrowsers
+    browsers = SharedBrowsers(headless=playwright_headless)
+    yield browsers
+    browsers.close()
+
+
+@pytest.fixture
+def gui_client_factory(shared_browsers, playwright_browser_type: str, playwright_headless: bool):
+    """Create PlaywrightClients with a fresh context in the shared browser
+
+    PLAYWRIGHT_SHARED_BROWSER=false launches a browser per client and
+    PLAYWRIGHT_BLOCK_RESOURCES=false loads fonts, images and analytics -
+    together they reproduce the old behaviour for timing comparisons.
+    """
+    from support.playwright_client import PlaywrightClient
+    shared = os.getenv("PLAYWRIGHT_SHARED_BROWSER", "true").lower() == "true"
+    block_resources = os.getenv("PLAYWRIGHT_BLOCK_RESOURCES", "true").lower() == "true"
+
+    def factory(browser_type: str = playwright_browser_type) -> PlaywrightClient:
+        return PlaywrightClient(
+            browser_type=browser_type,
+            headless=playwright_headless,
+            browser=shared_browsers.get(browser_type) if shared else None,
+            block_resources=block_resources,
+        )
+    return factory
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Close the shared browsers when the next test does not need them
+
+    Sync Playwright keeps its event loop registered on the main thread, which
+    would break the asyncio tests that follow the GUI tests.
+    """
+    browsers = item.funcargs.get("shared_browsers")
+    if browsers is not None and browsers.started and (
+            nextitem is None or "shared_browsers" not in nextitem.fixturenames):
+        browsers.close()
+
+
+_gui_timings = []
+
+
+def pytest_runtest_logreport(report):
+    """Collect the duration of every GUI test"""
+    if report.when == "call" and "gui" in report.keywords:
+        _gui_timings.append({"test": report.nodeid, "outcome": report.outcome,
+                             "duration": round(report.duration, 3)})
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the time per GUI test and save it to results/gui_timings.json"""
+    if not _gui_timings or hasattr(config, "workerinput"):
+        return
+    report = {
+        "shared_browser": os.getenv("PLAYWRIGHT_SHARED_BROWSER", "true").lower() == "true",
+        "block_resources": os.getenv("PLAYWRIGHT_BLOCK_RESOURCES", "true").lower() == "true",
+        "workers": getattr(config.option, "numprocesses", None) or 1,
+        "total": round(sum(t["duration"] for t in _gui_timings), 3),
+        "tests": sorted(_gui_timings, key=lambda t: t["duration"], reverse=True),
+    }
+    terminalreporter.write_sep("-", f"GUI-tider: {len(_gui_timings)} tester, {report['total']}s totalt")
+    for timing in report["tests"]:
+        terminalreporter.write_line(f"{timing['duration']:>8.2f}s  {timing['test']}")
+    path = os.getenv("GUI_TIMINGS_REPORT", "results/gui_timings.json")
+    if path:
+        write_results(report, path)
+
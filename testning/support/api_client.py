@@ -1,9 +1,34 @@
 """
 API Client for testing HTTP endpoints
 """
+import asyncio
+import time
+import httpx
 import requests
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import json
+from support.readiness import BackoffPolicy
+
+
+@dataclass
+class RequestTiming:
+    """Timing for one logical request (all attempts included)"""
+    method: str
+    endpoint: str
+    status: Optional[int]
+    elapsed: float
+    attempts: int
+    error: Optional[str] = None
+
+
+# Anropas med varje RequestTiming från alla klienter (latency_slo-pluginet registrerar sig här)
+timing_listeners: List[Callable[[RequestTiming], None]] = []
+
+
+def notify_timing(timing: RequestTiming) -> None:
+    for listener in list(timing_listeners):
+        listener(timing)
 
 
 class APIClient:
@@ -18,29 +43,38 @@ class APIClient:
             'Accept': 'application/json'
         })
     
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send the request and report its latency to the timing listeners"""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        start = time.perf_counter()
+        try:
+            response = getattr(self.session, method.lower())(url, timeout=self.timeout, **kwargs)
+        except Exception as e:
+            notify_timing(RequestTiming(method, endpoint, None, time.perf_counter() - start, 1,
+                                        f"{type(e).__name__}: {e}"))
+            raise
+        notify_timing(RequestTiming(method, endpoint, response.status_code, time.perf_counter() - start, 1))
+        return response
+    
     def get(self, endpoint: str = "", **kwargs) -> requests.Response:
         """GET request"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        return self.session.get(url, timeout=self.timeout, **kwargs)
+        return self._send("GET", endpoint, **kwargs)
     
     def post(self, endpoint: str = "", data: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
         """POST request"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
         if data:
             kwargs['json'] = data
-        return self.session.post(url, timeout=self.timeout, **kwargs)
+        return self._send("POST", endpoint, **kwargs)
     
     def put(self, endpoint: str = "", data: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
         """PUT request"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
         if data:
             kwargs['json'] = data
-        return self.session.put(url, timeout=self.timeout, **kwargs)
+        return self._send("PUT", endpoint, **kwargs)
     
     def delete(self, endpoint: str = "", **kwargs) -> requests.Response:
         """DELETE request"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        return self.session.delete(url, timeout=self.timeout, **kwargs)
+        return self._send("DELETE", endpoint, **kwargs)
     
     def health_check(self) -> bool:
         """Check if the API is healthy"""
@@ -53,3 +87,124 @@ class APIClient:
     def close(self):
         """Close the session"""
         self.session.close()
+
+
+class InProcessAPIClient(APIClient):
+    """APIClient that calls the ASGI app in-process through Starlette's TestClient (no network, no Kubernetes)"""
+    
+    def __init__(self, app: Any, base_path: str = "/api", timeout: int = 30):
+        from starlette.testclient import TestClient
+        super().__init__(f"http://testserver{base_path}", timeout)
+        headers = dict(self.session.headers)
+        self.session.close()
+        self.session = TestClient(app, headers=headers)
+
+
+class AsyncAPIClient:
+    """Async API client with a pooled keep-alive connection pool, idempotent retries and timing capture"""
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self, base_url: str, timeout: float = 30,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30.0,
+                 retries: int = 2,
+                 backoff: Optional[BackoffPolicy] = None,
+                 retry_statuses: Tuple[int, ...] = (502, 503, 504),
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = base_url.rstrip('/')
+        self.retries = retries
+        self.backoff = backoff or BackoffPolicy()
+        self.retry_statuses = retry_statuses
+        self.timings: List[RequestTiming] = []
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            transport=transport,
+        )
+
+    async def request(self, method: str, endpoint: str = "", **kwargs) -> httpx.Response:
+        """Send a request; idempotent methods are retried on transport errors and retry_statuses"""
+        method = method.upper()
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        attempts = self.retries + 1 if method in self.IDEMPOTENT_METHODS else 1
+        start = time.perf_counter()
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    self._record(method, endpoint, None, start, attempt + 1, f"{type(e).__name__}: {e}")
+                    raise
+                await asyncio.sleep(self.backoff.delay(attempt))
+                continue
+            if response.status_code not in self.retry_statuses or last_attempt:
+                self._record(method, endpoint, response.status_code, start, attempt + 1)
+                return response
+            await response.aclose()
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        # Retry-After (sekunder) respekteras, men aldrig längre än backoff-taket
+        retry_after = response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), self.backoff.max_delay)
+        return self.backoff.delay(attempt)
+
+    def _record(self, method: str, endpoint: str, status: Optional[int], start: float,
+                attempts: int, error: Optional[str] = None) -> None:
+        timing = RequestTiming(method, endpoint, status, time.perf_counter() - start, attempts, error)
+        self.timings.append(timing)
+        notify_timing(timing)
+
+    async def get(self, endpoint: str = "", **kwargs) -> httpx.Response:
+        """GET request"""
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str = "", data: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
+        """POST request (not retried)"""
+        if data:
+            kwargs['json'] = data
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint: str = "", data: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
+        """PUT request"""
+        if data:
+            kwargs['json'] = data
+        return await self.request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str = "", **kwargs) -> httpx.Response:
+        """DELETE request"""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def health_check(self) -> bool:
+        """Check if the API is healthy"""
+        try:
+            response = await self.get("/health")
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def latencies(self, method: Optional[str] = None) -> List[float]:
+        """Recorded latencies in seconds, optionally for one method"""
+        return [t.elapsed for t in self.timings if method is None or t.method == method.upper()]
+
+    async def close(self):
+        """Close the connection pool"""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
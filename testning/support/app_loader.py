@@ -0,0 +1,26 @@
+"""
+Import the FastAPI application in-process (no Kubernetes needed)
+
+Works both with the installed pip package (nexus_repository_api) and
+straight from a checkout of the repository (app/).
+"""
+import importlib
+import os
+import sys
+from types import ModuleType
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+PACKAGE_NAMES = ("nexus_repository_api", "app")
+
+
+def import_app_module(name: str = "main") -> ModuleType:
+    """Import e.g. 'main' or 'api.v1.models' from the installed package or the checkout"""
+    errors = []
+    for package in PACKAGE_NAMES:
+        if package == "app" and REPO_ROOT not in sys.path and os.path.isdir(os.path.join(REPO_ROOT, "app")):
+            sys.path.insert(0, REPO_ROOT)
+        try:
+            return importlib.import_module(f"{package}.{name}")
+        except ImportError as e:
+            errors.append(f"{package}.{name}: {e}")
+    raise ImportError("Kunde inte importera appen in-process - " + "; ".join(errors))
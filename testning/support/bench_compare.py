@@ -0,0 +1,219 @@
+"""
+Performance regression gate for the store benchmarks
+
+Compares pytest-benchmark JSON output (run with --benchmark-save-data so the
+raw round times are included) against a committed baseline. The rounds inside
+one run are autocorrelated (CPU frequency, cache and GC state carry over from
+round to round), so they are never treated as independent samples. Instead
+each run is reduced to one value per metric (p50/p95/p99 and ops/s), the
+suite is repeated a few times, and the gate compares the median over runs.
+
+A latency percentile or the throughput only counts as a regression when the
+one-sided bootstrap lower bound (resampling whole runs) of the slowdown is
+above the threshold - the change has to be both real and large enough to
+matter. Memory per package is deterministic and is compared by threshold only.
+
+Timings are only comparable on the machine class the baseline was recorded on,
+so a baseline with different machine_info (CPU, core count, Python version)
+is refused with exit code 3 instead of being compared.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from support.load_generator import percentile, write_results
+
+LATENCY_PERCENTILES = (50.0, 95.0, 99.0)
+BOOTSTRAP_RESAMPLES = 2000
+
+
+@dataclass
+class Thresholds:
+    """Minimum relative degradation per metric, confidence level and required number of runs"""
+    latency: float = float(os.getenv("BENCH_MAX_LATENCY_REGRESSION", "0.10"))
+    throughput: float = float(os.getenv("BENCH_MAX_THROUGHPUT_REGRESSION", "0.10"))
+    memory: float = float(os.getenv("BENCH_MAX_MEMORY_REGRESSION", "0.05"))
+    alpha: float = float(os.getenv("BENCH_ALPHA", "0.05"))
+    min_runs: int = int(os.getenv("BENCH_MIN_RUNS", "3"))
+
+
+@dataclass
+class Finding:
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+    change: float                       # relativ försämring av medianen över körningar, positiv = sämre
+    lower_bound: Optional[float]        # bootstrap-undre gräns för försämringen
+    regression: bool
+
+
+def _relative(baseline: float, current: float, higher_is_better: bool = False) -> float:
+    if baseline == 0:
+        return 0.0
+    change = (current - baseline) / baseline
+    return -change if higher_is_better else change
+
+
+def bootstrap_lower_bound(baseline: Sequence[float], current: Sequence[float], alpha: float = 0.05,
+                          higher_is_better: bool = False, resamples: int = BOOTSTRAP_RESAMPLES,
+                          seed: int = 0) -> float:
+    """One-sided (1 - alpha) lower bound of the relative degradation of the median, resampling runs"""
+    rng = random.Random(seed)
+    changes = sorted(
+        _relative(statistics.median(rng.choices(baseline, k=len(baseline))),
+                  statistics.median(rng.choices(current, k=len(current))),
+                  higher_is_better)
+        for _ in range(resamples)
+    )
+    return changes[int(alpha * resamples)]
+
+
+def summarize_run(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce one pytest-benchmark JSON file to one value per metric and benchmark"""
+    benchmarks = {}
+    for bench in raw.get("benchmarks", []):
+        stats = bench["stats"]
+        data = stats.get("data")
+        if not data:
+            raise ValueError(f"{bench['fullname']} saknar rådata - kör med --benchmark-save-data")
+        ordered = sorted(data)
+        run = {f"p{pct:g}": percentile(ordered, pct) for pct in LATENCY_PERCENTILES}
+        run["ops"] = stats["ops"]
+        benchmarks[bench["name"]] = {
+            "group": bench.get("group"),
+            "bytes_per_package": bench.get("extra_info", {}).get("bytes_per_package"),
+            "runs": [run],
+        }
+    machine = raw.get("machine_info", {})
+    cpu = machine.get("cpu", {})
+    return {
+        "machine_info": {
+            "python_version": machine.get("python_version"),
+            "cpu": cpu.get("brand_raw"),
+            "cpu_count": cpu.get("count"),
+        },
+        "datetime": raw.get("datetime"),
+        "runs": 1,
+        "benchmarks": benchmarks,
+    }
+
+
+def merge_runs(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine summaries of repeated runs of the same suite"""
+    merged = {
+        "machine_info": summaries[0]["machine_info"],
+        "datetime": summaries[-1]["datetime"],
+        "runs": sum(summary["runs"] for summary in summaries),
+        "benchmarks": {},
+    }
+    for summary in summaries:
+        for name, bench in summary["benchmarks"].items():
+            target = merged["benchmarks"].setdefault(name, {**bench, "runs": []})
+            target["runs"].extend(bench["runs"])
+    return merged
+
+
+def load_run(path: str) -> Dict[str, Any]:
+    """Read either raw pytest-benchmark JSON or an already summarized baseline"""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    if isinstance(raw.get("benchmarks"), dict):
+        return raw
+    return summarize_run(raw)
+
+
+def load_runs(paths: List[str]) -> Dict[str, Any]:
+    return merge_runs([load_run(path) for path in paths])
+
+
+def compare_runs(baseline: Dict[str, Any], current: Dict[str, Any],
+                 thresholds: Optional[Thresholds] = None) -> List[Finding]:
+    """All metrics for the benchmarks present in both runs"""
+    thresholds = thresholds or Thresholds()
+    findings = []
+    for name in sorted(set(baseline["benchmarks"]) & set(current["benchmarks"])):
+        base, cur = baseline["benchmarks"][name], current["benchmarks"][name]
+        metrics = [(f"p{pct:g}", thresholds.latency, False) for pct in LATENCY_PERCENTILES]
+        metrics.append(("ops", thresholds.throughput, True))
+        for metric, threshold, higher_is_better in metrics:
+            before = [run[metric] for run in base["runs"]]
+            after = [run[metric] for run in cur["runs"]]
+            change = _relative(statistics.median(before), statistics.median(after), higher_is_better)
+            lower = bootstrap_lower_bound(before, after, thresholds.alpha, higher_is_better)
+            findings.append(Finding(name, metric, statistics.median(before), statistics.median(after),
+                                    change, lower, lower > threshold))
+
+        if base.get("bytes_per_package") and cur.get("bytes_per_package"):
+            change = _relative(base["bytes_per_package"], cur["bytes_per_package"])
+            findings.append(Finding(name, "bytes_per_package", base["bytes_per_package"],
+                                    cur["bytes_per_package"], change, None, change > thresholds.memory))
+    return findings
+
+
+def print_findings(findings: List[Finding], missing: List[str]) -> None:
+    regressions = [f for f in findings if f.regression]
+    for finding in findings:
+        if finding.regression or finding.metric == "p50":
+            marker = "❌" if finding.regression else "  "
+            bound = f"≥{finding.lower_bound:+.1%}" if finding.lower_bound is not None else ""
+            print(f"{marker} {finding.benchmark:<45} {finding.metric:<18} "
+                  f"{finding.baseline:>14.6g} -> {finding.current:<14.6g} {finding.change:+7.1%} {bound}")
+    for name in missing:
+        print(f"⚠️  {name} saknas i baseline")
+    if regressions:
+        print(f"❌ {len(regressions)} regression(er) mot baseline")
+    else:
+        print(f"✅ Inga signifikanta regressioner ({len(findings)} mätvärden jämförda)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Jämför benchmark-resultat mot en baseline")
+    parser.add_argument("results", nargs="*", default=["results/benchmarks.json"],
+                        help="pytest-benchmark JSON (med --benchmark-save-data), en fil per upprepad körning")
+    parser.add_argument("--baseline", default="benchmarks/baseline.json", help="Incheckad baseline")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Skriv om baseline från resultaten i stället för att jämföra")
+    defaults = Thresholds()
+    parser.add_argument("--max-latency-regression", type=float, default=defaults.latency,
+                        help="Minsta försämring av p50/p95/p99 som fäller grinden (andel, default 0.10)")
+    parser.add_argument("--max-throughput-regression", type=float, default=defaults.throughput,
+                        help="Minsta försämring av ops/s som fäller grinden (andel, default 0.10)")
+    parser.add_argument("--max-memory-regression", type=float, default=defaults.memory,
+                        help="Tillåten ökning av bytes per paket (andel, default 0.05)")
+    parser.add_argument("--alpha", type=float, default=defaults.alpha,
+                        help="Ensidig nivå för bootstrap-gränsen (default 0.05)")
+    parser.add_argument("--min-runs", type=int, default=defaults.min_runs,
+                        help="Minsta antal upprepade körningar i resultat och baseline (default 3)")
+    args = parser.parse_args(argv)
+
+    current = load_runs(args.results)
+    if args.update_baseline:
+        print(f"💾 Baseline med {current['runs']} körning(ar) sparad i {write_results(current, args.baseline)}")
+        return 0
+
+    baseline = load_run(args.baseline)
+    if min(baseline["runs"], current["runs"]) < args.min_runs:
+        # En enda körning säger inget om brus mellan körningar - jämförelsen vore bara ett råt delta
+        print(f"❌ Behöver minst {args.min_runs} körningar, har {current['runs']} "
+              f"(baseline {baseline['runs']})")
+        return 2
+    if baseline["machine_info"] != current["machine_info"]:
+        # Absoluta tider från en annan maskin avgör inget om koden - jämför inte alls
+        print(f"❌ Baseline är från en annan maskin: {baseline['machine_info']}, "
+              f"den här är {current['machine_info']}")
+        print("   Generera om baseline på den här maskinklassen med --update-baseline")
+        return 3
+    thresholds = Thresholds(args.max_latency_regression, args.max_throughput_regression,
+                            args.max_memory_regression, args.alpha, args.min_runs)
+    findings = compare_runs(baseline, current, thresholds)
+    print_findings(findings, sorted(set(current["benchmarks"]) - set(baseline["benchmarks"])))
+    return 1 if any(f.regression for f in findings) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
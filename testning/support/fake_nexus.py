@@ -0,0 +1,496 @@
+"""
+Lightweight fake Nexus Repository Manager for offline tests and benchmarks
+
+A pure ASGI app implementing the Nexus REST endpoints the API and
+nexus_support use: status, repositories (list/create/rebuild-index),
+components and assets with continuation tokens, component upload and
+asset download. It starts in milliseconds instead of minutes.
+
+Use it in-process through httpx.ASGITransport:
+
+    fake = FakeNexus.with_catalog(components_per_repository=1000)
+    nexus = NexusClient(base_url="http://nexus.test", transport=httpx.ASGITransport(app=fake))
+
+or over real HTTP with serve() (uvicorn in a thread) or as a subprocess:
+
+    python -m support.fake_nexus --port 8081 --latency "*=lognormal:20:0.5" --error-rate 0.01
+
+Latency distributions, error rates and payload sizes are set per route
+name (see ROUTES) with "*" as the default, so upstream performance
+features can be exercised against a slow or flaky Nexus.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote
+
+from support.synthetic_data import generate_packages, generate_repositories
+
+NEXUS_VERSION = "3.41.1-01"
+# Riktiga Nexus skickar versionen i Server-headern på varje svar
+SERVER_HEADER = f"Nexus/{NEXUS_VERSION} (OSS)".encode()
+
+# Nexus formatnamn per format i API:t, och multipart-fältet för upload
+NEXUS_FORMATS = {"pypi": "pypi", "apt": "apt", "rpm": "yum", "docker": "docker"}
+UPLOAD_FIELDS = {"pypi": "pypi.asset", "apt": "apt.asset", "yum": "yum.asset"}
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class LatencyDistribution:
+    """Response delay in milliseconds
+
+    kind is one of fixed (always mean_ms), uniform (mean_ms +/- spread),
+    exponential (mean mean_ms) or lognormal (median mean_ms, sigma spread).
+    """
+    kind: str = "fixed"
+    mean_ms: float = 0.0
+    spread: float = 0.0
+
+    KINDS = ("fixed", "uniform", "exponential", "lognormal")
+
+    def __post_init__(self):
+        if self.kind not in self.KINDS:
+            raise ValueError(f"Okänd latensfördelning {self.kind!r}, välj bland {self.KINDS}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """'lognormal:20:0.5', 'uniform:50:10' or just '5' (fixed)"""
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls("fixed", float(parts[0]))
+        return cls(parts[0], float(parts[1]), float(parts[2]) if len(parts) > 2 else 0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        """One delay in seconds"""
+        if self.kind == "fixed":
+            delay = self.mean_ms
+        elif self.kind == "uniform":
+            delay = rng.uniform(self.mean_ms - self.spread, self.mean_ms + self.spread)
+        elif self.kind == "exponential":
+            delay = rng.expovariate(1 / self.mean_ms) if self.mean_ms > 0 else 0.0
+        else:
+            delay = rng.lognormvariate(math.log(self.mean_ms), self.spread) if self.mean_ms > 0 else 0.0
+        return max(delay, 0.0) / 1000
+
+
+def parse_route_map(spec: str, parse_value: Callable[[str], Any]) -> Dict[str, Any]:
+    """'components=lognormal:50:0.5,*=5' -> {"components": ..., "*": ...}; a bare value means "*" """
+    values = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        route, _, value = entry.rpartition("=")
+        values[route or "*"] = parse_value(value)
+    return values
+
+
+@dataclass
+class FakeNexusConfig:
+    """Behaviour of the fake, per route name with "*" as default"""
+    latency: Dict[str, LatencyDistribution] = field(default_factory=dict)
+    error_rate: Dict[str, float] = field(default_factory=dict)
+    error_statuses: Tuple[int, ...] = (500, 502, 503)
+    page_size: int = 10                 # samma sidstorlek som riktiga Nexus
+    asset_size: int = 1024              # bytes per genererad asset
+    attribute_padding: int = 0          # extra bytes i varje komponent-JSON
+    seed: int = 42
+
+    @classmethod
+    def from_env(cls) -> "FakeNexusConfig":
+        """FAKE_NEXUS_LATENCY, FAKE_NEXUS_ERROR_RATE, FAKE_NEXUS_PAGE_SIZE, FAKE_NEXUS_ASSET_SIZE ..."""
+        return cls(
+            latency=parse_route_map(os.getenv("FAKE_NEXUS_LATENCY", ""), LatencyDistribution.parse),
+            error_rate=parse_route_map(os.getenv("FAKE_NEXUS_ERROR_RATE", ""), float),
+            page_size=int(os.getenv("FAKE_NEXUS_PAGE_SIZE", "10")),
+            asset_size=int(os.getenv("FAKE_NEXUS_ASSET_SIZE", "1024")),
+            attribute_padding=int(os.getenv("FAKE_NEXUS_ATTRIBUTE_PADDING", "0")),
+            seed=int(os.getenv("FAKE_NEXUS_SEED", "42")),
+        )
+
+    def latency_for(self, route: str) -> Optional[LatencyDistribution]:
+        return self.latency.get(route, self.latency.get("*"))
+
+    def error_rate_for(self, route: str) -> float:
+        return self.error_rate.get(route, self.error_rate.get("*", 0.0))
+
+
+@dataclass
+class FakeAsset:
+    path: str
+    size: int
+    content: Optional[bytes] = None     # None = genererat innehåll av storlek size
+    sha1: Optional[str] = None
+    last_modified: str = ""
+
+    def body(self) -> bytes:
+        if self.content is None:
+            # Deterministiskt innehåll så att checksummor är stabila mellan körningar
+            pattern = hashlib.sha256(self.path.encode("utf-8")).digest()
+            self.content = (pattern * (self.size // len(pattern) + 1))[:self.size]
+        return self.content
+
+    def checksum(self) -> Dict[str, str]:
+        if self.sha1 is None:
+            self.sha1 = hashlib.sha1(self.body()).hexdigest()
+        return {"sha1": self.sha1}
+
+
+@dataclass
+class FakeComponent:
+    repository: str
+    name: str
+    version: str
+    assets: List[FakeAsset]
+
+
+def _nexus_id(*parts: str) -> str:
+    return base64.urlsafe_b64encode(":".join(parts).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def split_filename(filename: str) -> Tuple[str, str]:
+    """'requests-2.31.0.tar.gz' -> ('requests', '2.31.0'); the version is 'unknown' when missing"""
+    match = re.match(r"^(?P<name>.+?)[-_](?P<version>\d[^-_]*?)(?:[-_].*)?(?:\.tar\.gz|\.[a-z0-9]+)?$", filename)
+    if not match:
+        return filename, "unknown"
+    return match.group("name"), match.group("version")
+
+
+def parse_multipart(body: bytes, content_type: str) -> Dict[str, Tuple[Optional[str], bytes]]:
+    """Form fields as {name: (filename, value)}"""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise ValueError("multipart utan boundary")
+    delimiter = b"--" + match.group(1).encode("latin-1")
+    fields = {}
+    for part in body.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break
+        head, _, value = part.partition(b"\r\n\r\n")
+        disposition = head.decode("utf-8", "replace")
+        name = re.search(r'name="([^"]*)"', disposition)
+        filename = re.search(r'filename="([^"]*)"', disposition)
+        if name:
+            fields[name.group(1)] = (filename.group(1) if filename else None, value[:-2] if value.endswith(b"\r\n") else value)
+    return fields
+
+
+class FakeNexus:
+    """ASGI app that behaves like the parts of the Nexus REST API we use"""
+
+    # (metod, mönster, route-namn) - route-namnet styr latens och felfrekvens
+    ROUTES = (
+        ("GET", r"/service/rest/v1/status", "status"),
+        ("GET", r"/service/rest/v1/status/writable", "status"),
+        ("GET", r"/service/rest/v1/repositories", "repositories"),
+        ("POST", r"/service/rest/v1/repositories/(?P<format>[^/]+)/hosted", "create_repository"),
+        ("POST", r"/service/rest/v1/repositories/(?P<repository>[^/]+)/rebuild-index", "rebuild_index"),
+        ("GET", r"/service/rest/v1/components", "components"),
+        ("POST", r"/service/rest/v1/components", "upload"),
+        ("GET", r"/service/rest/v1/assets", "assets"),
+        ("GET", r"/repository/(?P<repository>[^/]+)/(?P<path>.+)", "download"),
+    )
+
+    def __init__(self, config: Optional[FakeNexusConfig] = None):
+        self.config = config or FakeNexusConfig()
+        self.rng = random.Random(self.config.seed)
+        self.repositories: Dict[str, Dict[str, Any]] = {}
+        self.components: Dict[str, List[FakeComponent]] = {}
+        self.requests: Counter = Counter()
+        self.injected_errors: Counter = Counter()
+        self._routes = [(method, re.compile(pattern + "$"), name, getattr(self, f"_{name}"))
+                        for method, pattern, name in self.ROUTES]
+
+    @classmethod
+    def with_catalog(cls, repositories: int = 4, components_per_repository: int = 100,
+                     config: Optional[FakeNexusConfig] = None) -> "FakeNexus":
+        """A fake pre-filled with deterministic repositories and components (see synthetic_data)"""
+        fake = cls(config)
+        repository_rows = generate_repositories(repositories, seed=fake.config.seed)
+        for row in repository_rows:
+            fake.add_repository(row["name"], NEXUS_FORMATS[row["format"]])
+        rows = generate_packages(repositories * components_per_repository, repository_rows, seed=fake.config.seed)
+        for row in rows:
+            fake.add_component(row["repository"], row["name"], row["version"])
+        return fake
+
+    def add_repository(self, name: str, nexus_format: str, repository_type: str = "hosted") -> Dict[str, Any]:
+        repository = {"name": name, "format": nexus_format, "type": repository_type, "attributes": {}}
+        self.repositories[name] = repository
+        self.components.setdefault(name, [])
+        return repository
+
+    def add_component(self, repository: str, name: str, version: str,
+                      filename: Optional[str] = None, content: Optional[bytes] = None) -> FakeComponent:
+        filename = filename or f"{name}-{version}.tar.gz"
+        asset = FakeAsset(
+            path=f"{name}/{version}/{filename}",
+            size=len(content) if content is not None else self.config.asset_size,
+            content=content,
+            last_modified=_now(),
+        )
+        component = FakeComponent(repository, name, version, [asset])
+        self.components[repository].append(component)
+        return component
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "injected_errors": dict(self.injected_errors),
+            "repositories": len(self.repositories),
+            "components": sum(len(items) for items in self.components.values()),
+        }
+
+    # ASGI
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        path = unquote(scope["path"])
+        for method, pattern, name, handler in self._routes:
+            match = pattern.match(path)
+            if match and method == scope["method"]:
+                break
+        else:
+            await self._send_json(send, 404, {"message": f"Not found: {path}"})
+            return
+
+        self.requests[name] += 1
+        latency = self.config.latency_for(name)
+        if latency is not None:
+            await asyncio.sleep(latency.sample(self.rng))
+        if self.rng.random() < self.config.error_rate_for(name):
+            self.injected_errors[name] += 1
+            status = self.rng.choice(self.config.error_statuses)
+            await self._send_json(send, status, {"message": f"Injected error for {name}"})
+            return
+
+        query = {key: values[-1] for key, values in parse_qs(scope.get("query_string", b"").decode()).items()}
+        request = {"scope": scope, "receive": receive, "query": query, **match.groupdict()}
+        status, payload = await handler(request)
+        if isinstance(payload, Iterator):
+            await self._send_stream(send, status, payload)
+        else:
+            await self._send_json(send, status, payload)
+
+    @staticmethod
+    async def _send_json(send: Callable, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        headers = [(b"content-length", str(len(body)).encode()), (b"server", SERVER_HEADER)]
+        if payload is not None:
+            headers.append((b"content-type", b"application/json"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _send_stream(send: Callable, status: int, chunks: Iterator[bytes]) -> None:
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/octet-stream"), (b"server", SERVER_HEADER)]})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    @staticmethod
+    def _base_url(scope: Dict[str, Any]) -> str:
+        host = dict(scope.get("headers", [])).get(b"host", b"nexus").decode("latin-1")
+        return f"{scope.get('scheme', 'http')}://{host}"
+
+    # Endpoints
+
+    async def _status(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        # Som riktiga Nexus: tom 200 när noden kan svara, versionen finns bara i Server-headern
+        return 200, None
+
+    async def _repositories(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        base_url = self._base_url(request["scope"])
+        return 200, [dict(repository, url=f"{base_url}/repository/{repository['name']}")
+                     for repository in self.repositories.values()]
+
+    async def _create_repository(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        body = json.loads(await self._read_body(request["receive"]) or b"{}")
+        name = body.get("name")
+        if not name:
+            return 400, [{"id": "name", "message": "may not be null"}]
+        if name in self.repositories:
+            return 400, [{"id": "name", "message": f"Repository {name} already exists"}]
+        self.add_repository(name, request["format"])
+        return 201, None
+
+    async def _rebuild_index(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        if request["repository"] not in self.repositories:
+            return 404, {"message": f"Repository not found: {request['repository']}"}
+        return 204, None
+
+    def _page(self, items: List[Any], token: Optional[str]) -> Tuple[List[Any], Optional[str]]:
+        """One page and the token for the next; the token is the hex offset"""
+        start = int(token, 16) if token else 0
+        end = start + self.config.page_size
+        return items[start:end], (format(end, "x") if end < len(items) else None)
+
+    def _listing(self, request: Dict[str, Any],
+                 render: Callable[[str, List[FakeComponent]], List[Dict[str, Any]]]) -> Tuple[int, Any]:
+        repository = request["query"].get("repository")
+        if repository not in self.repositories:
+            return 404, {"message": f"Repository not found: {repository}"}
+        try:
+            page, token = self._page(self.components[repository], request["query"].get("continuationToken"))
+        except ValueError:
+            return 400, {"message": "Invalid continuation token"}
+        return 200, {"items": render(self._base_url(request["scope"]), page), "continuationToken": token}
+
+    def _asset_json(self, base_url: str, component: FakeComponent, asset: FakeAsset) -> Dict[str, Any]:
+        return {
+            "id": _nexus_id(component.repository, asset.path),
+            "downloadUrl": f"{base_url}/repository/{component.repository}/{asset.path}",
+            "path": asset.path,
+            "repository": component.repository,
+            "format": self.repositories[component.repository]["format"],
+            "checksum": asset.checksum(),
+            "contentType": "application/octet-stream",
+            "lastModified": asset.last_modified,
+            "fileSize": asset.size,
+        }
+
+    def _component_json(self, base_url: str, component: FakeComponent) -> Dict[str, Any]:
+        item = {
+            "id": _nexus_id(component.repository, component.name, component.version),
+            "repository": component.repository,
+            "format": self.repositories[component.repository]["format"],
+            "group": None,
+            "name": component.name,
+            "version": component.version,
+            "assets": [self._asset_json(base_url, component, asset) for asset in component.assets],
+        }
+        if self.config.attribute_padding:
+            item["attributes"] = {"padding": "x" * self.config.attribute_padding}
+        return item
+
+    async def _components(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        return self._listing(request, lambda base_url, page: [
+            self._component_json(base_url, component) for component in page
+        ])
+
+    async def _assets(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        # Förenkling: sidindelningen görs per komponent (en asset per komponent som standard)
+        return self._listing(request, lambda base_url, page: [
+            self._asset_json(base_url, component, asset) for component in page for asset in component.assets
+        ])
+
+    async def _upload(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        repository = request["query"].get("repository")
+        if repository not in self.repositories:
+            return 404, {"message": f"Repository not found: {repository}"}
+        content_type = dict(request["scope"]["headers"]).get(b"content-type", b"").decode("latin-1")
+        try:
+            fields = parse_multipart(await self._read_body(request["receive"]), content_type)
+        except ValueError as e:
+            return 400, {"message": str(e)}
+        file_field = UPLOAD_FIELDS.get(self.repositories[repository]["format"])
+        if file_field not in fields or fields[file_field][0] is None:
+            return 400, [{"id": file_field, "message": "Missing asset"}]
+        filename, content = fields[file_field]
+        name, version = split_filename(filename)
+        self.add_component(repository, name, version, filename, content)
+        return 204, None
+
+    async def _download(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        for component in self.components.get(request["repository"], []):
+            for asset in component.assets:
+                if asset.path == request["path"]:
+                    body = asset.body()
+                    return 200, iter([body[i:i + DOWNLOAD_CHUNK_SIZE]
+                                      for i in range(0, len(body), DOWNLOAD_CHUNK_SIZE)] or [b""])
+        return 404, {"message": f"Not found: {request['path']}"}
+
+
+@contextmanager
+def serve(app: FakeNexus, host: str = "127.0.0.1", port: Optional[int] = None,
+          start_timeout: float = 10.0) -> Iterator[str]:
+    """Serve the fake over HTTP with uvicorn in a background thread; yields the base URL"""
+    import uvicorn
+    from support.port_forward_pool import free_port
+
+    port = port or free_port()
+    # server_header=False: fejken sätter själv Nexus Server-header, uvicorns egen skulle slås ihop med den
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off",
+                                           server_header=False))
+    thread = threading.Thread(target=server.run, name="fake-nexus", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + start_timeout
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError(f"Fake Nexus startade inte på {host}:{port}")
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fejkad Nexus för tester och benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--repositories", type=int, default=4, help="Antal förifyllda repositories")
+    parser.add_argument("--components", type=int, default=100, help="Komponenter per repository")
+    parser.add_argument("--latency", help='Per route, t.ex. "components=lognormal:50:0.5,*=5" (FAKE_NEXUS_LATENCY)')
+    parser.add_argument("--error-rate", help='Andel fel per route, t.ex. "upload=0.1,*=0.01" (FAKE_NEXUS_ERROR_RATE)')
+    parser.add_argument("--page-size", type=int)
+    parser.add_argument("--asset-size", type=int)
+    parser.add_argument("--attribute-padding", type=int)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+    # Flaggor går före miljövariabler
+    config = FakeNexusConfig.from_env()
+    if args.latency is not None:
+        config.latency = parse_route_map(args.latency, LatencyDistribution.parse)
+    if args.error_rate is not None:
+        config.error_rate = parse_route_map(args.error_rate, float)
+    for name in ("page_size", "asset_size", "attribute_padding", "seed"):
+        if getattr(args, name) is not None:
+            setattr(config, name, getattr(args, name))
+    fake = FakeNexus.with_catalog(args.repositories, args.components, config)
+    print(f"🧪 Fake Nexus med {fake.stats()['components']} komponenter på http://{args.host}:{args.port}")
+    uvicorn.run(fake, host=args.host, port=args.port, log_level="warning", server_header=False)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,7 +8,8 @@ from typing import List
 def navigate_to_docs(playwright_client: PlaywrightClient, base_url: str) -> None:
     """Navigera till docs-sidan och vänta på att den laddas"""
     playwright_client.navigate_to(f"{base_url.rstrip('/')}/docs")
-    playwright_client.wait_for_load_state()
+    # domcontentloaded + selektor i stället för networkidle - Swagger UI renderar när schemat laddats
+    playwright_client.wait_for_load_state("domcontentloaded")
     playwright_client.wait_for_selector(".swagger-ui", timeout=10000)
 
 
@@ -257,22 +258,6 @@ def wait_for_swagger_ui_loaded(playwright_client: PlaywrightClient) -> None:
     # Vänta på grundläggande Swagger UI
     playwright_client.wait_for_selector(".swagger-ui", timeout=10000)
     
-    # Vänta lite extra för att API-schemat ska ladda
-    playwright_client.wait_for_timeout(2000)
-    
-    # Kontrollera att endpoints har laddats
-    playwright_client.execute_javascript("""
-        // Vänta på att endpoints ska visas
-        let attempts = 0;
-        const checkEndpoints = () => {
-            const endpoints = document.querySelectorAll('.opblock, [class*="opblock"]');
-            if (endpoints.length > 0 || attempts > 10) {
-                return;
-            }
-            attempts++;
-            setTimeout(checkEndpoints, 500);
-        };
-        checkEndpoints();
-    """)
-    
-    playwright_client.wait_for_timeout(1000)
+    # Endpoints visas när API-schemat har laddats - vänta på dem i stället för fasta pauser.
+    # Inget except: ett schema som aldrig renderas ska fälla testet, inte ge tomma sökningar senare
+    playwright_client.wait_for_selector(".swagger-ui .opblock", timeout=10000)
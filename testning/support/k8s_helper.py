@@ -3,18 +3,35 @@ Kubernetes helper utilities for testing
 """
 import subprocess
 import json
-from typing import Dict, List, Optional
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+# Namespaces som labbet deployar till
+DEFAULT_NAMESPACES = ("nexus", "nexus-api", "kong")
 
 
 class K8sHelper:
-    """Helper class for Kubernetes operations during testing"""
-    
-    def __init__(self):
+    """Helper class for Kubernetes operations during testing
+
+    With snapshot=True, pods and services for all namespaces are fetched in
+    one kubectl call and repeated queries are answered from memory until
+    invalidate() is called.
+    """
+
+    def __init__(self, snapshot: bool = False, namespaces: Optional[List[str]] = None, kubectl: str = "kubectl"):
         self.context = "kind-nexus-cluster"
+        self.kubectl = kubectl
+        self.snapshot_mode = snapshot
+        self.namespaces = list(namespaces or DEFAULT_NAMESPACES)
+        self._snapshot: Optional[Dict[str, List[Dict]]] = None
+        self.kubectl_calls = 0
     
     def run_kubectl(self, command: str) -> subprocess.CompletedProcess:
         """Run kubectl command"""
-        full_command = f"kubectl --context={self.context} {command}"
+        self.kubectl_calls += 1
+        full_command = f"{self.kubectl} --context={self.context} {command}"
         return subprocess.run(
             full_command.split(),
             capture_output=True,
@@ -22,8 +39,29 @@ class K8sHelper:
             check=False
         )
     
+    def snapshot(self) -> Dict[str, List[Dict]]:
+        """Pods and services for all namespaces, fetched with a single kubectl call"""
+        if self._snapshot is None:
+            result = self.run_kubectl("get pods,services -A -o json")
+            items = json.loads(result.stdout).get('items', []) if result.returncode == 0 else []
+            self._snapshot = {"Pod": [], "Service": []}
+            for item in items:
+                if item.get('metadata', {}).get('namespace') in self.namespaces:
+                    self._snapshot.setdefault(item.get('kind'), []).append(item)
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next query fetches fresh state"""
+        self._snapshot = None
+
+    def _from_snapshot(self, kind: str, namespace: Optional[str]) -> List[Dict]:
+        return [item for item in self.snapshot().get(kind, [])
+                if namespace is None or item['metadata']['namespace'] == namespace]
+
     def get_pods(self, namespace: str = None) -> List[Dict]:
         """Get pods from Kubernetes"""
+        if self.snapshot_mode and (namespace is None or namespace in self.namespaces):
+            return self._from_snapshot("Pod", namespace)
         cmd = "get pods -o json"
         if namespace:
             cmd += f" -n {namespace}"
@@ -37,6 +75,8 @@ class K8sHelper:
     
     def get_services(self, namespace: str = None) -> List[Dict]:
         """Get services from Kubernetes"""
+        if self.snapshot_mode and (namespace is None or namespace in self.namespaces):
+            return self._from_snapshot("Service", namespace)
         cmd = "get services -o json"
         if namespace:
             cmd += f" -n {namespace}"
@@ -48,29 +88,123 @@ class K8sHelper:
         data = json.loads(result.stdout)
         return data.get('items', [])
     
+    @staticmethod
+    def pod_ready(pod: Dict) -> bool:
+        """True if the pod's Ready condition is True"""
+        conditions = pod.get('status', {}).get('conditions', [])
+        for condition in conditions:
+            if condition['type'] == 'Ready':
+                return condition['status'] == 'True'
+        return False
+
     def is_pod_ready(self, pod_name: str, namespace: str) -> bool:
         """Check if a pod is ready"""
-        pods = self.get_pods(namespace)
+        if self.snapshot_mode and namespace in self.namespaces:
+            pods = self._from_snapshot("Pod", namespace)
+        else:
+            # Hämta bara den pod som efterfrågas
+            result = self.run_kubectl(f"get pod {pod_name} -n {namespace} -o json")
+            pods = [json.loads(result.stdout)] if result.returncode == 0 else []
         for pod in pods:
             if pod['metadata']['name'] == pod_name:
-                conditions = pod.get('status', {}).get('conditions', [])
-                for condition in conditions:
-                    if condition['type'] == 'Ready':
-                        return condition['status'] == 'True'
+                return self.pod_ready(pod)
         return False
+
+    def watch_pods(self, namespace: str, selector: Optional[str] = None,
+                   timeout: float = 120) -> Iterator[Dict]:
+        """Stream watch events ({'type', 'object'}) for pods from one kubectl watch process"""
+        cmd = f"{self.kubectl} --context={self.context} get pods -n {namespace} --watch --output-watch-events -o json"
+        if selector:
+            cmd += f" -l {selector}"
+        self.kubectl_calls += 1
+        process = subprocess.Popen(cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        lines: "queue.Queue[Optional[str]]" = queue.Queue()
+
+        def reader() -> None:
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)
+
+        threading.Thread(target=reader, name="kubectl-watch", daemon=True).start()
+        deadline = time.monotonic() + timeout
+        buffer = ""
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    line = lines.get(timeout=remaining)
+                except queue.Empty:
+                    return
+                if line is None:
+                    return
+                buffer += line
+                # kubectl skriver varje event som pretty-printad JSON som slutar med "}" i kolumn 0
+                if line.rstrip() == "}":
+                    event = json.loads(buffer)
+                    buffer = ""
+                    yield event if "object" in event else {"type": "MODIFIED", "object": event}
+        finally:
+            process.kill()
+            process.wait()
+
+    def list_pods(self, namespace: str, selector: Optional[str] = None) -> List[Dict]:
+        """Fresh pod listing for one namespace (never answered from the snapshot)"""
+        cmd = f"get pods -n {namespace} -o json"
+        if selector:
+            cmd += f" -l {selector}"
+        result = self.run_kubectl(cmd)
+        return json.loads(result.stdout).get('items', []) if result.returncode == 0 else []
+
+    def wait_until_ready(self, namespace: str, selector: Optional[str] = None,
+                         pod_names: Optional[List[str]] = None, timeout: float = 120) -> bool:
+        """Wait on a single watch stream until the pods in a namespace are Ready
+
+        Without pod_names the expected pods come from an initial listing (plus
+        pods added while watching), so the first Ready pod in the watch stream
+        cannot end the wait before its siblings have been reported.
+        """
+        pods = {pod['metadata']['name']: self.pod_ready(pod) for pod in self.list_pods(namespace, selector)}
+        expected = set(pod_names) if pod_names else set(pods)
+
+        def all_ready() -> bool:
+            return bool(expected) and all(pods.get(pod_name, False) for pod_name in expected)
+
+        try:
+            if all_ready():
+                return True
+            for event in self.watch_pods(namespace, selector, timeout):
+                pod = event["object"]
+                name = pod['metadata']['name']
+                if event["type"] == "DELETED":
+                    pods.pop(name, None)
+                    if not pod_names:
+                        expected.discard(name)
+                else:
+                    pods[name] = self.pod_ready(pod)
+                    if not pod_names:
+                        expected.add(name)
+                if all_ready():
+                    return True
+            return False
+        finally:
+            self.invalidate()
     
     def get_pod_logs(self, pod_name: str, namespace: str, lines: int = 50) -> str:
         """Get pod logs"""
         result = self.run_kubectl(f"logs {pod_name} -n {namespace} --tail={lines}")
         return result.stdout if result.returncode == 0 else ""
     
-    def port_forward(self, service: str, namespace: str, local_port: int, remote_port: int) -> subprocess.Popen:
-        """Start port forwarding"""
+    def port_forward(self, service: str, namespace: str, local_port: int, remote_port: int,
+                     quiet: bool = False) -> subprocess.Popen:
+        """Start port forwarding (quiet=True discards output so long-lived forwards never block on a full pipe)"""
         cmd = f"port-forward -n {namespace} svc/{service} {local_port}:{remote_port}"
+        output = subprocess.DEVNULL if quiet else subprocess.PIPE
         return subprocess.Popen(
-            f"kubectl --context={self.context} {cmd}".split(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            f"{self.kubectl} --context={self.context} {cmd}".split(),
+            stdout=output,
+            stderr=output
         )
     
     def get_cluster_info(self) -> Dict:
@@ -2,7 +2,9 @@
 Kubernetes integration test functions
 """
 import pytest
+import requests
 from support.k8s_helper import K8sHelper
+from support.port_forward_pool import PortForwardError, PortForwardPool
 
 
 def test_cluster_running(k8s_helper: K8sHelper):
@@ -106,3 +108,18 @@ def test_pod_health(k8s_helper: K8sHelper):
             assert k8s_helper.is_pod_ready(kong_pod_name, "kong")
     except Exception:
         pytest.skip("kubectl not available in test environment")
+
+
+def test_services_reachable_directly(port_forward_pool: PortForwardPool):
+    """Test that the API and Nexus answer on their own services, bypassing Kong"""
+    try:
+        api_url = port_forward_pool.url("nexus-api-service", "nexus-api", 3000)
+        nexus_url = port_forward_pool.url("nexus-service", "nexus", 8081)
+    except (PortForwardError, OSError):
+        pytest.skip("kubectl port-forward not available in test environment")
+
+    assert requests.get(f"{api_url}/api/health", timeout=10).status_code == 200
+    assert requests.get(f"{nexus_url}/service/rest/v1/status", timeout=10).status_code == 200
+    # Andra uppslaget återanvänder forwarden i stället för att starta en ny kubectl-process
+    assert port_forward_pool.url("nexus-api-service", "nexus-api", 3000) == api_url
+    assert port_forward_pool.stats["reused"] >= 1
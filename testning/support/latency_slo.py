@@ -0,0 +1,246 @@
+"""
+Latency SLO plugin for the API test suites
+
+Every request made through APIClient or AsyncAPIClient during a test is
+timed. Tests declare per-endpoint p95 budgets with a marker:
+
+    @pytest.mark.latency_budget("/health", p95_ms=100)
+    @pytest.mark.latency_budget("/packages/*", p95_ms=300, method="GET")
+    @pytest.mark.latency_budget(p95_ms=500)      # alla requests i testet
+
+A test whose p95 for a budget is over the limit fails, as does a budget that
+matched no requests (usually a typo in the pattern). The distributions are
+added to report.html through pytest-html and saved to LATENCY_REPORT
+(results/latency.json). LATENCY_BUDGET_SCALE multiplies every budget, for
+slower machines.
+"""
+import html
+import os
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:  # utan pytest-html blir det bara JSON-rapporten
+    html_extras = None
+
+from support.api_client import RequestTiming, timing_listeners
+from support.load_generator import percentile, write_results
+
+# Övre gränser (ms) för histogrammet i rapporten
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf"))
+
+_recorder_key = pytest.StashKey["LatencyRecorder"]()
+_latency_reports: List[Dict[str, Any]] = []
+
+
+def endpoint_path(endpoint: str) -> str:
+    """'/packages?x=1' and 'packages' both become '/packages'"""
+    return "/" + endpoint.split("?", 1)[0].lstrip("/")
+
+
+@dataclass
+class LatencyBudget:
+    p95_ms: float
+    endpoint: Optional[str] = None      # fnmatch-mönster, None = alla requests
+    method: Optional[str] = None
+
+    @classmethod
+    def from_marker(cls, marker: Any) -> "LatencyBudget":
+        if len(marker.args) > 1 or "p95_ms" not in marker.kwargs:
+            raise pytest.UsageError(
+                f"latency_budget tar ett endpoint-mönster och p95_ms=..., fick {marker.args} {marker.kwargs}"
+            )
+        endpoint = marker.args[0] if marker.args else marker.kwargs.get("endpoint")
+        method = marker.kwargs.get("method")
+        return cls(float(marker.kwargs["p95_ms"]), endpoint, method.upper() if method else None)
+
+    @property
+    def label(self) -> str:
+        return f"{self.method or '*'} {endpoint_path(self.endpoint) if self.endpoint else '*'}"
+
+    def matches(self, timing: RequestTiming) -> bool:
+        if self.method and timing.method.upper() != self.method:
+            return False
+        return self.endpoint is None or fnmatch(endpoint_path(timing.endpoint), endpoint_path(self.endpoint))
+
+
+@dataclass
+class BudgetResult:
+    budget: str
+    limit_ms: float
+    requests: int
+    p95_ms: Optional[float]
+
+    @property
+    def ok(self) -> bool:
+        return self.p95_ms is not None and self.p95_ms <= self.limit_ms
+
+
+class LatencyRecorder:
+    """Timing listener that collects the requests of one test"""
+
+    def __init__(self):
+        self.timings: List[RequestTiming] = []
+
+    def __call__(self, timing: RequestTiming) -> None:
+        self.timings.append(timing)
+
+    def distributions(self) -> Dict[str, List[float]]:
+        """Sorted latencies in ms per 'METHOD /path'"""
+        by_endpoint: Dict[str, List[float]] = {}
+        for timing in self.timings:
+            key = f"{timing.method.upper()} {endpoint_path(timing.endpoint)}"
+            by_endpoint.setdefault(key, []).append(timing.elapsed * 1000)
+        return {key: sorted(values) for key, values in sorted(by_endpoint.items())}
+
+
+def budget_scale() -> float:
+    return float(os.getenv("LATENCY_BUDGET_SCALE", "1.0"))
+
+
+def evaluate_budgets(budgets: List[LatencyBudget], timings: List[RequestTiming],
+                     scale: float = 1.0) -> List[BudgetResult]:
+    """p95 of the matching requests for each budget"""
+    results = []
+    for budget in budgets:
+        latencies = sorted(t.elapsed * 1000 for t in timings if budget.matches(t))
+        results.append(BudgetResult(
+            budget.label,
+            round(budget.p95_ms * scale, 3),
+            len(latencies),
+            round(percentile(latencies, 95.0), 3) if latencies else None,
+        ))
+    return results
+
+
+def summarize_distribution(latencies_ms: List[float]) -> Dict[str, Any]:
+    """Percentiles and histogram counts for already sorted latencies (ms)"""
+    histogram = [0] * len(HISTOGRAM_BUCKETS_MS)
+    for value in latencies_ms:
+        histogram[next(i for i, limit in enumerate(HISTOGRAM_BUCKETS_MS) if value <= limit)] += 1
+    summary = {f"p{pct:g}": round(percentile(latencies_ms, pct), 3) for pct in (50.0, 95.0, 99.0)}
+    summary.update(requests=len(latencies_ms), max=round(latencies_ms[-1], 3), histogram=histogram)
+    return summary
+
+
+def render_html(distributions: Dict[str, Dict[str, Any]], results: List[BudgetResult]) -> str:
+    """HTML table for report.html: percentiles, histogram and budget verdicts"""
+    def bucket_label(limit: float) -> str:
+        return "&gt;2500" if limit == float("inf") else f"&le;{limit:g}"
+
+    rows = []
+    for key, summary in distributions.items():
+        peak = max(summary["histogram"]) or 1
+        bars = "".join(
+            f'<span title="{bucket_label(limit)} ms: {count}" style="display:inline-block;width:8px;'
+            f'margin-right:1px;vertical-align:bottom;background:#4a90d9;height:{2 + 18 * count // peak}px"></span>'
+            for limit, count in zip(HISTOGRAM_BUCKETS_MS, summary["histogram"])
+        )
+        rows.append(
+            f"<tr><td>{html.escape(key)}</td><td>{summary['requests']}</td><td>{summary['p50']:.1f}</td>"
+            f"<td>{summary['p95']:.1f}</td><td>{summary['p99']:.1f}</td><td>{summary['max']:.1f}</td>"
+            f"<td>{bars}</td></tr>"
+        )
+    parts = [
+        "<div><b>Latens per endpoint (ms)</b>",
+        "<table><tr><th>Endpoint</th><th>n</th><th>p50</th><th>p95</th><th>p99</th><th>max</th>"
+        f"<th>Histogram ({', '.join(bucket_label(limit) for limit in HISTOGRAM_BUCKETS_MS)})</th></tr>",
+        *rows,
+        "</table>",
+    ]
+    if results:
+        parts.append("<table><tr><th>Budget</th><th>n</th><th>p95</th><th>Gräns</th><th></th></tr>")
+        for result in results:
+            p95 = f"{result.p95_ms:.1f}" if result.p95_ms is not None else "-"
+            verdict = "✅" if result.ok else "❌"
+            parts.append(f"<tr><td>{html.escape(result.budget)}</td><td>{result.requests}</td>"
+                         f"<td>{p95}</td><td>{result.limit_ms:g}</td><td>{verdict}</td></tr>")
+        parts.append("</table>")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def _budgets(item: pytest.Item) -> List[LatencyBudget]:
+    return [LatencyBudget.from_marker(marker) for marker in item.iter_markers("latency_budget")]
+
+
+def _stop_recording(item: pytest.Item) -> Optional[LatencyRecorder]:
+    recorder = item.stash.get(_recorder_key, None)
+    if recorder is not None and recorder in timing_listeners:
+        timing_listeners.remove(recorder)
+    return recorder
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "latency_budget(endpoint=None, p95_ms, method=None): fail the test if the p95 latency "
+        "of the matching requests exceeds p95_ms"
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield
+    # Starta efter fixtures så att bara testets egna requests räknas
+    recorder = LatencyRecorder()
+    item.stash[_recorder_key] = recorder
+    timing_listeners.append(recorder)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item):
+    """Runs after the test body passed: fail it if a budget is exceeded"""
+    recorder = _stop_recording(item)
+    budgets = _budgets(item)
+    if recorder is None or not budgets:
+        return
+    failures = []
+    for result in evaluate_budgets(budgets, recorder.timings, budget_scale()):
+        if result.p95_ms is None:
+            failures.append(f"latency_budget {result.budget}: inga requests matchade")
+        elif not result.ok:
+            failures.append(f"latency_budget {result.budget}: p95 {result.p95_ms:.1f} ms > "
+                            f"{result.limit_ms:g} ms ({result.requests} requests)")
+    if failures:
+        pytest.fail("\n".join(failures), pytrace=False)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call":
+        return
+    recorder = _stop_recording(item)
+    if recorder is None or not recorder.timings:
+        return
+    distributions = {key: summarize_distribution(values) for key, values in recorder.distributions().items()}
+    results = evaluate_budgets(_budgets(item), recorder.timings, budget_scale())
+    latency = {"endpoints": distributions, "budgets": [dict(asdict(r), ok=r.ok) for r in results]}
+    report.user_properties.append(("latency", latency))
+
+    if html_extras is not None:
+        report.extras = getattr(report, "extras", []) + [html_extras.html(render_html(distributions, results))]
+
+
+def pytest_runtest_teardown(item):
+    _stop_recording(item)
+
+
+def pytest_runtest_logreport(report):
+    """Collect the latency data (also from xdist workers) for the JSON report"""
+    if report.when == "call":
+        for name, value in report.user_properties:
+            if name == "latency":
+                _latency_reports.append({"test": report.nodeid, "outcome": report.outcome, **value})
+
+
+def pytest_sessionfinish(session):
+    path = os.getenv("LATENCY_REPORT", "results/latency.json")
+    if _latency_reports and path and not hasattr(session.config, "workerinput"):
+        write_results({"budget_scale": budget_scale(), "tests": _latency_reports}, path)
@@ -0,0 +1,300 @@
+"""
+Asyncio-based load generator for the FastAPI application
+
+Drives a weighted mix of list/get/upload/stats/search requests at a fixed
+arrival rate (open loop) against either a live URL (e.g. Kong via
+api_base_url) or an in-process ASGI app. Latency is measured from each
+request's *intended* start time, which corrects for coordinated omission:
+when the server stalls, the queued requests are charged for the wait.
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+# (metod, sökväg relativt api-basen, json-body)
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]]]
+
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+DEFAULT_REPOSITORIES = ["pypi-hosted", "apt-hosted", "rpm-hosted", "docker-hosted"]
+
+
+@dataclass
+class Operation:
+    """A named request type with a weight in the mix"""
+    name: str
+    weight: float
+    build: Callable[[random.Random], RequestSpec]
+    # Statuskoder utöver 2xx/3xx som är ett korrekt svar (t.ex. 404 vid sökning)
+    accepted: Tuple[int, ...] = ()
+
+    def is_error(self, status: int) -> bool:
+        return status == 0 or (status >= 400 and status not in self.accepted)
+
+
+def default_operations(repositories: Optional[List[str]] = None,
+                       package_names: Optional[List[str]] = None) -> Dict[str, Operation]:
+    """The standard operations, each with weight 1"""
+    repositories = repositories or DEFAULT_REPOSITORIES
+    package_names = package_names or ["requests", "numpy", "flask", "django", "pytest"]
+
+    def list_packages(rng: random.Random) -> RequestSpec:
+        return "GET", "/packages/", None
+
+    def get_repository(rng: random.Random) -> RequestSpec:
+        return "GET", f"/repositories/{rng.choice(repositories)}", None
+
+    def upload_package(rng: random.Random) -> RequestSpec:
+        return "POST", "/packages/", {
+            "name": f"load-{uuid.uuid4().hex[:12]}",
+            "version": f"{rng.randint(0, 9)}.{rng.randint(0, 99)}.{rng.randint(0, 999)}",
+            "repository": rng.choice(repositories),
+        }
+
+    def get_stats(rng: random.Random) -> RequestSpec:
+        return "GET", "/stats", None
+
+    def search_package(rng: random.Random) -> RequestSpec:
+        return "GET", f"/packages/{rng.choice(package_names)}", None
+
+    return {
+        "list": Operation("list", 1, list_packages),
+        "get": Operation("get", 1, get_repository),
+        "upload": Operation("upload", 1, upload_package),
+        "stats": Operation("stats", 1, get_stats),
+        "search": Operation("search", 1, search_package, accepted=(404,)),
+    }
+
+
+def parse_mix(mix: str, available: Optional[Dict[str, Operation]] = None) -> List[Operation]:
+    """Parse 'list=4,get=3,upload=1' into weighted operations"""
+    available = available or default_operations()
+    operations = []
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in available:
+            raise ValueError(f"Okänd operation '{name}', välj bland {sorted(available)}")
+        operation = available[name]
+        operations.append(Operation(name, float(weight or 1), operation.build, operation.accepted))
+    return operations
+
+
+@dataclass
+class LoadConfig:
+    """Parameters for one load run"""
+    rate: float = 100.0                 # requests per sekund (ankomsttakt)
+    duration: float = 10.0              # sekunder
+    max_in_flight: int = 256            # tak för samtidiga requests
+    mix: str = "list=4,get=3,upload=1,stats=1,search=1"
+    warmup: float = 0.0                 # sekunder som inte räknas med
+    seed: int = 42
+    timeout: float = 30.0
+
+
+@dataclass
+class Sample:
+    operation: str
+    intended: float
+    started: float
+    finished: float
+    status: int
+    error: bool
+    message: Optional[str] = None
+
+    @property
+    def latency(self) -> float:
+        """Response time including queueing (coordinated-omission corrected)"""
+        return self.finished - self.intended
+
+    @property
+    def service_time(self) -> float:
+        return self.finished - self.started
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    # round() så att t.ex. 99.9 % av 1000 blir rang 999 och inte 1000 pga flyttalsfel
+    rank = max(math.ceil(round(pct / 100.0 * len(sorted_values), 9)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    ordered = sorted(values)
+    summary = {f"p{pct:g}": round(percentile(ordered, pct) * 1000, 3) for pct in PERCENTILES}
+    summary["mean"] = round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0
+    summary["max"] = round(ordered[-1] * 1000, 3) if ordered else 0.0
+    return summary
+
+
+@dataclass
+class LoadResult:
+    config: LoadConfig
+    target: str
+    samples: List[Sample] = field(default_factory=list)
+    started_at: str = ""
+    elapsed: float = 0.0
+
+    def report(self) -> Dict[str, Any]:
+        """Aggregate throughput, error rate and latency percentiles"""
+        measured = [s for s in self.samples if s.intended >= self.config.warmup]
+        errors = [s for s in measured if s.error]
+        window = max(self.elapsed - self.config.warmup, 1e-9)
+        by_operation: Dict[str, Any] = {}
+        for name in sorted({s.operation for s in measured}):
+            samples = [s for s in measured if s.operation == name]
+            by_operation[name] = {
+                "requests": len(samples),
+                "errors": sum(1 for s in samples if s.error),
+                "latency_ms": summarize([s.latency for s in samples]),
+            }
+        statuses: Dict[str, int] = {}
+        for s in measured:
+            key = str(s.status) if s.status else "transport_error"
+            statuses[key] = statuses.get(key, 0) + 1
+        return {
+            "target": self.target,
+            "config": self.config.__dict__,
+            "started_at": self.started_at,
+            "requests": len(measured),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(measured), 6) if measured else 0.0,
+            "throughput_rps": round(len(measured) / window, 3),
+            "latency_ms": summarize([s.latency for s in measured]),
+            "service_time_ms": summarize([s.service_time for s in measured]),
+            "status_codes": statuses,
+            "operations": by_operation,
+        }
+
+
+async def run_load(client: httpx.AsyncClient, config: LoadConfig, target: str = "") -> LoadResult:
+    """Open-loop run: requests are scheduled at a fixed rate regardless of how fast responses come back"""
+    rng = random.Random(config.seed)
+    operations = parse_mix(config.mix)
+    weights = [op.weight for op in operations]
+    total = int(config.rate * config.duration)
+    interval = 1.0 / config.rate
+    semaphore = asyncio.Semaphore(config.max_in_flight)
+    result = LoadResult(config=config, target=target or str(client.base_url),
+                        started_at=time.strftime("%Y-%m-%dT%H:%M:%S%z"))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def fire(operation: Operation, spec: RequestSpec, intended: float) -> None:
+        method, path, body = spec
+        async with semaphore:
+            started = loop.time() - start
+            try:
+                response = await client.request(method, path, json=body, timeout=config.timeout)
+                status, message = response.status_code, None
+            except httpx.HTTPError as e:
+                status, message = 0, f"{type(e).__name__}: {e}"
+            result.samples.append(Sample(
+                operation.name, intended, started, loop.time() - start,
+                status, operation.is_error(status), message,
+            ))
+
+    tasks = []
+    for i in range(total):
+        intended = i * interval
+        delay = start + intended - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        operation = rng.choices(operations, weights)[0]
+        tasks.append(asyncio.ensure_future(fire(operation, operation.build(rng), intended)))
+    await asyncio.gather(*tasks)
+    result.elapsed = loop.time() - start
+    return result
+
+
+def asgi_client(app: Any, base_url: str = "http://testserver/api") -> httpx.AsyncClient:
+    """Client that calls the ASGI app in-process (no network)"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=base_url)
+
+
+def http_client(base_url: str, max_connections: int = 256) -> httpx.AsyncClient:
+    """Client against a live URL, e.g. Kong's api_base_url"""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
+
+def write_results(report: Dict[str, Any], path: str) -> str:
+    """Write a report as JSON (directories are created)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    latency = report["latency_ms"]
+    print(f"🎯 {report['target']}: {report['requests']} requests, {report['throughput_rps']} req/s, "
+          f"{report['errors']} fel")
+    print("   latens (ms): " + ", ".join(f"{key}={latency[key]}" for key in ("p50", "p95", "p99", "p99.9", "max")))
+    for name, op in report["operations"].items():
+        print(f"   {name:<8} {op['requests']:>7} req  p99={op['latency_ms']['p99']} ms  fel={op['errors']}")
+
+
+def load_app(spec: str) -> Any:
+    """Import 'module:attribute', e.g. nexus_repository_api.main:app"""
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    config = LoadConfig(
+        rate=args.rate,
+        duration=args.duration,
+        max_in_flight=args.max_in_flight,
+        mix=args.mix,
+        warmup=args.warmup,
+        seed=args.seed,
+    )
+    if args.app:
+        client, target = asgi_client(load_app(args.app)), f"asgi:{args.app}"
+    else:
+        client, target = http_client(args.url, args.max_in_flight), args.url
+    async with client:
+        result = await run_load(client, config, target)
+    return result.report()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Lastgenerator för Nexus Repository API")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default=os.getenv("LOAD_TARGET_URL", "http://localhost:8000/api"),
+                        help="API-bas-URL (default: Kong på localhost:8000/api)")
+    target.add_argument("--app", help="Kör in-process mot en ASGI-app, t.ex. nexus_repository_api.main:app")
+    parser.add_argument("--rate", type=float, default=100.0, help="Requests per sekund")
+    parser.add_argument("--duration", type=float, default=10.0, help="Sekunder")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Max samtidiga requests")
+    parser.add_argument("--mix", default=LoadConfig.mix, help="Viktad mix, t.ex. list=4,get=3,upload=1")
+    parser.add_argument("--warmup", type=float, default=0.0, help="Sekunder i början som inte räknas")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="results/load.json", help="JSON-fil för resultatet")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_main(args))
+    print_report(report)
+    print(f"💾 Resultat sparat i {write_results(report, args.output)}")
+    return 0 if report["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,25 +7,22 @@ from typing import Optional
 
 
 def get_nexus_version(nexus_client: APIClient) -> Optional[str]:
-    """Hämta Nexus version"""
+    """Hämta Nexus version (från Server-headern, t.ex. "Nexus/3.41.1-01 (OSS)")"""
     try:
         response = nexus_client.get("/service/rest/v1/status")
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("data", {}).get("version")
+        server = response.headers.get("server", "")
+        if response.status_code == 200 and server.startswith("Nexus/"):
+            return server[len("Nexus/"):].split()[0]
     except:
         pass
     return None
 
 
 def is_nexus_ready(nexus_client: APIClient) -> bool:
-    """Kontrollera om Nexus är redo"""
+    """Kontrollera om Nexus är redo (/status svarar 200 med tom body när noden kan ta emot läsningar)"""
     try:
         response = nexus_client.get("/service/rest/v1/status")
-        if response.status_code == 200:
-            data = response.json()
-            state = data.get("data", {}).get("state")
-            return state == "STARTED"
+        return response.status_code == 200
     except:
         pass
     return False
@@ -1,10 +1,75 @@
 """
 Playwright Client för GUI-testning
 """
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, Route, sync_playwright
 from typing import Optional, Dict, Any
 import time
 
+# Resurser som GUI-testerna inte behöver - blockeras för att sidorna ska bli klara snabbare
+BLOCKED_RESOURCE_TYPES = frozenset({"font", "image", "media"})
+BLOCKED_URL_PARTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.io",
+    "hotjar.com",
+)
+
+
+def block_unneeded_resources(route: Route) -> None:
+    """Route handler som avbryter fonter, bilder och analytics-anrop"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def launch_browser(playwright: Playwright, browser_type: str, headless: bool) -> Browser:
+    """Starta en browser av angiven typ"""
+    if browser_type == "chromium":
+        return playwright.chromium.launch(headless=headless)
+    elif browser_type == "firefox":
+        return playwright.firefox.launch(headless=headless)
+    elif browser_type == "webkit":
+        return playwright.webkit.launch(headless=headless)
+    raise ValueError(f"Okänd browser typ: {browser_type}")
+
+
+class SharedBrowsers:
+    """En Playwright-instans och en browser per typ, delad mellan tester och startad vid behov"""
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self.playwright: Optional[Playwright] = None
+        self.browsers: Dict[str, Browser] = {}
+        self.launches = 0
+
+    @property
+    def started(self) -> bool:
+        return self.playwright is not None
+
+    def get(self, browser_type: str = "chromium") -> Browser:
+        """Hämta (eller starta) den delade browsern för en typ"""
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        browser = self.browsers.get(browser_type)
+        if browser is None or not browser.is_connected():
+            browser = launch_browser(self.playwright, browser_type, self.headless)
+            self.browsers[browser_type] = browser
+            self.launches += 1
+        return browser
+
+    def close(self) -> None:
+        """Stäng alla browsers och Playwright"""
+        for browser in self.browsers.values():
+            if browser.is_connected():
+                browser.close()
+        self.browsers.clear()
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+
 
 class PlaywrightClient:
     """Playwright klient för GUI-testning"""
@@ -12,32 +77,31 @@ class PlaywrightClient:
     def __init__(self, 
                  browser_type: str = "chromium", 
                  headless: bool = True,
-                 timeout: int = 30000):
+                 timeout: int = 30000,
+                 browser: Optional[Browser] = None,
+                 block_resources: bool = False):
         self.browser_type = browser_type
         self.headless = headless
         self.timeout = timeout
         self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
+        self.browser: Optional[Browser] = browser
+        # En delad browser ägs av fixturen - klienten stänger bara sin egen context
+        self.owns_browser = browser is None
+        self.block_resources = block_resources
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
     
     def start(self) -> 'PlaywrightClient':
-        """Starta Playwright och browser"""
-        self.playwright = sync_playwright().start()
-        
-        # Välj browser typ
-        if self.browser_type == "chromium":
-            self.browser = self.playwright.chromium.launch(headless=self.headless)
-        elif self.browser_type == "firefox":
-            self.browser = self.playwright.firefox.launch(headless=self.headless)
-        elif self.browser_type == "webkit":
-            self.browser = self.playwright.webkit.launch(headless=self.headless)
-        else:
-            raise ValueError(f"Okänd browser typ: {self.browser_type}")
+        """Starta Playwright och browser (eller bara en ny context i en delad browser)"""
+        if self.owns_browser:
+            self.playwright = sync_playwright().start()
+            self.browser = launch_browser(self.playwright, self.browser_type, self.headless)
         
         # Skapa context och page
         self.context = self.browser.new_context()
         self.context.set_default_timeout(self.timeout)
+        if self.block_resources:
+            self.context.route("**/*", block_unneeded_resources)
         self.page = self.context.new_page()
         
         return self
@@ -91,7 +155,7 @@ class PlaywrightClient:
             raise RuntimeError("Browser inte startad. Kör start() först.")
         self.page.screenshot(path=path)
     
-    def wait_for_load_state(self, state: str = "networkidle") -> None:
+    def wait_for_load_state(self, state: str = "domcontentloaded") -> None:
         """Vänta på att sidan ska ladda"""
         if not self.page:
             raise RuntimeError("Browser inte startad. Kör start() först.")
@@ -158,7 +222,7 @@ class PlaywrightClient:
             self.page.close()
         if self.context:
             self.context.close()
-        if self.browser:
+        if self.browser and self.owns_browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
@@ -0,0 +1,120 @@
+"""
+Pooled kubectl port-forwards for k8s tests
+
+Forwards are keyed by (service, namespace, remote port) and reused for the
+whole session. Each lookup health-checks the forward (process alive and the
+local port accepting connections) and restarts it if it has died. close()
+terminates every process, so nothing leaks past the session.
+"""
+import socket
+import subprocess
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from support.k8s_helper import K8sHelper
+
+ForwardKey = Tuple[str, str, int]
+
+
+class PortForwardError(RuntimeError):
+    """A port-forward could not be started"""
+
+
+@dataclass
+class PortForward:
+    service: str
+    namespace: str
+    remote_port: int
+    local_port: int
+    process: subprocess.Popen
+    started_at: float
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.local_port}"
+
+    def accepts_connections(self, timeout: float = 0.5) -> bool:
+        try:
+            with socket.create_connection(("127.0.0.1", self.local_port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    def healthy(self) -> bool:
+        return self.process.poll() is None and self.accepts_connections()
+
+
+def free_port() -> int:
+    """A free local TCP port chosen by the OS"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class PortForwardPool:
+    """Session-wide pool of port-forwards with health checks and restart of dead forwards"""
+
+    def __init__(self, helper: Optional[K8sHelper] = None, start_timeout: float = 10.0):
+        self.helper = helper or K8sHelper()
+        self.start_timeout = start_timeout
+        self.forwards: Dict[ForwardKey, PortForward] = {}
+        self.stats = {"started": 0, "reused": 0, "restarted": 0}
+
+    def get(self, service: str, namespace: str, remote_port: int,
+            local_port: Optional[int] = None) -> PortForward:
+        """Return a healthy forward, starting or restarting it when needed"""
+        key = (service, namespace, remote_port)
+        forward = self.forwards.get(key)
+        if forward is not None:
+            if forward.healthy():
+                self.stats["reused"] += 1
+                return forward
+            # Död forward - starta om på samma lokala port så att URL:er som redan delats ut fungerar
+            self._stop(forward)
+            self.stats["restarted"] += 1
+            local_port = forward.local_port
+        forward = self._start(service, namespace, remote_port, local_port or free_port())
+        self.forwards[key] = forward
+        return forward
+
+    def url(self, service: str, namespace: str, remote_port: int) -> str:
+        return self.get(service, namespace, remote_port).url
+
+    def _start(self, service: str, namespace: str, remote_port: int, local_port: int) -> PortForward:
+        process = self.helper.port_forward(service, namespace, local_port, remote_port, quiet=True)
+        self.stats["started"] += 1
+        forward = PortForward(service, namespace, remote_port, local_port, process, time.monotonic())
+        deadline = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise PortForwardError(
+                    f"kubectl port-forward svc/{service} -n {namespace} avslutades med kod {process.returncode}"
+                )
+            if forward.accepts_connections(timeout=0.2):
+                return forward
+            time.sleep(0.05)
+        self._stop(forward)
+        raise PortForwardError(f"port-forward svc/{service} -n {namespace} svarade inte inom {self.start_timeout}s")
+
+    @staticmethod
+    def _stop(forward: PortForward) -> None:
+        if forward.process.poll() is None:
+            forward.process.terminate()
+            try:
+                forward.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                forward.process.kill()
+                forward.process.wait()
+
+    def close(self) -> None:
+        """Terminate every forward"""
+        for forward in self.forwards.values():
+            self._stop(forward)
+        self.forwards.clear()
+
+    def __enter__(self) -> "PortForwardPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,108 @@
+"""
+Concurrent readiness prober for the test environment
+
+Polls all services in parallel with exponential backoff and full jitter,
+and records how long each one took to become ready, so environment boot
+time can be tracked between runs.
+"""
+import asyncio
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Samma statuskoder som tidigare räknades som "tillgänglig"
+READY_STATUSES = (200, 404, 502, 503)
+
+
+@dataclass
+class ServiceCheck:
+    name: str
+    url: str
+    ready_statuses: Tuple[int, ...] = READY_STATUSES
+
+
+@dataclass
+class ReadinessResult:
+    name: str
+    url: str
+    ready: bool
+    time_to_ready: Optional[float]      # sekunder, None om tjänsten aldrig svarade
+    attempts: int
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BackoffPolicy:
+    """Exponential backoff with full jitter: sleep uniform(0, min(max_delay, initial * factor**attempt))"""
+    initial: float = 0.1
+    factor: float = 2.0
+    max_delay: float = 2.0
+    rng: random.Random = field(default_factory=random.Random)
+
+    def delay(self, attempt: int) -> float:
+        return self.rng.uniform(0, min(self.max_delay, self.initial * self.factor ** attempt))
+
+
+async def probe(client: httpx.AsyncClient, check: ServiceCheck, deadline: float,
+                request_timeout: float = 3.0, backoff: Optional[BackoffPolicy] = None) -> ReadinessResult:
+    """Poll one service until it answers with a ready status or the deadline passes"""
+    backoff = backoff or BackoffPolicy()
+    start = time.monotonic()
+    attempts = 0
+    status, error = None, None
+    while True:
+        attempts += 1
+        remaining = deadline - time.monotonic()
+        try:
+            response = await client.get(check.url, timeout=max(min(request_timeout, remaining), 0.01))
+            status, error = response.status_code, None
+            if status in check.ready_statuses:
+                return ReadinessResult(check.name, check.url, True, time.monotonic() - start, attempts, status)
+        except httpx.HTTPError as e:
+            error = f"{type(e).__name__}: {e}"
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return ReadinessResult(check.name, check.url, False, None, attempts, status, error)
+        await asyncio.sleep(min(backoff.delay(attempts - 1), remaining))
+
+
+async def wait_until_ready(checks: List[ServiceCheck], timeout: float = 10.0, request_timeout: float = 3.0,
+                           backoff: Optional[BackoffPolicy] = None,
+                           transport: Optional[httpx.AsyncBaseTransport] = None) -> List[ReadinessResult]:
+    """Probe all services concurrently; each probe returns as soon as its service is ready"""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(transport=transport, follow_redirects=False) as client:
+        return list(await asyncio.gather(*(
+            probe(client, check, deadline, request_timeout, backoff) for check in checks
+        )))
+
+
+def readiness_report(results: List[ReadinessResult], elapsed: float) -> Dict[str, Any]:
+    """JSON-friendly summary with per-service time-to-ready"""
+    return {
+        "elapsed": round(elapsed, 3),
+        "all_ready": all(result.ready for result in results),
+        "services": [asdict(result) for result in results],
+    }
+
+
+def check_services(checks: List[ServiceCheck], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Synchronous entry point for conftest: probe, print and return the report"""
+    timeout = timeout if timeout is not None else float(os.getenv("READINESS_TIMEOUT", "10"))
+    start = time.monotonic()
+    results = asyncio.run(wait_until_ready(checks, timeout=timeout))
+    report = readiness_report(results, time.monotonic() - start)
+    for result in results:
+        if result.ready:
+            print(f"✅ {result.name} is accessible at {result.url} "
+                  f"({result.time_to_ready:.2f}s, {result.attempts} attempts)")
+        else:
+            print(f"⚠️  {result.name} not available at {result.url} after {timeout:.0f}s "
+                  f"({result.error or result.status}) - tests will continue")
+    return report
@@ -0,0 +1,149 @@
+"""
+Deterministic synthetic catalog data for benchmarks and in-process tests
+
+The same seed always produces the same repositories and packages, so
+benchmark runs are comparable across machines and commits.
+"""
+import itertools
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+FORMATS = ("pypi", "apt", "rpm", "docker")
+
+# Vanliga paketnamn som stam - suffix gör dem unika i stora kataloger
+NAME_STEMS = (
+    "requests", "numpy", "pandas", "flask", "django", "fastapi", "pytest", "urllib3", "boto3",
+    "pyyaml", "jinja2", "click", "rich", "httpx", "pydantic", "sqlalchemy", "redis", "celery",
+    "libssl", "openssl", "curl", "nginx", "postgresql", "python3", "gcc", "zlib", "systemd",
+    "kernel", "glibc", "bash", "coreutils", "vim", "git", "docker-ce", "containerd", "kubectl",
+)
+
+EPOCH = datetime(2024, 1, 1)
+
+
+def generate_repositories(count: int = 4, seed: int = 42) -> List[Dict[str, Any]]:
+    """Hosted repositories, at least one per format"""
+    rng = random.Random(seed)
+    repositories = []
+    for i in range(count):
+        repository_format = FORMATS[i % len(FORMATS)]
+        name = f"{repository_format}-hosted" if i < len(FORMATS) else f"{repository_format}-hosted-{i}"
+        repositories.append({
+            "name": name,
+            "type": "hosted",
+            "format": repository_format,
+            "url": f"http://localhost:8081/repository/{name}/",
+            "status": "active" if rng.random() < 0.95 else "inactive",
+        })
+    return repositories
+
+
+def package_name(index: int) -> str:
+    """Name number index: the stems first, then numbered variants (requests-1, numpy-1 ...)"""
+    stem = NAME_STEMS[index % len(NAME_STEMS)]
+    round_number = index // len(NAME_STEMS)
+    return stem if round_number == 0 else f"{stem}-{round_number}"
+
+
+def generate_packages(count: int,
+                      repositories: Optional[List[Dict[str, Any]]] = None,
+                      seed: int = 42,
+                      versions_per_name: int = 5) -> List[Dict[str, Any]]:
+    """Packages spread over the repositories with a few versions per name"""
+    rng = random.Random(seed)
+    repository_names = [repo["name"] for repo in (repositories or generate_repositories(seed=seed))]
+    packages = []
+    for i in range(count):
+        name_index = i // versions_per_name
+        packages.append({
+            "name": package_name(name_index),
+            "version": f"{rng.randint(0, 9)}.{rng.randint(0, 30)}.{i % versions_per_name}",
+            "repository": repository_names[name_index % len(repository_names)],
+            "upload_date": EPOCH + timedelta(seconds=rng.randint(0, 365 * 24 * 3600)),
+        })
+    return packages
+
+
+def build_models(model_class: Any, rows: List[Dict[str, Any]], validate: bool = False) -> List[Any]:
+    """Pydantic instances - model_construct skips validation, which is what makes 1M rows feasible"""
+    if validate:
+        return [model_class(**row) for row in rows]
+    return [model_class.model_construct(**row) for row in rows]
+
+
+def sample_names(packages: List[Any], count: int, seed: int = 7) -> List[str]:
+    """Existing package names to look up (deterministic)"""
+    rng = random.Random(seed)
+    names = [getattr(pkg, "name", None) or pkg["name"] for pkg in rng.choices(packages, k=count)]
+    return names
+
+
+def generate_catalog(repository_class: Any, package_class: Any,
+                     repositories: int = 10_000, packages: int = 1_000_000,
+                     seed: int = 42) -> Tuple[List[Any], List[Any]]:
+    """Repository and package models with realistic distributions, built with model_construct (no validation)
+
+    - versions per name are skewed (most names have 1-3 versions, a few have dozens)
+    - versions increase like semver releases and upload dates increase with them
+    - repository sizes follow a Zipf-like distribution (a few large, many small)
+    """
+    rng = random.Random(seed)
+    repository_rows = generate_repositories(repositories, seed=seed)
+    repository_models = build_models(repository_class, repository_rows)
+    repository_names = [row["name"] for row in repository_rows]
+    # Zipf-liknande vikter: repository nr k får vikt 1/k
+    cumulative_weights = list(itertools.accumulate(1.0 / rank for rank in range(1, len(repository_names) + 1)))
+    # Delade, oföränderliga datum - sparar minne och tid
+    dates = sorted(EPOCH + timedelta(seconds=rng.randint(0, 2 * 365 * 24 * 3600)) for _ in range(4096))
+
+    construct = package_class.model_construct
+    package_models = []
+    append = package_models.append
+    name_index = 0
+    while len(package_models) < packages:
+        name = package_name(name_index)
+        name_index += 1
+        repository = rng.choices(repository_names, cum_weights=cumulative_weights)[0]
+        version_count = min(1 + int(rng.expovariate(1 / 4.0)), 60, packages - len(package_models))
+        major = rng.choices((0, 1, 2, 3, 4), (30, 35, 20, 10, 5))[0]
+        minor, patch = rng.randint(0, 20), 0
+        date_index = rng.randrange(len(dates) - version_count)
+        for _ in range(version_count):
+            append(construct(
+                name=name,
+                version=f"{major}.{minor}.{patch}",
+                repository=repository,
+                upload_date=dates[date_index],
+            ))
+            step = rng.random()
+            if step < 0.70:
+                patch += 1
+            elif step < 0.95:
+                minor, patch = minor + 1, 0
+            else:
+                major, minor, patch = major + 1, 0, 0
+            date_index += 1
+    return repository_models, package_models
+
+
+@contextmanager
+def loaded_store(models_module: Any,
+                 packages: Optional[List[Any]] = None,
+                 repositories: Optional[List[Any]] = None) -> Iterator[Any]:
+    """Replace the in-memory store in models.py and restore it afterwards
+
+    The routers import the lists by reference, so they are mutated in place.
+    """
+    saved_packages = list(models_module.packages)
+    saved_repositories = list(models_module.repositories)
+    try:
+        if packages is not None:
+            models_module.packages[:] = packages
+        if repositories is not None:
+            models_module.repositories[:] = repositories
+        yield models_module
+    finally:
+        models_module.packages[:] = saved_packages
+        models_module.repositories[:] = saved_repositories
@@ -1,10 +1,18 @@
 """
 API End-to-End Tests - Testar kompletta arbetsflöden
 """
+import os
 import pytest
 import requests
 import time
 
+from support.app_loader import import_app_module
+from support.load_generator import percentile
+from support.synthetic_data import generate_catalog, loaded_store
+
+# Latensbudget per request mot den skalade katalogen (in-process, utan nätverk)
+SCALED_LATENCY_BUDGET_MS = float(os.getenv("SCALED_LATENCY_BUDGET_MS", "500"))
+
 
 @pytest.mark.api
 @pytest.mark.workflows
@@ -49,6 +57,7 @@ def test_complete_repository_workflow(api_client):
 
 @pytest.mark.api
 @pytest.mark.workflows
+@pytest.mark.latency_budget("/health", p95_ms=200)
 def test_api_health_monitoring_workflow(api_client):
     """Test API health monitoring workflow"""
     # Steg 1: Kontrollera grundläggande health
@@ -199,6 +208,8 @@ def test_api_pip_package_workflow(api_client):
 
 @pytest.mark.api
 @pytest.mark.workflows
+@pytest.mark.latency_budget("/stats", p95_ms=500)
+@pytest.mark.latency_budget("/repositories/", p95_ms=500)
 def test_api_statistics_workflow(api_client):
     """Test API statistics workflow"""
     # Steg 1: Hämta initial statistik
@@ -311,6 +322,7 @@ def test_api_concurrent_workflow(api_client):
 
 @pytest.mark.api
 @pytest.mark.workflows
+@pytest.mark.latency_budget(p95_ms=1000)
 def test_api_performance_workflow(api_client):
     """Test API performance workflow"""
     import time
@@ -371,3 +383,91 @@ def test_api_data_consistency_workflow(api_client):
     # Steg 5: Verifiera att alla repositories är aktiva
     for repo in repositories:
         assert repo["status"] == "active", f"Repository {repo['name']} is not active"
+
+
+def timed_get(client, endpoint: str):
+    """GET och svarstid i millisekunder"""
+    start = time.perf_counter()
+    response = client.get(endpoint)
+    return response, (time.perf_counter() - start) * 1000
+
+
+@pytest.mark.workflows
+@pytest.mark.slow
+def test_scaled_catalog_workflow(in_process_api_client, synthetic_catalog):
+    """Test the repository/package workflow against 10k repositories and 1M packages"""
+    catalog = synthetic_catalog()
+    repositories, packages = catalog["repositories"], catalog["packages"]
+    assert catalog["build_seconds"] < 60, f"Katalogen tog {catalog['build_seconds']:.1f}s att bygga"
+
+    # Steg 1: Statistik över hela katalogen
+    response, elapsed = timed_get(in_process_api_client, "/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_repositories"] == len(repositories)
+    assert stats["total_packages"] == len(packages)
+    assert sum(stats["packages_by_repository"].values()) == len(packages)
+    assert elapsed < SCALED_LATENCY_BUDGET_MS * 4, f"/stats tog {elapsed:.0f} ms"
+
+    # Steg 2: Uppslag av repositories, även det sista i listan
+    latencies = []
+    for repo in [repositories[0], repositories[len(repositories) // 2], repositories[-1]]:
+        response, elapsed = timed_get(in_process_api_client, f"/repositories/{repo.name}")
+        assert response.status_code == 200
+        assert response.json()["name"] == repo.name
+        latencies.append(elapsed)
+
+    # Steg 3: Uppslag av paket efter namn, spridda över katalogen
+    for package in packages[::len(packages) // 20]:
+        response, elapsed = timed_get(in_process_api_client, f"/packages/{package.name}")
+        assert response.status_code == 200
+        assert package.version in {found["version"] for found in response.json()}
+        latencies.append(elapsed)
+
+    p95 = percentile(sorted(latencies), 95)
+    assert p95 < SCALED_LATENCY_BUDGET_MS, f"p95 för uppslag var {p95:.0f} ms (budget {SCALED_LATENCY_BUDGET_MS:.0f} ms)"
+
+    # Steg 4: Ladda upp ett paket och hitta det igen
+    new_package = {"name": "scaled-workflow-pkg", "version": "1.0.0", "repository": repositories[-1].name}
+    start = time.perf_counter()
+    response = in_process_api_client.post("/packages/", data=new_package)
+    upload_ms = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200
+    assert upload_ms < SCALED_LATENCY_BUDGET_MS
+
+    response, _ = timed_get(in_process_api_client, "/packages/scaled-workflow-pkg")
+    assert response.status_code == 200
+    assert response.json()[0]["repository"] == repositories[-1].name
+
+
+@pytest.mark.workflows
+def test_synthetic_catalog_is_deterministic_and_restored(in_process_app, in_process_api_client):
+    """Test that the same seed gives the same catalog and that the store is restored afterwards"""
+    models = import_app_module("api.v1.models")
+
+    def build(seed: int):
+        return generate_catalog(models.RepositoryInfo, models.PackageInfo, repositories=50, packages=2_000, seed=seed)
+
+    def dump(catalog):
+        return [[model.model_dump() for model in items] for items in catalog]
+
+    # Två oberoende byggen med samma seed - inte samma cachade objekt
+    first, second = build(7), build(7)
+    assert first is not second
+    assert dump(first) == dump(second)
+    assert dump(build(8)) != dump(first)
+    names = [pkg.name for pkg in first[1]]
+    assert len(set(names)) < len(names), "Paketen ska ha flera versioner per namn"
+
+    saved_packages, saved_repositories = list(models.packages), list(models.repositories)
+    repositories, packages = first
+    with loaded_store(models, packages, repositories):
+        stats = in_process_api_client.get("/stats").json()
+        assert stats["total_packages"] == 2_000
+        assert stats["total_repositories"] == 50
+
+    # Lagret ska vara tillbaka som före, samma objekt i samma ordning
+    assert models.packages == saved_packages
+    assert models.repositories == saved_repositories
+    assert in_process_api_client.get("/stats").json()["total_packages"] == len(saved_packages)
+
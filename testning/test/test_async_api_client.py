@@ -0,0 +1,87 @@
+"""
+Async API Client Tests - Testar retries, timing och samtidiga requests
+"""
+import asyncio
+import random
+
+import httpx
+import pytest
+
+from support.api_client import AsyncAPIClient
+from support.readiness import BackoffPolicy
+
+
+def make_client(handler, **kwargs) -> AsyncAPIClient:
+    return AsyncAPIClient(
+        "http://api.test/api",
+        backoff=BackoffPolicy(initial=0.001, max_delay=0.01, rng=random.Random(1)),
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+async def test_idempotent_requests_are_retried():
+    """Test that GET is retried on 503 and transport errors, and timing counts all attempts"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if len(calls) == 2:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"status": "healthy"})
+
+    async with make_client(handler) as client:
+        assert await client.health_check()
+    assert calls == ["/api/health"] * 3
+    [timing] = client.timings
+    assert (timing.method, timing.status, timing.attempts) == ("GET", 200, 3)
+
+
+@pytest.mark.unit
+async def test_post_is_not_retried():
+    """Test that non-idempotent requests are sent once"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    async with make_client(handler) as client:
+        response = await client.post("/packages/", data={"name": "x", "version": "1", "repository": "pypi-hosted"})
+        assert response.status_code == 503
+        response = await client.delete("/repositories/x")
+        assert response.status_code == 503
+    assert calls == ["POST", "DELETE", "DELETE", "DELETE"]
+
+
+@pytest.mark.unit
+async def test_concurrent_requests_record_latency():
+    """Test that requests run concurrently and latencies are captured per method"""
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.05)
+        in_flight["now"] -= 1
+        return httpx.Response(200, json=[])
+
+    async with make_client(handler, max_connections=10) as client:
+        responses = await asyncio.gather(*(client.get("/packages/") for _ in range(10)))
+    assert all(r.status_code == 200 for r in responses)
+    assert in_flight["max"] == 10
+    assert len(client.latencies("get")) == 10
+    assert all(latency >= 0.05 for latency in client.latencies())
+
+
+@pytest.mark.api
+async def test_async_client_against_api(async_api_client):
+    """Test concurrent GETs against the live API"""
+    if not await async_api_client.health_check():
+        pytest.skip("API:t är inte tillgängligt")
+    responses = await asyncio.gather(*(async_api_client.get("/packages/") for _ in range(20)))
+    assert all(r.status_code == 200 for r in responses)
+    assert len(async_api_client.latencies("GET")) == 21
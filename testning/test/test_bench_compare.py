@@ -0,0 +1,122 @@
+"""
+Benchmark Comparison Tests - Testar regressionsgrinden för benchmarks
+"""
+import json
+import random
+
+import pytest
+
+from support.bench_compare import (
+    Thresholds, bootstrap_lower_bound, compare_runs, main, merge_runs, summarize_run,
+)
+
+
+def make_raw(name: str, samples, bytes_per_package: float = 480.0) -> dict:
+    """pytest-benchmark JSON med rådata för en benchmark"""
+    return {
+        "machine_info": {"node": "bench", "processor": "x86_64", "python_version": "3.11", "cpu": {}},
+        "datetime": "2026-01-01T00:00:00",
+        "benchmarks": [{
+            "name": name,
+            "fullname": f"bench_store.py::{name}",
+            "group": "stats",
+            "extra_info": {"catalog_size": 1000, "bytes_per_package": bytes_per_package},
+            "stats": {"ops": len(samples) / sum(samples), "data": list(samples)},
+        }],
+    }
+
+
+def autocorrelated_run(mean: float, seed: int, count: int = 200) -> list:
+    """Round times like a real run: a per-run offset (CPU/cache state) and AR(1) drift between rounds"""
+    rng = random.Random(seed)
+    offset = rng.uniform(-0.15, 0.15)
+    level, samples = 0.0, []
+    for _ in range(count):
+        level = 0.95 * level + rng.gauss(0, 0.03)
+        samples.append(mean * (1 + offset + level) * (1 + abs(rng.gauss(0, 0.02))))
+    return samples
+
+
+def runs(mean: float, count: int = 5, seed: int = 1, bytes_per_package: float = 480.0) -> dict:
+    return merge_runs([
+        summarize_run(make_raw("bench_stats[1k]", autocorrelated_run(mean, seed * 100 + i), bytes_per_package))
+        for i in range(count)
+    ])
+
+
+def regressions(baseline, current, **kwargs):
+    return {f.metric for f in compare_runs(baseline, current, Thresholds(**kwargs)) if f.regression}
+
+
+@pytest.mark.unit
+def test_bootstrap_lower_bound():
+    """Test the bound on clearly separated, overlapping and higher-is-better runs"""
+    assert bootstrap_lower_bound([1.0, 1.02, 0.98, 1.01, 0.99], [1.5, 1.52, 1.48, 1.51, 1.49]) > 0.4
+    assert bootstrap_lower_bound([1.0, 1.2, 0.9, 1.1, 0.8], [1.1, 0.9, 1.0, 1.2, 0.85]) < 0
+    assert bootstrap_lower_bound([100.0] * 3, [50.0] * 3, higher_is_better=True) == pytest.approx(0.5)
+
+
+@pytest.mark.unit
+def test_two_runs_of_the_same_code_pass():
+    """Test that repeated runs of unchanged code pass although their round times are autocorrelated"""
+    for seed in range(1, 6):
+        assert regressions(runs(1e-3, seed=seed), runs(1e-3, seed=seed + 10)) == set()
+
+
+@pytest.mark.unit
+def test_significant_slowdown_is_a_regression():
+    """Test that a 60 % slowdown fails latency and throughput"""
+    found = regressions(runs(1e-3), runs(1.6e-3, seed=2))
+    assert {"p50", "p95", "p99", "ops"} <= found
+
+
+@pytest.mark.unit
+def test_small_changes_pass():
+    """Test that a slowdown below the minimum effect size passes even when it is consistent"""
+    assert regressions(runs(1e-3), runs(1.03e-3, seed=2)) == set()
+
+
+@pytest.mark.unit
+def test_thresholds_are_configurable():
+    """Test latency and memory thresholds"""
+    assert regressions(runs(1e-3), runs(1.6e-3, seed=2), latency=1.0, throughput=1.0) == set()
+    assert regressions(runs(1e-3), runs(1e-3, bytes_per_package=520.0)) == {"bytes_per_package"}
+    assert regressions(runs(1e-3), runs(1e-3, bytes_per_package=520.0), memory=0.1) == set()
+
+
+@pytest.mark.unit
+def test_cli_updates_baseline_and_gates(tmp_path):
+    """Test --update-baseline with repeated runs, the minimum run count, the machine check and the exit code"""
+    baseline = tmp_path / "baseline.json"
+
+    def write_runs(prefix: str, mean: float, seed: int, count: int = 5) -> list:
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"{prefix}-{i}.json"
+            path.write_text(json.dumps(make_raw("bench_stats[1k]", autocorrelated_run(mean, seed + i))))
+            paths.append(str(path))
+        return paths
+
+    assert main(write_runs("base", 1e-3, seed=1) + ["--baseline", str(baseline), "--update-baseline"]) == 0
+    saved = json.loads(baseline.read_text())
+    assert saved["runs"] == 5
+    assert len(saved["benchmarks"]["bench_stats[1k]"]["runs"]) == 5
+
+    assert main(write_runs("same", 1e-3, seed=20) + ["--baseline", str(baseline)]) == 0
+    # En körning räcker inte för att skilja brus från regression
+    assert main(write_runs("single", 1e-3, seed=20, count=1) + ["--baseline", str(baseline)]) == 2
+
+    # Annan maskin - tiderna är inte jämförbara, baseline måste genereras om
+    other = []
+    for i, path in enumerate(write_runs("other", 1e-3, seed=60)):
+        raw = json.loads(open(path).read())
+        raw["machine_info"]["cpu"] = {"brand_raw": "Other CPU", "count": 8}
+        other_path = tmp_path / f"other-machine-{i}.json"
+        other_path.write_text(json.dumps(raw))
+        other.append(str(other_path))
+    assert main(other + ["--baseline", str(baseline)]) == 3
+
+    slower = write_runs("slow", 2e-3, seed=40)
+    assert main(slower + ["--baseline", str(baseline)]) == 1
+    assert main(slower + ["--baseline", str(baseline), "--max-latency-regression", "2",
+                          "--max-throughput-regression", "2"]) == 0
@@ -5,7 +5,7 @@ import pytest
 import requests
 import json
 import re
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import Page
 
 
 class SwaggerEndpointExtractor:
@@ -20,7 +20,8 @@ class SwaggerEndpointExtractor:
         
         # Vänta på att Swagger UI ska ladda helt
         self.page.wait_for_selector(".swagger-ui", timeout=10000)
-        self.page.wait_for_timeout(3000)  # Vänta extra för att API-schemat ska ladda
+        # Operationerna renderas när API-schemat laddats - vänta på dem i stället för en fast paus
+        self.page.wait_for_selector(".swagger-ui .opblock", timeout=10000)
         
         # Hitta alla operation-grupper
         operations = self.page.locator(".opblock-tag")
@@ -116,14 +117,13 @@ class SwaggerEndpointExtractor:
         try:
             # Klicka på endpoint för att expandera
             endpoint_block.click()
-            self.page.wait_for_timeout(200)  # Kortare timeout
             
-            # Klicka på "Try it out" med kortare timeout
+            # Klicka på "Try it out" när endpointen har expanderat
             try:
                 try_it_out = endpoint_block.locator("button:has-text('Try it out')")
+                try_it_out.first.wait_for(timeout=2000)
                 if try_it_out.count() > 0:
-                    try_it_out.click()
-                    self.page.wait_for_timeout(200)
+                    try_it_out.first.click()
                     
                     # Hitta Request URL i response-sektionen
                     request_url_element = endpoint_block.locator(".request-url")
@@ -140,18 +140,17 @@ class SwaggerEndpointExtractor:
 
 
 @pytest.mark.gui
-def test_extract_and_verify_all_endpoints():
+def test_extract_and_verify_all_endpoints(gui_client_factory):
     """Smart test som extraherar alla endpoints och verifierar dem"""
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    with gui_client_factory() as client:
+        page = client.page
         
         try:
             # Gå till Swagger docs
             print("🌐 Loading Swagger UI...")
             page.goto("http://localhost:8000/api/docs")
-            page.wait_for_load_state("networkidle")
+            page.wait_for_load_state("domcontentloaded")
             
             # Extrahera alla endpoints
             extractor = SwaggerEndpointExtractor(page)
@@ -223,16 +222,15 @@ def test_extract_and_verify_all_endpoints():
             print(f"\n🎉 All {len(endpoints)} endpoints validated successfully!")
             
         finally:
-            browser.close()
+            page.close()
 
 
 @pytest.mark.gui
-def test_openapi_spec_consistency():
+def test_openapi_spec_consistency(gui_client_factory):
     """Testar att OpenAPI spec är konsistent med Swagger UI"""
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    with gui_client_factory() as client:
+        page = client.page
         
         try:
             # Hämta OpenAPI spec direkt
@@ -265,21 +263,20 @@ def test_openapi_spec_consistency():
             print(f"\n✅ All important endpoints present in OpenAPI spec")
             
         finally:
-            browser.close()
+            page.close()
 
 
 @pytest.mark.gui
-def test_all_endpoint_urls_correct():
+def test_all_endpoint_urls_correct(gui_client_factory):
     """Testar att alla endpoints i Swagger har korrekta Request URLs med /api prefix"""
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    with gui_client_factory() as client:
+        page = client.page
         
         try:
             # Gå till Swagger docs
             page.goto("http://localhost:8000/api/docs")
-            page.wait_for_load_state("networkidle")
+            page.wait_for_load_state("domcontentloaded")
             
             # Samla alla endpoint URLs från Swagger UI
             endpoint_urls = []
@@ -342,11 +339,11 @@ def test_all_endpoint_urls_correct():
             print(f"✅ All {len(expected_endpoints)} expected endpoints found")
             
         finally:
-            browser.close()
+            page.close()
 
 
 @pytest.mark.gui 
-def test_specific_endpoint_urls():
+def test_specific_endpoint_urls(gui_client_factory):
     """Testar specifika endpoints för att verifiera att de fungerar med korrekta URLs"""
     
     endpoints_to_test = [
@@ -360,50 +357,39 @@ def test_specific_endpoint_urls():
         ("GET", "/api/config")
     ]
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    with gui_client_factory() as client:
+        page = client.page
+        missing = []
         
         try:
+            # Gå till Swagger docs och vänta tills operationerna har renderats
+            page.goto("http://localhost:8000/api/docs")
+            page.wait_for_selector(".swagger-ui .opblock", timeout=10000)
+            
             for method, endpoint in endpoints_to_test:
                 print(f"Testing {method} {endpoint}")
                 
-                # Gå till Swagger docs
-                page.goto("http://localhost:8000/api/docs")
-                page.wait_for_load_state("networkidle")
-                
-                # Hitta och klicka på endpoint
-                endpoint_element = page.locator(f"text={method} {endpoint}")
-                if endpoint_element.count() > 0:
-                    endpoint_element.click()
-                    page.wait_for_timeout(500)
-                    
-                    # Klicka på "Try it out"
-                    try_it_out = page.locator("button:has-text('Try it out')")
-                    if try_it_out.count() > 0:
-                        try_it_out.click()
-                        page.wait_for_timeout(500)
-                        
-                        # Klicka på "Execute"
-                        execute_button = page.locator("button:has-text('Execute')")
-                        if execute_button.count() > 0:
-                            execute_button.click()
-                            page.wait_for_timeout(1000)
-                            
-                            # Verifiera att request URL visas korrekt
-                            response_section = page.locator("[data-testid='response']")
-                            if response_section.count() > 0:
-                                request_url = response_section.locator("text=/api/").first.text_content()
-                                assert endpoint in request_url, f"Expected {endpoint} in request URL, got {request_url}"
-                                print(f"  ✅ Request URL correct: {request_url}")
-                            else:
-                                print(f"  ⚠️ No response section found")
-                        else:
-                            print(f"  ⚠️ Execute button not found")
-                    else:
-                        print(f"  ⚠️ Try it out button not found")
-                else:
+                # Endpointens block - allt nedan söks inom det, inte i hela sidan
+                summary = page.locator(f".opblock-summary-path[data-path='{endpoint}']")
+                opblock = page.locator(f".opblock.opblock-{method.lower()}").filter(has=summary)
+                if opblock.count() == 0:
                     print(f"  ❌ Endpoint {method} {endpoint} not found in Swagger UI")
+                    missing.append(f"{method} {endpoint}")
+                    continue
+                opblock = opblock.first
+                
+                opblock.locator(".opblock-summary").click()
+                opblock.locator("button.try-out__btn").click()
+                opblock.locator("button.execute").click()
+                
+                # Verifiera att request URL visas korrekt
+                request_url = opblock.locator(".request-url pre")
+                request_url.wait_for(timeout=10000)
+                url = request_url.text_content()
+                assert endpoint in url, f"Expected {endpoint} in request URL, got {url}"
+                print(f"  ✅ Request URL correct: {url}")
+            
+            assert not missing, f"Endpoints saknas i Swagger UI: {missing}"
                     
         finally:
-            browser.close()
+            page.close()
@@ -0,0 +1,119 @@
+"""
+Tester för den fejkade Nexus-servern (körs utan testmiljö)
+"""
+import random
+import time
+
+import httpx
+import pytest
+
+from support.api_client import APIClient
+from support.app_loader import import_app_module
+from support.fake_nexus import NEXUS_VERSION, FakeNexus, FakeNexusConfig, LatencyDistribution, parse_route_map
+from support.nexus_support import get_nexus_version, get_repositories_list, is_nexus_ready
+
+
+def client_for(fake: FakeNexus):
+    """The app's own NexusClient wired to the fake (skips when the app cannot be imported)"""
+    try:
+        nexus_module = import_app_module("core.nexus_client")
+    except ImportError as e:
+        pytest.skip(f"Appen kan inte importeras in-process: {e}")
+    return nexus_module, nexus_module.NexusClient(
+        base_url="http://nexus.test", transport=httpx.ASGITransport(app=fake), cache_ttl=0
+    )
+
+
+async def chunks(data: bytes, size: int = 1000):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+@pytest.mark.unit
+def test_latency_distributions_and_route_maps():
+    """Test parsing and sampling of latency distributions"""
+    rng = random.Random(1)
+    assert LatencyDistribution.parse("5").sample(rng) == 0.005
+    lognormal = LatencyDistribution.parse("lognormal:20:0.5")
+    samples = sorted(lognormal.sample(rng) for _ in range(2001))
+    assert 0.017 < samples[1000] < 0.023
+    with pytest.raises(ValueError):
+        LatencyDistribution.parse("gaussian:1")
+
+    routes = parse_route_map("components=uniform:50:10, *=2", LatencyDistribution.parse)
+    config = FakeNexusConfig(latency=routes, error_rate=parse_route_map("0.5", float))
+    assert config.latency_for("components").kind == "uniform"
+    assert config.latency_for("upload").mean_ms == 2
+    assert config.error_rate_for("upload") == 0.5
+
+
+@pytest.mark.unit
+async def test_components_are_paged_with_continuation_tokens():
+    """Test that the app's NexusClient reads every page from the fake"""
+    fake = FakeNexus.with_catalog(repositories=2, components_per_repository=25)
+    _, nexus = client_for(fake)
+    repositories = await nexus.list_repositories()
+    assert [repo["name"] for repo in repositories] == ["pypi-hosted", "apt-hosted"]
+
+    pages = [page async for page in nexus.iter_components("pypi-hosted")]
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert fake.requests["components"] == 3
+    component = pages[0][0]
+    assert component["assets"][0]["downloadUrl"].startswith("http://nexus.test/repository/pypi-hosted/")
+    await nexus.aclose()
+
+
+@pytest.mark.unit
+async def test_upload_and_download_round_trip(fake_nexus):
+    """Test create repository, streamed upload and asset download through the fake"""
+    fake = fake_nexus
+    nexus_module, nexus = client_for(fake)
+    await nexus.create_hosted_repository("pypi-local", "pypi")
+    payload = bytes(range(256)) * 300
+    await nexus.upload_component("pypi-local", "pypi", "demo-1.2.0.tar.gz", chunks(payload), len(payload))
+
+    [component] = fake.components["pypi-local"]
+    assert (component.name, component.version) == ("demo", "1.2.0")
+    downloaded = b"".join([chunk async for chunk in nexus.stream_asset("pypi-local", "demo/1.2.0/demo-1.2.0.tar.gz")])
+    assert downloaded == payload
+
+    with pytest.raises(nexus_module.NexusError) as error:
+        await nexus.create_hosted_repository("pypi-local", "pypi")
+    assert error.value.status_code == 400
+    await nexus.aclose()
+
+
+@pytest.mark.unit
+async def test_latency_and_error_injection():
+    """Test that configured latency is applied and injected errors reach the client"""
+    config = FakeNexusConfig(latency={"components": LatencyDistribution("fixed", 50)},
+                             error_rate={"repositories": 1.0}, error_statuses=(503,))
+    fake = FakeNexus.with_catalog(repositories=1, components_per_repository=5, config=config)
+    nexus_module, nexus = client_for(fake)
+
+    start = time.perf_counter()
+    [page] = [page async for page in nexus.iter_components("pypi-hosted")]
+    assert len(page) == 5
+    assert time.perf_counter() - start >= 0.05
+
+    with pytest.raises(nexus_module.NexusError) as error:
+        await nexus.list_repositories()
+    assert error.value.status_code == 503
+    assert fake.stats()["injected_errors"] == {"repositories": 1}
+    await nexus.aclose()
+
+
+@pytest.mark.unit
+def test_nexus_support_helpers_over_http(fake_nexus_url):
+    """Test nexus_support against the fake served with uvicorn"""
+    client = APIClient(fake_nexus_url)
+    try:
+        # Som riktiga Nexus: tom body, versionen bara i Server-headern
+        response = client.get("/service/rest/v1/status")
+        assert response.status_code == 200
+        assert response.content == b""
+        assert is_nexus_ready(client)
+        assert get_nexus_version(client) == NEXUS_VERSION
+        assert len(get_repositories_list(client)) == 4
+    finally:
+        client.close()
@@ -3,7 +3,6 @@ FastAPI GUI-tester med Playwright - förbättrade Swagger UI-tester
 """
 import pytest
 import time
-from support.playwright_client import PlaywrightClient
 from support.fastapi_gui_support import (
     navigate_to_docs, click_endpoint, try_it_out, execute_request, 
     get_response_status, get_response_body, check_endpoint_visible,
@@ -16,9 +15,9 @@ pytestmark = pytest.mark.asyncio(mode="off")
 
 @pytest.mark.gui
 @pytest.mark.parametrize("browser_type", ["chromium", "firefox"])
-def test_docs_page_loads(api_base_url, browser_type):
+def test_docs_page_loads(api_base_url, gui_client_factory, browser_type):
     """Testa att API-dokumentationssidan laddas i olika browsers"""
-    with PlaywrightClient(browser_type=browser_type, headless=True) as client:
+    with gui_client_factory(browser_type) as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         assert client.is_element_visible(".swagger-ui")
@@ -26,18 +25,18 @@ def test_docs_page_loads(api_base_url, browser_type):
 
 
 @pytest.mark.gui
-def test_root_page_loads(api_base_url):
+def test_root_page_loads(api_base_url, gui_client_factory):
     """Testa att root-sidan laddas korrekt"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         client.navigate_to(f"{api_base_url}/")
         client.wait_for_load_state()
         assert "Nexus Repository Manager API" in client.get_page_source()
 
 
 @pytest.mark.gui
-def test_redoc_page_loads(api_base_url):
+def test_redoc_page_loads(api_base_url, gui_client_factory):
     """Testa att ReDoc-dokumentationssidan laddas"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         client.navigate_to(f"{api_base_url}/redoc")
         client.wait_for_load_state()
         
@@ -66,9 +65,9 @@ def test_redoc_page_loads(api_base_url):
 
 
 @pytest.mark.gui
-def test_health_endpoint_via_swagger(api_base_url):
+def test_health_endpoint_via_swagger(api_base_url, gui_client_factory):
     """Testa att köra health endpoint via Swagger UI"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -138,9 +137,9 @@ def test_health_endpoint_via_swagger(api_base_url):
 
 
 @pytest.mark.gui
-def test_repositories_endpoint_via_swagger(api_base_url):
+def test_repositories_endpoint_via_swagger(api_base_url, gui_client_factory):
     """Testa repositories endpoint via Swagger UI"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -195,9 +194,9 @@ def test_repositories_endpoint_via_swagger(api_base_url):
 
 
 @pytest.mark.gui
-def test_api_endpoints_visible(api_base_url):
+def test_api_endpoints_visible(api_base_url, gui_client_factory):
     """Testa att viktiga endpoints syns i dokumentationen"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -225,9 +224,9 @@ def test_api_endpoints_visible(api_base_url):
     {"width": 768, "height": 1024},   # Tablet
     {"width": 375, "height": 667}     # Mobile
 ])
-def test_responsive_design(api_base_url, viewport_size):
+def test_responsive_design(api_base_url, gui_client_factory, viewport_size):
     """Testa responsiv design av dokumentationen"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         set_viewport_size(client, viewport_size["width"], viewport_size["height"])
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
@@ -235,9 +234,9 @@ def test_responsive_design(api_base_url, viewport_size):
 
 
 @pytest.mark.gui
-def test_error_page_handling(api_base_url):
+def test_error_page_handling(api_base_url, gui_client_factory):
     """Testa felhantering för icke-existerande sidor"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         client.navigate_to(f"{api_base_url}/nonexistent")
         client.wait_for_load_state()
         
@@ -246,9 +245,9 @@ def test_error_page_handling(api_base_url):
 
 
 @pytest.mark.gui
-def test_swagger_ui_performance(api_base_url):
+def test_swagger_ui_performance(api_base_url, gui_client_factory):
     """Testa prestanda för Swagger UI-laddning"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         start_time = time.time()
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
@@ -259,9 +258,9 @@ def test_swagger_ui_performance(api_base_url):
 
 
 @pytest.mark.gui
-def test_multiple_endpoints_workflow(api_base_url):
+def test_multiple_endpoints_workflow(api_base_url, gui_client_factory):
     """Testa att köra flera endpoints i sekvens - mer robust"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -320,12 +319,12 @@ def test_multiple_endpoints_workflow(api_base_url):
 
 
 @pytest.mark.gui
-def test_browser_compatibility(api_base_url):
+def test_browser_compatibility(api_base_url, gui_client_factory):
     """Testa kompatibilitet med olika browsers"""
     browsers = ["chromium", "firefox"]
     
     for browser_type in browsers:
-        with PlaywrightClient(browser_type=browser_type, headless=True) as client:
+        with gui_client_factory(browser_type) as client:
             navigate_to_docs(client, api_base_url)
             wait_for_swagger_ui_loaded(client)
             assert client.is_element_visible(".swagger-ui"), f"Swagger UI fungerar inte i {browser_type}"
@@ -341,9 +340,9 @@ def test_browser_compatibility(api_base_url):
 
 
 @pytest.mark.gui
-def test_swagger_ui_navigation(api_base_url):
+def test_swagger_ui_navigation(api_base_url, gui_client_factory):
     """Testa navigation inom Swagger UI"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -364,9 +363,9 @@ def test_swagger_ui_navigation(api_base_url):
 
 @pytest.mark.gui
 @pytest.mark.slow
-def test_full_workflow(api_base_url):
+def test_full_workflow(api_base_url, gui_client_factory):
     """Testa komplett GUI-workflow - mer robust"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         # 1. Ladda docs
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
@@ -410,9 +409,9 @@ def test_full_workflow(api_base_url):
 
 
 @pytest.mark.gui
-def test_swagger_ui_basic_functionality(api_base_url):
+def test_swagger_ui_basic_functionality(api_base_url, gui_client_factory):
     """Grundläggande Swagger UI-funktionalitet utan specifika selektorer"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -438,9 +437,9 @@ def test_swagger_ui_basic_functionality(api_base_url):
 
 
 @pytest.mark.gui  
-def test_swagger_ui_content_validation(api_base_url):
+def test_swagger_ui_content_validation(api_base_url, gui_client_factory):
     """Validera att Swagger UI innehåller förväntat innehåll"""
-    with PlaywrightClient(headless=True) as client:
+    with gui_client_factory() as client:
         navigate_to_docs(client, api_base_url)
         wait_for_swagger_ui_loaded(client)
         
@@ -0,0 +1,143 @@
+"""
+K8s Helper Tests - Testar snapshot-läget och watch-baserad väntan mot en fejkad kubectl
+"""
+import json
+import sys
+import textwrap
+
+import pytest
+
+from support.k8s_helper import K8sHelper
+
+FAKE_KUBECTL = textwrap.dedent('''\
+    #!{python}
+    import json, sys, time
+    state = json.load(open({state!r}))
+    args = sys.argv[1:]
+    with open({calls!r}, "a") as f:
+        f.write(" ".join(args) + "\\n")
+    if "--watch" in args:
+        for event in state["watch"]:
+            print(json.dumps(event, indent=4), flush=True)
+            time.sleep(0.05)
+        time.sleep(30)
+    elif args[1:3] == ["get", "pods,services"]:
+        print(json.dumps({{"kind": "List", "items": state["pods"] + state["services"]}}))
+    elif args[1:3] == ["get", "pods"]:
+        namespace = args[args.index("-n") + 1]
+        items = [p for p in state["pods"] if p["metadata"]["namespace"] == namespace]
+        print(json.dumps({{"kind": "List", "items": items}}))
+    elif args[1:3] == ["get", "pod"]:
+        pod = next((p for p in state["pods"] if p["metadata"]["name"] == args[3]), None)
+        if pod is None:
+            sys.exit(1)
+        print(json.dumps(pod))
+    else:
+        sys.exit(1)
+''')
+
+
+def pod(name: str, namespace: str, ready: bool) -> dict:
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": namespace},
+        "status": {"conditions": [{"type": "Ready", "status": "True" if ready else "False"}]},
+    }
+
+
+def service(name: str, namespace: str) -> dict:
+    return {"kind": "Service", "metadata": {"name": name, "namespace": namespace}}
+
+
+@pytest.fixture
+def fake_kubectl(tmp_path):
+    """Skriv en fejkad kubectl och returnera (sökväg, state, anropslogg)"""
+    state = {
+        "pods": [pod("nexus-0", "nexus", True), pod("api-1", "nexus-api", False),
+                 pod("coredns-1", "kube-system", True)],
+        "services": [service("nexus", "nexus"), service("nexus-api", "nexus-api"), service("kong", "kong")],
+        "watch": [],
+    }
+    state_path, calls_path = tmp_path / "state.json", tmp_path / "calls.log"
+    script = tmp_path / "kubectl"
+    script.write_text(FAKE_KUBECTL.format(python=sys.executable, state=str(state_path), calls=str(calls_path)))
+    script.chmod(0o755)
+
+    def save():
+        state_path.write_text(json.dumps(state))
+
+    def calls():
+        return calls_path.read_text().splitlines() if calls_path.exists() else []
+
+    save()
+    return str(script), state, save, calls
+
+
+@pytest.mark.unit
+def test_snapshot_answers_repeated_queries_from_one_call(fake_kubectl):
+    """Test that pods and services for all namespaces come from a single kubectl call"""
+    kubectl, _, _, calls = fake_kubectl
+    helper = K8sHelper(snapshot=True, kubectl=kubectl)
+
+    assert [p["metadata"]["name"] for p in helper.get_pods("nexus")] == ["nexus-0"]
+    assert [s["metadata"]["name"] for s in helper.get_services("kong")] == ["kong"]
+    assert helper.is_pod_ready("nexus-0", "nexus")
+    assert not helper.is_pod_ready("api-1", "nexus-api")
+    assert {p["metadata"]["name"] for p in helper.get_pods()} == {"nexus-0", "api-1"}
+    assert calls() == ["--context=kind-nexus-cluster get pods,services -A -o json"]
+
+    helper.invalidate()
+    helper.get_pods("nexus")
+    assert len(calls()) == 2
+
+
+@pytest.mark.unit
+def test_is_pod_ready_without_snapshot_fetches_one_pod(fake_kubectl):
+    """Test that is_pod_ready only asks kubectl for the requested pod"""
+    kubectl, _, _, calls = fake_kubectl
+    helper = K8sHelper(kubectl=kubectl)
+    assert helper.is_pod_ready("nexus-0", "nexus")
+    assert not helper.is_pod_ready("saknas", "nexus")
+    assert calls()[0] == "--context=kind-nexus-cluster get pod nexus-0 -n nexus -o json"
+
+
+@pytest.mark.unit
+def test_wait_until_ready_uses_one_watch_stream(fake_kubectl):
+    """Test that wait_until_ready follows watch events until every pod is Ready"""
+    kubectl, state, save, calls = fake_kubectl
+    state["watch"] = [
+        {"type": "ADDED", "object": pod("api-1", "nexus-api", False)},
+        {"type": "ADDED", "object": pod("api-2", "nexus-api", True)},
+        {"type": "DELETED", "object": pod("api-2", "nexus-api", True)},
+        {"type": "MODIFIED", "object": pod("api-1", "nexus-api", True)},
+    ]
+    save()
+    helper = K8sHelper(snapshot=True, kubectl=kubectl)
+    helper.snapshot()
+
+    assert helper.wait_until_ready("nexus-api", timeout=10)
+    assert helper._snapshot is None
+    watch_calls = [call for call in calls() if "--watch" in call]
+    assert watch_calls == ["--context=kind-nexus-cluster get pods -n nexus-api --watch --output-watch-events -o json"]
+
+    state["watch"] = [{"type": "ADDED", "object": pod("api-1", "nexus-api", False)}]
+    save()
+    assert not helper.wait_until_ready("nexus-api", timeout=0.5)
+
+
+@pytest.mark.unit
+def test_wait_until_ready_expects_every_listed_pod(fake_kubectl):
+    """Test that the first Ready pod in the watch does not end the wait while others are not Ready"""
+    kubectl, state, save, calls = fake_kubectl
+    state["pods"] += [pod("api-2", "nexus-api", False)]
+    state["watch"] = [{"type": "ADDED", "object": pod("api-2", "nexus-api", True)}]
+    save()
+    helper = K8sHelper(kubectl=kubectl)
+    assert not helper.wait_until_ready("nexus-api", timeout=1)
+    assert calls()[0] == "--context=kind-nexus-cluster get pods -n nexus-api -o json"
+
+    # Redan Ready i listningen - ingen watch behövs
+    state["pods"] = [pod("api-1", "nexus-api", True), pod("api-2", "nexus-api", True)]
+    save()
+    assert helper.wait_until_ready("nexus-api", timeout=1)
+    assert not [call for call in calls() if "--watch" in call][1:]
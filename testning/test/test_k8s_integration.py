@@ -8,6 +8,7 @@ from support.k8s_support import (
     test_api_pod_running,
     test_kong_pod_running,
     test_services_available,
+    test_services_reachable_directly,
     test_pod_health
 )
 
@@ -49,6 +50,13 @@ def test_k8s_services_available(k8s_helper):
 
 @pytest.mark.k8s
 @pytest.mark.integration
-def test_k8s_pod_health(k8s_helper):
-    """Test that pods are healthy"""
-    test_pod_health(k8s_helper)
+def test_k8s_pod_health(k8s_snapshot):
+    """Test that pods are healthy (listing and readiness from one kubectl call)"""
+    test_pod_health(k8s_snapshot)
+
+
+@pytest.mark.k8s
+@pytest.mark.integration
+def test_k8s_services_reachable_directly(port_forward_pool):
+    """Test that services answer through pooled port-forwards"""
+    test_services_reachable_directly(port_forward_pool)
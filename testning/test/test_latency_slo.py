@@ -0,0 +1,97 @@
+"""
+Tester för latency_budget-pluginet (körs utan testmiljö)
+"""
+import textwrap
+
+import pytest
+
+from support.api_client import RequestTiming
+from support.latency_slo import (LatencyBudget, LatencyRecorder, evaluate_budgets, render_html,
+                                 summarize_distribution)
+
+pytest_plugins = ["pytester"]
+
+
+def timing(endpoint: str, elapsed_ms: float, method: str = "GET") -> RequestTiming:
+    return RequestTiming(method, endpoint, 200, elapsed_ms / 1000, 1)
+
+
+@pytest.mark.unit
+def test_budget_matches_normalized_paths_and_method():
+    """Test that query strings and leading slashes do not affect matching"""
+    budget = LatencyBudget(100, "/packages/*", "GET")
+    assert budget.matches(timing("packages/requests?limit=5", 1))
+    assert not budget.matches(timing("/packages/requests", 1, method="POST"))
+    assert not budget.matches(timing("/stats", 1))
+    assert LatencyBudget(100).matches(timing("/anything", 1, method="DELETE"))
+
+
+@pytest.mark.unit
+def test_evaluate_budgets_uses_p95_and_scale():
+    """Test that one slow outlier in twenty requests stays under p95"""
+    timings = [timing("/health", 10) for _ in range(19)] + [timing("/health", 900)]
+    [result] = evaluate_budgets([LatencyBudget(50, "/health")], timings)
+    assert (result.requests, result.p95_ms, result.ok) == (20, 10.0, True)
+
+    timings.append(timing("/health", 900))
+    [result] = evaluate_budgets([LatencyBudget(50, "/health")], timings)
+    assert not result.ok
+    [result] = evaluate_budgets([LatencyBudget(50, "/health")], timings, scale=20)
+    assert result.limit_ms == 1000 and result.ok
+
+    [result] = evaluate_budgets([LatencyBudget(50, "/helth")], timings)
+    assert result.p95_ms is None and not result.ok
+
+
+@pytest.mark.unit
+def test_distribution_summary_and_html():
+    """Test the histogram buckets and that the report escapes endpoint names"""
+    recorder = LatencyRecorder()
+    for elapsed in (1, 4, 30, 3000):
+        recorder(timing("/packages/<x>", elapsed))
+    distributions = {key: summarize_distribution(values) for key, values in recorder.distributions().items()}
+    summary = distributions["GET /packages/<x>"]
+    assert summary["requests"] == 4
+    assert summary["histogram"] == [2, 0, 0, 1, 0, 0, 0, 0, 0, 1]
+    assert summary["max"] == 3000.0
+
+    html = render_html(distributions, evaluate_budgets([LatencyBudget(10)], recorder.timings))
+    assert "GET /packages/&lt;x&gt;" in html
+    assert "❌" in html
+
+
+@pytest.mark.unit
+def test_plugin_fails_tests_over_budget(pytester, monkeypatch):
+    """Test the marker end to end against a client whose latency is controlled"""
+    monkeypatch.setenv("LATENCY_REPORT", "results/latency.json")
+    monkeypatch.delenv("LATENCY_BUDGET_SCALE", raising=False)
+    pytester.makepyfile(textwrap.dedent("""
+        import pytest
+        from support.api_client import RequestTiming, notify_timing
+
+        def request(endpoint, ms):
+            notify_timing(RequestTiming("GET", endpoint, 200, ms / 1000, 1))
+
+        @pytest.mark.latency_budget("/health", p95_ms=50)
+        def test_fast():
+            for _ in range(10):
+                request("/health", 5)
+
+        @pytest.mark.latency_budget("/health", p95_ms=50)
+        def test_slow():
+            request("/health", 80)
+
+        @pytest.mark.latency_budget("/helth", p95_ms=50)
+        def test_typo():
+            request("/health", 5)
+
+        def test_unbudgeted():
+            request("/stats", 500)
+    """))
+    result = pytester.runpytest("-p", "support.latency_slo")
+    result.assert_outcomes(passed=2, failed=2)
+    result.stdout.fnmatch_lines([
+        "latency_budget * /health: p95 80.0 ms > 50 ms (1 requests)",
+        "latency_budget * /helth: inga requests matchade",
+    ])
+    assert pytester.path.joinpath("results", "latency.json").exists()
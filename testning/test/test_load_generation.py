@@ -0,0 +1,79 @@
+"""
+Load Generation Tests - Testar lastgeneratorn och kör en kort last mot API:t
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from support.load_generator import LoadConfig, asgi_client, http_client, percentile, run_load, write_results
+
+
+def make_stalling_app(stall_seconds: float):
+    """Minimal ASGI-app där första requesten blockerar servern en stund"""
+    state = {"calls": 0}
+    lock = asyncio.Lock()
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        # En request i taget, som en överbelastad worker
+        async with lock:
+            state["calls"] += 1
+            if state["calls"] == 1:
+                await asyncio.sleep(stall_seconds)
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": b"[]"})
+
+    return app
+
+
+@pytest.mark.load
+def test_percentile_nearest_rank():
+    """Test nearest-rank percentiles"""
+    values = [float(i) for i in range(1, 1001)]
+    assert percentile(values, 50) == 500.0
+    assert percentile(values, 99) == 990.0
+    assert percentile(values, 99.9) == 999.0
+    assert percentile([], 99) == 0.0
+
+
+@pytest.mark.load
+async def test_latency_is_corrected_for_coordinated_omission():
+    """Test that requests queued behind a stall are charged for the wait"""
+    config = LoadConfig(rate=50, duration=1.0, max_in_flight=1, mix="list=1")
+    async with asgi_client(make_stalling_app(0.3)) as client:
+        result = await run_load(client, config)
+    report = result.report()
+
+    assert report["requests"] == 50
+    assert report["errors"] == 0
+    # Servicetiden är kort för nästan alla, men de köade requests väntade på stallet
+    assert report["service_time_ms"]["p50"] < 50
+    assert report["latency_ms"]["p95"] > 100
+    assert report["latency_ms"]["max"] >= 300
+
+
+@pytest.mark.api
+@pytest.mark.load
+async def test_short_load_against_api(api_base_url, tmp_path):
+    """Test a short, light load against the live API and write the JSON report"""
+    config = LoadConfig(rate=20, duration=3.0, max_in_flight=16)
+    async with http_client(api_base_url, max_connections=16) as client:
+        try:
+            await client.get("/health", timeout=3)
+        except httpx.HTTPError:
+            pytest.skip("API:t är inte tillgängligt")
+        result = await run_load(client, config, target=api_base_url)
+    report = result.report()
+
+    assert report["requests"] == 60
+    assert report["error_rate"] == 0
+    assert set(report["operations"]) <= {"list", "get", "upload", "stats", "search"}
+
+    path = write_results(report, str(tmp_path / "load.json"))
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["latency_ms"]["p99.9"] >= saved["latency_ms"]["p50"]
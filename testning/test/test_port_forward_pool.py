@@ -0,0 +1,79 @@
+"""
+Port-Forward Pool Tests - Testar återanvändning och omstart mot en fejkad kubectl
+"""
+import sys
+import textwrap
+
+import pytest
+
+from support.k8s_helper import K8sHelper
+from support.port_forward_pool import PortForwardError, PortForwardPool
+
+# Fejkad kubectl: "port-forward -n NS svc/NAME LOKAL:REMOTE" lyssnar på den lokala porten
+FAKE_KUBECTL = textwrap.dedent('''\
+    #!{python}
+    import socket, sys
+    args = sys.argv[1:]
+    with open({calls!r}, "a") as f:
+        f.write(" ".join(args) + "\\n")
+    if args[1] != "port-forward" or args[4] == "svc/saknas":
+        sys.exit(1)
+    local_port = int(args[5].split(":")[0])
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", local_port))
+    server.listen()
+    while True:
+        server.accept()[0].close()
+''')
+
+
+@pytest.fixture
+def pool(tmp_path):
+    script, calls_path = tmp_path / "kubectl", tmp_path / "calls.log"
+    script.write_text(FAKE_KUBECTL.format(python=sys.executable, calls=str(calls_path)))
+    script.chmod(0o755)
+    pool = PortForwardPool(K8sHelper(kubectl=str(script)), start_timeout=5)
+    pool.calls = lambda: calls_path.read_text().splitlines() if calls_path.exists() else []
+    yield pool
+    pool.close()
+
+
+@pytest.mark.unit
+def test_forwards_are_reused_per_key(pool):
+    """Test that the same (service, namespace, port) reuses one kubectl process"""
+    first = pool.get("nexus-api-service", "nexus-api", 3000)
+    again = pool.get("nexus-api-service", "nexus-api", 3000)
+    other = pool.get("nexus", "nexus", 8081)
+
+    assert again is first
+    assert other.local_port != first.local_port
+    assert first.url == f"http://127.0.0.1:{first.local_port}"
+    assert pool.stats == {"started": 2, "reused": 1, "restarted": 0}
+    assert len(pool.calls()) == 2
+
+
+@pytest.mark.unit
+def test_dead_forward_is_restarted_on_same_port(pool):
+    """Test that a forward whose process died is restarted transparently"""
+    forward = pool.get("kong-proxy", "kong", 80)
+    forward.process.kill()
+    forward.process.wait()
+
+    restarted = pool.get("kong-proxy", "kong", 80)
+    assert restarted.process.pid != forward.process.pid
+    assert restarted.local_port == forward.local_port
+    assert restarted.healthy()
+    assert pool.stats["restarted"] == 1
+
+
+@pytest.mark.unit
+def test_close_terminates_everything_and_start_errors_are_raised(pool):
+    """Test cleanup at session end and a clear error when kubectl fails"""
+    forwards = [pool.get("nexus", "nexus", 8081), pool.get("kong-proxy", "kong", 80)]
+    pool.close()
+    assert all(forward.process.poll() is not None for forward in forwards)
+    assert pool.forwards == {}
+
+    with pytest.raises(PortForwardError):
+        pool.get("saknas", "nexus", 1234)
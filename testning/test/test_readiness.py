@@ -0,0 +1,60 @@
+"""
+Readiness Tests - Testar den parallella readiness-probern
+"""
+import random
+import time
+
+import httpx
+import pytest
+
+from support.readiness import BackoffPolicy, ServiceCheck, readiness_report, wait_until_ready
+
+
+def make_transport(ready_after: dict):
+    """Fejkade tjänster: host -> antal misslyckade försök innan de svarar 200 (None = aldrig)"""
+    calls = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        calls[host] = calls.get(host, 0) + 1
+        limit = ready_after[host]
+        if limit is None or calls[host] <= limit:
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(200)
+
+    return httpx.MockTransport(handler), calls
+
+
+@pytest.mark.unit
+def test_backoff_is_exponential_with_jitter():
+    """Test that delays stay within the exponentially growing, capped window"""
+    policy = BackoffPolicy(initial=0.1, factor=2, max_delay=1.0, rng=random.Random(1))
+    for attempt, cap in [(0, 0.1), (1, 0.2), (3, 0.8), (6, 1.0)]:
+        delays = [policy.delay(attempt) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+        assert len(set(delays)) > 1
+
+
+@pytest.mark.unit
+async def test_services_are_probed_concurrently():
+    """Test that each service returns as soon as it is ready and a dead one times out"""
+    transport, calls = make_transport({"api": 0, "kong": 3, "nexus": None})
+    checks = [ServiceCheck("FastAPI", "http://api/api"), ServiceCheck("Kong Gateway", "http://kong/"),
+              ServiceCheck("Nexus", "http://nexus/nexus")]
+    policy = BackoffPolicy(initial=0.02, max_delay=0.05, rng=random.Random(7))
+
+    start = time.monotonic()
+    results = await wait_until_ready(checks, timeout=0.5, backoff=policy, transport=transport)
+    elapsed = time.monotonic() - start
+
+    api, kong, nexus = results
+    assert api.ready and api.attempts == 1 and api.time_to_ready < 0.1
+    assert kong.ready and kong.attempts == 4 and kong.status == 200
+    assert not nexus.ready and nexus.time_to_ready is None and "ConnectError" in nexus.error
+    # Alla tre pollas parallellt - totaltiden styrs av tidsgränsen, inte summan
+    assert elapsed < 0.8
+    assert calls["nexus"] > 3
+
+    report = readiness_report(results, elapsed)
+    assert report["all_ready"] is False
+    assert [s["name"] for s in report["services"]] == ["FastAPI", "Kong Gateway", "Nexus"]